@@ -0,0 +1,280 @@
+"""
+CAO-AUD-001: What-if Simulator
+Replays candidate scoring configs over a local snapshot of agent_sessions
+and agent_pause_rules, with no writes, and reports how pass / warn / fail /
+escalate / pause / disable counts would change per agent against the
+config the snapshot was taken under.
+
+1. export (once, needs BigQuery): sessions go to sessions.npz as columnar
+   arrays; pause rules, SCORING_WEIGHTS, LATENCY_THRESHOLDS,
+   ESCALATION_TRIGGERS and agent baselines go to config.json.
+2. replay (offline, NumPy only): scoring runs through batch_scoring and
+   rules through CompiledRules.triggered_matrix, so millions of sessions
+   replay in seconds. Random LLM sampling uses one seeded draw per session
+   shared by both configs, so deltas come from the config alone.
+
+Usage:
+    python audit_simulator.py export snapshot/ --since 2025-01-01
+    python audit_simulator.py replay snapshot/ candidate.json --output whatif.json
+
+A candidate is JSON overriding parts of the snapshot config:
+    {"weights": {"latency": 20, "format": 5},
+     "latency_thresholds": {"slow": 8000},
+     "escalation_triggers": {"score_drop": 10},
+     "rule_overrides": {"RULE-001": {"threshold_value": 55}, "RULE-007": {"enabled": false}},
+     "rules": [...]}             # replaces the rule list outright
+"""
+
+import argparse
+import copy
+import json
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from batch_scoring import METRIC_COLUMNS, calculate_scores_batch, error_rates
+from rule_engine import CompiledRules
+
+logger = logging.getLogger("CAO-AUD-001")
+
+SESSIONS_FILE = "sessions.npz"
+CONFIG_FILE = "config.json"
+DEFAULT_BASELINE = 85       # should_escalate_to_llm's default for unknown agents
+RULE_CHUNK = 250_000        # sessions per rule-matrix block
+
+OUTCOMES = ["passed", "warning", "failed", "escalated", "paused", "disabled"]
+
+
+# Export
+
+def export_snapshot(out_dir: str, since: Optional[datetime] = None, limit: Optional[int] = None) -> Dict:
+    """Write sessions.npz and config.json for offline replay."""
+    from python_auditor import (
+        DATASET, ESCALATION_TRIGGERS, LATENCY_THRESHOLDS, PROJECT_ID, SCORING_WEIGHTS, PythonAuditor,
+    )
+    from google.cloud import bigquery
+
+    auditor = PythonAuditor()
+    where = "ended_at IS NOT NULL" + (" AND ended_at >= @since" if since else "")
+    query = f"""
+    SELECT session_id, agent_id, {", ".join(METRIC_COLUMNS[:6])}, data_sources_accessed, ended_at
+    FROM `{PROJECT_ID}.{DATASET}.agent_sessions`
+    WHERE {where}
+    ORDER BY ended_at ASC
+    {f"LIMIT {int(limit)}" if limit else ""}
+    """
+    params = [bigquery.ScalarQueryParameter("since", "TIMESTAMP", since)] if since else []
+    rows = auditor.client.query(query, job_config=bigquery.QueryJobConfig(query_parameters=params)).result()
+
+    agents: Dict[str, int] = {}
+    data: Dict[str, List] = {name: [] for name in METRIC_COLUMNS[:7] + ["agent_code", "session_id", "ended_at"]}
+    for row in rows:
+        for name in METRIC_COLUMNS[:6]:
+            data[name].append(row[name] or 0)
+        data["has_citations"].append(bool(row["data_sources_accessed"]))
+        data["agent_code"].append(agents.setdefault(row["agent_id"], len(agents)))
+        data["session_id"].append(row["session_id"])
+        data["ended_at"].append(row["ended_at"].timestamp())
+
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(
+        out / SESSIONS_FILE,
+        **{name: np.asarray(data[name], dtype=np.float64) for name in METRIC_COLUMNS[:6]},
+        has_citations=np.asarray(data["has_citations"], dtype=bool),
+        format_valid=np.ones(len(data["agent_code"]), dtype=bool),
+        agent_code=np.asarray(data["agent_code"], dtype=np.int32),
+        agents=np.asarray(list(agents), dtype=str),
+        session_id=np.asarray(data["session_id"], dtype=str),
+        ended_at=np.asarray(data["ended_at"], dtype=np.float64),
+    )
+    config = {
+        "weights": SCORING_WEIGHTS,
+        "latency_thresholds": LATENCY_THRESHOLDS,
+        "escalation_triggers": ESCALATION_TRIGGERS,
+        "rules": auditor.pause_rules,
+        "baselines": auditor.baselines.as_dict(),
+        "exported_sessions": len(data["agent_code"]),
+    }
+    with open(out / CONFIG_FILE, "w") as f:
+        json.dump(config, f, indent=2, default=str)
+    logger.info(f"Exported {config['exported_sessions']} sessions and {len(config['rules'])} rules to {out}")
+    return config
+
+
+def load_snapshot(snapshot_dir: str):
+    path = Path(snapshot_dir)
+    with np.load(path / SESSIONS_FILE) as npz:
+        columns = {name: npz[name] for name in npz.files}
+    with open(path / CONFIG_FILE) as f:
+        config = json.load(f)
+    return columns, config
+
+
+def apply_candidate(base: Dict, candidate: Dict) -> Dict:
+    """The snapshot config with a candidate's overrides applied."""
+    config = copy.deepcopy(base)
+    for key in ("weights", "latency_thresholds", "escalation_triggers"):
+        config[key].update(candidate.get(key, {}))
+    if "rules" in candidate:
+        config["rules"] = candidate["rules"]
+    overrides = candidate.get("rule_overrides", {})
+    rules = []
+    for rule in config["rules"]:
+        rule = {**rule, **overrides.get(rule.get("rule_id"), {})}
+        if rule.get("enabled", True):
+            rules.append(rule)
+    config["rules"] = rules
+    return config
+
+
+# Replay
+
+def replay(columns: Dict[str, np.ndarray], config: Dict,
+           sample_draws: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-session status codes (index into OUTCOMES) plus paused / disabled
+    flags under one config, mirroring PythonAuditor.evaluate_session: score
+    bands, then pause / disable rules in priority order (nothing after a
+    disable), then LLM escalation, which overrides the status.
+    """
+    n = len(columns["agent_code"])
+    scores = calculate_scores_batch(columns, config["weights"], config["latency_thresholds"])
+    truth = scores["truth_score"]
+
+    status = np.full(n, OUTCOMES.index("failed"), dtype=np.int8)
+    status[truth >= 60] = OUTCOMES.index("warning")
+    status[truth >= 80] = OUTCOMES.index("passed")
+
+    compiled = CompiledRules(config["rules"])
+    actions = np.array([rule.get("action") for rule in compiled.rules], dtype=object)
+    is_disable = actions == "disable"
+    is_pause = actions == "pause"
+    paused = np.zeros(n, dtype=bool)
+    disabled = np.zeros(n, dtype=bool)
+    if len(compiled):
+        rates = error_rates(columns)
+        for start in range(0, n, RULE_CHUNK):
+            block = slice(start, start + RULE_CHUNK)
+            matrix = compiled.triggered_matrix({
+                "truth_score": truth[block],
+                "accuracy_score": scores["accuracy_score"][block],
+                "error_rate": rates[block],
+                "latency_ms": columns["avg_response_time_ms"][block],
+            })
+            hit_disable = matrix & is_disable
+            any_disable = hit_disable.any(axis=1)
+            first_disable = np.where(any_disable, hit_disable.argmax(axis=1), matrix.shape[1])
+            before_disable = np.arange(matrix.shape[1])[None, :] < first_disable[:, None]
+            disabled[block] = any_disable
+            paused[block] = (matrix & is_pause & before_disable).any(axis=1)
+    status[paused | disabled] = OUTCOMES.index("failed")
+
+    triggers = config["escalation_triggers"]
+    agents = [str(a) for a in columns["agents"]]
+    baselines = np.array([config.get("baselines", {}).get(a, DEFAULT_BASELINE) for a in agents], dtype=np.float64)
+    baseline = baselines[columns["agent_code"]] if len(agents) else np.zeros(n)
+    escalate = (
+        (columns["message_count"] > triggers["session_length"])
+        | (baseline - truth > triggers["score_drop"])
+        | (sample_draws < triggers["random_sample_rate"])
+    )
+    status[escalate] = OUTCOMES.index("escalated")
+    return status, paused, disabled
+
+
+def outcome_counts(columns: Dict[str, np.ndarray], status: np.ndarray, paused: np.ndarray,
+                   disabled: np.ndarray) -> np.ndarray:
+    """(agents x OUTCOMES) count matrix; paused/disabled count sessions that would pause/disable."""
+    n_agents = len(columns["agents"])
+    codes = columns["agent_code"]
+    counts = np.zeros((n_agents, len(OUTCOMES)), dtype=np.int64)
+    for i in range(4):
+        counts[:, i] = np.bincount(codes[status == i], minlength=n_agents)
+    counts[:, 4] = np.bincount(codes[paused], minlength=n_agents)
+    counts[:, 5] = np.bincount(codes[disabled], minlength=n_agents)
+    return counts
+
+
+def compare(snapshot_dir: str, candidate: Dict, seed: int = 0) -> Dict:
+    """Replay the snapshot's own config and the candidate; per-agent and total deltas."""
+    columns, base = load_snapshot(snapshot_dir)
+    started = time.perf_counter()
+    draws = np.random.default_rng(seed).random(len(columns["agent_code"]))
+    current = outcome_counts(columns, *replay(columns, base, draws))
+    proposed = outcome_counts(columns, *replay(columns, apply_candidate(base, candidate), draws))
+    elapsed = time.perf_counter() - started
+
+    def row(counts: np.ndarray) -> Dict[str, int]:
+        return {outcome: int(value) for outcome, value in zip(OUTCOMES, counts)}
+
+    agents = [str(a) for a in columns["agents"]]
+    return {
+        "sessions": int(len(columns["agent_code"])),
+        "replay_seconds": round(elapsed, 3),
+        "totals": {
+            "current": row(current.sum(axis=0)),
+            "candidate": row(proposed.sum(axis=0)),
+            "delta": row(proposed.sum(axis=0) - current.sum(axis=0)),
+        },
+        "by_agent": {
+            agent: {"current": row(current[i]), "candidate": row(proposed[i]), "delta": row(proposed[i] - current[i])}
+            for i, agent in enumerate(agents)
+            if (proposed[i] != current[i]).any()
+        },
+    }
+
+
+def print_report(report: Dict, top: int = 20):
+    print("\n" + "=" * 90)
+    print(f"WHAT-IF REPLAY - {report['sessions']:,} sessions in {report['replay_seconds']}s")
+    print("=" * 90)
+    print(f"{'':<24}" + "".join(f"{o:>11}" for o in OUTCOMES))
+    for label in ("current", "candidate", "delta"):
+        values = report["totals"][label]
+        sign = "+" if label == "delta" else ""
+        print(f"{label:<24}" + "".join(f"{values[o]:>{sign}11,}" for o in OUTCOMES))
+
+    changed = sorted(report["by_agent"].items(), key=lambda kv: -sum(abs(v) for v in kv[1]["delta"].values()))
+    print(f"\nAGENTS WITH CHANGES ({len(changed)}, showing delta):")
+    for agent, entry in changed[:top]:
+        print(f"{agent[:24]:<24}" + "".join(f"{entry['delta'][o]:>+11,}" for o in OUTCOMES))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CAO-AUD-001: what-if simulator for scoring and pause rules")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export = sub.add_parser("export", help="Snapshot agent_sessions and pause rules to local files")
+    export.add_argument("out_dir")
+    export.add_argument("--since", type=datetime.fromisoformat,
+                        help="Only sessions ended at or after this ISO timestamp (UTC)")
+    export.add_argument("--limit", type=int)
+
+    run = sub.add_parser("replay", help="Replay a candidate config over a snapshot")
+    run.add_argument("snapshot_dir")
+    run.add_argument("candidate", help="Candidate config overrides (JSON file)")
+    run.add_argument("--seed", type=int, default=0, help="Seed for the random LLM sampling draws")
+    run.add_argument("--top", type=int, default=20, help="Agents to list")
+    run.add_argument("--output", help="Write the full report as JSON")
+
+    args = parser.parse_args()
+    if args.command == "export":
+        export_snapshot(args.out_dir, args.since, args.limit)
+        return
+
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+    report = compare(args.snapshot_dir, candidate, args.seed)
+    print_report(report, args.top)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
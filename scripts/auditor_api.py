@@ -8,8 +8,10 @@ from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel
 from typing import Optional, List
 import json
+from dataclasses import asdict
 
 from python_auditor import PythonAuditor, AuditResult, AuditStatus
+from session_store import LeaseLost
 
 router = APIRouter(prefix="/api/audit", tags=["audit"])
 
@@ -31,6 +33,8 @@ class AuditSessionRequest(BaseModel):
 
 class AuditBatchRequest(BaseModel):
     limit: int = 100
+    bulk: bool = True
+    workers: int = 8
 
 
 class AuditResponse(BaseModel):
@@ -67,6 +71,8 @@ async def audit_health():
             "auditor_id": "CAO-AUD-001",
             "rules_loaded": len(auditor.pause_rules),
             "baselines_loaded": len(auditor.agent_baselines),
+            **auditor.cache_status(),
+            "last_batch": asdict(auditor.last_batch) if auditor.last_batch else None,
         }
     except Exception as e:
         raise HTTPException(status_code=503, detail=str(e))
@@ -81,7 +87,11 @@ async def audit_session(request: AuditSessionRequest):
     if not session:
         raise HTTPException(status_code=404, detail=f"Session {request.session_id} not found")
 
-    result = auditor.audit_session(session)
+    try:
+        result = auditor.audit_session(session)
+    except LeaseLost:
+        raise HTTPException(status_code=409,
+                            detail=f"Session {request.session_id} is already audited or being audited")
 
     return AuditResponse(
         session_id=result.session_id,
@@ -99,7 +109,7 @@ async def audit_batch(request: AuditBatchRequest):
     """Audit all pending sessions."""
     auditor = get_auditor()
 
-    results = auditor.run_batch(request.limit)
+    results = auditor.run_batch(request.limit, request.bulk, request.workers)
 
     responses = [
         AuditResponse(
@@ -132,7 +142,7 @@ async def audit_batch_background(
     """Run batch audit in background."""
     auditor = get_auditor()
 
-    background_tasks.add_task(auditor.run_batch, request.limit)
+    background_tasks.add_task(auditor.run_batch, request.limit, request.bulk, request.workers)
 
     return {"status": "started", "message": f"Auditing up to {request.limit} sessions in background"}
 
@@ -148,6 +158,15 @@ async def get_pause_rules():
     )
 
 
+@router.post("/rules/refresh")
+async def refresh_pause_rules():
+    """Reload pause rules now instead of waiting for the TTL."""
+    auditor = get_auditor()
+    started = auditor.refresh_rules()
+
+    return {"status": "refreshing" if started else "already_refreshing", **auditor.cache_status()}
+
+
 @router.get("/pending")
 async def get_pending_sessions(limit: int = 20):
     """Get sessions pending audit."""
@@ -245,7 +264,9 @@ async def on_session_complete(session_id: str):
     session = auditor.get_session(session_id)
 
     if session:
-        result = auditor.audit_session(session)
-        return result
+        try:
+            return auditor.audit_session(session)
+        except LeaseLost:
+            return None  # a batch worker already has it
 
     return None
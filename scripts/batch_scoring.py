@@ -0,0 +1,134 @@
+"""
+CAO-AUD-001: Batch Scoring
+Vectorized version of PythonAuditor.calculate_scores. Takes columnar session
+metrics (one NumPy array per field) and computes every component score and
+the weighted truth score for all sessions at once.
+
+Results match the scalar path exactly: each array operation is the same
+IEEE operation, in the same order, as the scalar code, and values that land
+on a rounding half-way point are re-rounded with Python's round().
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+# Component score per latency band, in LATENCY_THRESHOLDS order; slower is 25
+LATENCY_BANDS = [("excellent", 100), ("good", 90), ("acceptable", 75), ("slow", 50)]
+LATENCY_FLOOR = 25
+
+METRIC_COLUMNS = [
+    "message_count", "user_messages", "agent_messages", "errors_count",
+    "retries_count", "avg_response_time_ms", "has_citations", "format_valid",
+]
+SCORE_COLUMNS = [
+    "truth_score", "accuracy_score", "completeness_score", "latency_score",
+    "error_rate_score", "citation_score", "format_score",
+]
+
+
+def columns_from_metrics(metrics: List) -> Dict[str, np.ndarray]:
+    """Columnar arrays from a list of SessionMetrics."""
+    n = len(metrics)
+    columns = {}
+    for name in METRIC_COLUMNS:
+        dtype = bool if name in ("has_citations", "format_valid") else np.float64
+        columns[name] = np.fromiter((getattr(m, name) for m in metrics), dtype=dtype, count=n)
+    return columns
+
+
+def columns_from_sessions(sessions: List[Dict]) -> Dict[str, np.ndarray]:
+    """Columnar arrays straight from agent_sessions rows (same defaults as extract_metrics)."""
+    n = len(sessions)
+    columns = {
+        name: np.fromiter((s.get(name, 0) or 0 for s in sessions), dtype=np.float64, count=n)
+        for name in METRIC_COLUMNS[:6]
+    }
+    columns["has_citations"] = np.fromiter((bool(s.get("data_sources_accessed")) for s in sessions), dtype=bool, count=n)
+    columns["format_valid"] = np.ones(n, dtype=bool)
+    return columns
+
+
+def round2(values: np.ndarray) -> np.ndarray:
+    """
+    round(x, 2) for every element. np.round scales by 100 first, which can
+    land on the other side of a half-way point, so near-half elements are
+    redone with Python's correctly rounded round().
+    """
+    rounded = np.round(values, 2)
+    scaled = values * 100
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_half):
+        rounded[i] = round(float(values[i]), 2)
+    return rounded
+
+
+def calculate_scores_batch(columns: Dict[str, np.ndarray], weights: Dict[str, float],
+                           latency_thresholds: Dict[str, float],
+                           rounded: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Component and truth scores for every session in `columns`.
+
+    `weights` and `latency_thresholds` take the shape of SCORING_WEIGHTS and
+    LATENCY_THRESHOLDS. Returns one float64 array per SCORE_COLUMNS entry.
+    """
+    message_count = columns["message_count"]
+    user_messages = columns["user_messages"]
+    has_messages = message_count > 0
+
+    # Accuracy score (based on error rate and retries)
+    error_rate = error_rates(columns)
+    retry_rate = np.where(has_messages, columns["retries_count"] / np.where(has_messages, message_count, 1), 0.0)
+    accuracy = np.maximum(0.0, 100 - (error_rate * 200) - (retry_rate * 50))
+
+    # Completeness score (based on response ratio)
+    has_users = user_messages > 0
+    response_ratio = columns["agent_messages"] / np.where(has_users, user_messages, 1)
+    completeness = np.where(has_users, np.minimum(100.0, response_ratio * 100), 100.0)
+
+    # Latency score
+    latency = columns["avg_response_time_ms"]
+    latency_score = np.select(
+        [latency <= latency_thresholds[band] for band, _ in LATENCY_BANDS],
+        [float(score) for _, score in LATENCY_BANDS],
+        default=float(LATENCY_FLOOR),
+    )
+
+    error_rate_score = np.maximum(0.0, 100 - (error_rate * 500))
+    citation = np.where(columns["has_citations"], 100.0, 50.0)
+    format_score = np.where(columns["format_valid"], 100.0, 60.0)
+
+    # Weighted truth score, summed in the scalar path's order
+    truth = (
+        (accuracy * weights["accuracy"] / 100) +
+        (completeness * weights["completeness"] / 100) +
+        (latency_score * weights["latency"] / 100) +
+        (error_rate_score * weights["error_rate"] / 100) +
+        (citation * weights["citation"] / 100) +
+        (format_score * weights["format"] / 100)
+    )
+
+    scores = {
+        "truth_score": truth,
+        "accuracy_score": accuracy,
+        "completeness_score": completeness,
+        "latency_score": latency_score,
+        "error_rate_score": error_rate_score,
+        "citation_score": citation,
+        "format_score": format_score,
+    }
+    if rounded:
+        scores = {name: round2(values) for name, values in scores.items()}
+    return scores
+
+
+def error_rates(columns: Dict[str, np.ndarray]) -> np.ndarray:
+    """errors_count / message_count, 0 for empty sessions (the rule-check error_rate)."""
+    message_count = columns["message_count"]
+    has_messages = message_count > 0
+    return np.where(has_messages, columns["errors_count"] / np.where(has_messages, message_count, 1), 0.0)
+
+
+def score_rows(scores: Dict[str, np.ndarray]) -> List[Dict[str, float]]:
+    """Per-session score dicts with the AuditScore fields."""
+    return [dict(zip(SCORE_COLUMNS, values)) for values in zip(*(scores[name].tolist() for name in SCORE_COLUMNS))]
@@ -0,0 +1,286 @@
+"""
+GC Resolver - maps sender emails to GC companies (no LLM)
+Loads the consolidated GC contact list and the HubSpot contact export into
+in-memory indexes so scanners can fill gc_name per event.
+"""
+
+import csv
+import logging
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from email.utils import parseaddr
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+GC_CONTACTS_CSV = os.getenv("GC_CONTACTS_CSV", str(REPO_ROOT / "gc_names_consolidated_with_enrichment.csv"))
+HUBSPOT_CONTACTS_CSV = os.getenv("HUBSPOT_CONTACTS_CSV", str(REPO_ROOT / "hubspot_contacts_export_v2.csv"))
+
+# Shared mailbox providers - a domain match here says nothing about the company
+FREE_MAIL_DOMAINS = {
+    "gmail.com", "googlemail.com", "yahoo.com", "aol.com", "hotmail.com", "outlook.com",
+    "live.com", "msn.com", "icloud.com", "me.com", "verizon.net", "optonline.net",
+    "comcast.net", "att.net", "optimum.net",
+}
+
+# Our own mail - internal and forwarded emails never identify the GC
+OWN_DOMAINS = {"masterroofingus.com"}
+
+# Tools that send on a company's behalf; the export ties them to whichever
+# contact happened to use them (hubspot.com -> one GC)
+PLATFORM_DOMAINS = {
+    "hubspot.com", "hubspotemail.net", "procore.com", "buildingconnected.com",
+    "docusign.net", "dropbox.com", "sharepoint.com", "etrackcoi.com",
+}
+
+# Senders at these domains are never looked up, not even by exact address
+UNRESOLVABLE_DOMAINS = OWN_DOMAINS | PLATFORM_DOMAINS
+
+# Which lookup answered match()
+MATCH_EMAIL = "email"
+MATCH_DOMAIN = "domain"
+
+# Words that carry no signal when comparing company names
+NAME_STOPWORDS = {"llc", "inc", "corp", "co", "ltd", "the", "group", "company"}
+
+FUZZY_MIN_SIMILARITY = 0.45   # Jaccard over trigrams
+RELOAD_CHECK_SECONDS = 30     # How often to stat the source files
+
+
+def normalize_company(name: str) -> str:
+    """Lowercase, strip punctuation and legal suffixes: 'B Management, LLC' -> 'b management'."""
+    tokens = re.findall(r"[a-z0-9]+", (name or "").lower())
+    return " ".join(t for t in tokens if t not in NAME_STOPWORDS)
+
+
+def trigrams(text: str) -> set:
+    """Character trigrams of a name with spaces removed ('leaditbuilders' ~ 'lead it builders')."""
+    compact = re.sub(r"[^a-z0-9]", "", text.lower())
+    if len(compact) < 3:
+        return {compact} if compact else set()
+    return {compact[i:i + 3] for i in range(len(compact) - 2)}
+
+
+def split_email(from_email: str) -> Tuple[str, str]:
+    """'Jane <Jane@ABC.com>' -> ('jane@abc.com', 'abc.com')."""
+    _, addr = parseaddr(from_email or "")
+    addr = addr.strip().lower()
+    domain = addr.rsplit("@", 1)[1] if "@" in addr else ""
+    return addr, domain
+
+
+class GCIndex:
+    """Immutable lookup tables built from one load of the source files."""
+
+    def __init__(self):
+        self.by_email: Dict[str, str] = {}
+        self.by_domain: Dict[str, str] = {}
+        self.names: List[str] = []                       # canonical company names
+        self.name_grams: List[set] = []
+        self.gram_postings: Dict[str, List[int]] = defaultdict(list)
+        self.by_normalized: Dict[str, str] = {}
+
+    def add_name(self, company: str):
+        norm = normalize_company(company)
+        if not norm or norm in self.by_normalized:
+            return
+        self.by_normalized[norm] = company
+        grams = trigrams(norm)
+        idx = len(self.names)
+        self.names.append(company)
+        self.name_grams.append(grams)
+        for g in grams:
+            self.gram_postings[g].append(idx)
+
+    def fuzzy(self, text: str) -> Tuple[Optional[str], float]:
+        """Best company for free text via the trigram postings (only touches candidates sharing a gram)."""
+        grams = trigrams(normalize_company(text))
+        if not grams:
+            return None, 0.0
+
+        overlap: Dict[int, int] = defaultdict(int)
+        for g in grams:
+            for idx in self.gram_postings.get(g, ()):
+                overlap[idx] += 1
+
+        best, best_score = None, 0.0
+        for idx, shared in overlap.items():
+            score = shared / (len(grams) + len(self.name_grams[idx]) - shared)
+            if score > best_score:
+                best, best_score = self.names[idx], score
+
+        if best_score < FUZZY_MIN_SIMILARITY:
+            return None, best_score
+        return best, best_score
+
+
+def build_index(gc_csv: str, hubspot_csv: str) -> GCIndex:
+    """Build a GCIndex. The consolidated GC list wins over HubSpot on conflicts."""
+    index = GCIndex()
+    domain_votes: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+
+    if os.path.exists(hubspot_csv):
+        with open(hubspot_csv, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                company = (row.get("primary_company") or "").strip()
+                email = (row.get("email") or "").strip().lower()
+                if not company:
+                    continue
+                index.add_name(company)
+                domain = (row.get("domain") or "").strip().lower() or split_email(email)[1]
+                if domain in UNRESOLVABLE_DOMAINS:
+                    continue
+                if email:
+                    index.by_email[email] = company
+                if domain and domain not in FREE_MAIL_DOMAINS:
+                    # Weight by project history so a shared broker domain maps to its main GC
+                    try:
+                        weight = 1 + float(row.get("total_projects") or 0)
+                    except ValueError:
+                        weight = 1
+                    domain_votes[domain][company] += weight
+    else:
+        logger.warning(f"HubSpot contacts file not found: {hubspot_csv}")
+
+    if os.path.exists(gc_csv):
+        with open(gc_csv, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                company = (row.get("gc_name") or "").strip()
+                email = (row.get("email") or "").strip().lower()
+                if not company:
+                    continue
+                index.add_name(company)
+                domain = split_email(email)[1]
+                if email and domain not in UNRESOLVABLE_DOMAINS:
+                    index.by_email[email] = company
+                    if domain and domain not in FREE_MAIL_DOMAINS:
+                        domain_votes[domain][company] += 1000  # curated list beats HubSpot
+    else:
+        logger.warning(f"GC contacts file not found: {gc_csv}")
+
+    for domain, votes in domain_votes.items():
+        index.by_domain[domain] = max(votes.items(), key=lambda kv: kv[1])[0]
+
+    return index
+
+
+class GCResolver:
+    """
+    Resolves gc_name from a sender address.
+
+    Only exact email and domain hits count; an unknown domain resolves to
+    None rather than to a fuzzy guess on its stem, which generic words
+    ('builders', 'roofing') would match to some unrelated GC. Fuzzy
+    matching is for real company names (resolve_name). Source files are
+    re-read when their mtime changes.
+    """
+
+    def __init__(self, gc_csv: str = GC_CONTACTS_CSV, hubspot_csv: str = HUBSPOT_CONTACTS_CSV,
+                 reload_check_seconds: float = RELOAD_CHECK_SECONDS):
+        self.gc_csv = gc_csv
+        self.hubspot_csv = hubspot_csv
+        self.reload_check_seconds = reload_check_seconds
+        self._lock = threading.Lock()
+        self._mtimes: Tuple[float, float] = (0.0, 0.0)
+        self._last_check = 0.0
+        self._index = GCIndex()
+        self.reload()
+
+    def _current_mtimes(self) -> Tuple[float, float]:
+        def mtime(path):
+            try:
+                return os.stat(path).st_mtime
+            except OSError:
+                return 0.0
+        return mtime(self.gc_csv), mtime(self.hubspot_csv)
+
+    def reload(self):
+        """Rebuild the index from disk and swap it in."""
+        mtimes = self._current_mtimes()
+        index = build_index(self.gc_csv, self.hubspot_csv)
+        with self._lock:
+            self._index = index
+            self._mtimes = mtimes
+            self._last_check = time.monotonic()
+        logger.info(f"GC resolver loaded {len(index.by_email)} emails, {len(index.by_domain)} domains, "
+                    f"{len(index.names)} companies")
+
+    def _maybe_reload(self):
+        now = time.monotonic()
+        if now - self._last_check < self.reload_check_seconds:
+            return
+        self._last_check = now
+        if self._current_mtimes() != self._mtimes:
+            logger.info("GC source files changed, reloading")
+            self.reload()
+
+    def match(self, from_email: str) -> Tuple[Optional[str], Optional[str]]:
+        """(GC company, MATCH_EMAIL or MATCH_DOMAIN) for a sender address, or (None, None)."""
+        self._maybe_reload()
+        addr, domain = split_email(from_email)
+        if not addr or domain in UNRESOLVABLE_DOMAINS:
+            return None, None
+
+        index = self._index
+        company = index.by_email.get(addr)
+        if company:
+            return company, MATCH_EMAIL
+        if not domain or domain in FREE_MAIL_DOMAINS:
+            return None, None
+
+        company = index.by_domain.get(domain)
+        if company:
+            return company, MATCH_DOMAIN
+        return None, None
+
+    def resolve(self, from_email: str) -> Optional[str]:
+        """GC company for a sender address, or None."""
+        return self.match(from_email)[0]
+
+    def resolve_name(self, name: str) -> Optional[str]:
+        """Canonical company for a free-text GC name (e.g. one extracted by the LLM)."""
+        self._maybe_reload()
+        if not name:
+            return None
+        index = self._index
+        exact = index.by_normalized.get(normalize_company(name))
+        if exact:
+            return exact
+        return index.fuzzy(name)[0]
+
+    def enrich(self, event: Dict) -> Dict:
+        """
+        Set event['gc_name']: an exact sender hit wins over the classifier's
+        guess; otherwise the guess is canonicalized via resolve_name and
+        kept as-is when that finds nothing.
+        """
+        company, tier = self.match(event.get("from_email"))
+        if tier in (MATCH_EMAIL, MATCH_DOMAIN):
+            event["gc_name"] = company
+        elif event.get("gc_name"):
+            event["gc_name"] = self.resolve_name(event["gc_name"]) or event["gc_name"]
+        return event
+
+
+_resolver: Optional[GCResolver] = None
+
+
+def get_resolver() -> GCResolver:
+    """Get or create the shared resolver instance."""
+    global _resolver
+    if _resolver is None:
+        _resolver = GCResolver()
+    return _resolver
+
+
+if __name__ == "__main__":
+    import sys
+    logging.basicConfig(level=logging.INFO)
+    resolver = get_resolver()
+    for arg in sys.argv[1:] or ["faigy@leaditbuilders.com", "bids@nydevelopers.net"]:
+        print(f"{arg} -> {resolver.match(arg)}")
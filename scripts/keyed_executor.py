@@ -0,0 +1,72 @@
+"""
+CAO-AUD-001: Keyed Executor
+Thread-pool executor where tasks sharing a key run one at a time, in the
+order they were submitted, while tasks for different keys run concurrently.
+The auditor keys by agent_id: pause/disable decisions for one agent depend
+on the order of its sessions, but different agents are independent, so a
+batch takes about as long as its busiest agent.
+"""
+
+import threading
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Hashable, Tuple
+
+Task = Tuple[Callable, tuple, Future]
+
+
+class KeyedExecutor:
+    """Per-key serial, cross-key parallel task runner."""
+
+    def __init__(self, max_workers: int = 8, thread_name_prefix: str = "keyed"):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._queues: Dict[Hashable, Deque[Task]] = {}   # a key is present while it has a drainer
+        self._depths: Counter = Counter()                 # queued + running tasks per key
+        self.peak_depths: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def submit(self, key: Hashable, fn: Callable, *args: Any) -> Future:
+        future: Future = Future()
+        with self._lock:
+            self._depths[key] += 1
+            self.peak_depths[key] = max(self.peak_depths[key], self._depths[key])
+            queue = self._queues.get(key)
+            if queue is not None:
+                queue.append((fn, args, future))
+                return future
+            self._queues[key] = deque([(fn, args, future)])
+        self._pool.submit(self._drain, key)
+        return future
+
+    def _drain(self, key: Hashable):
+        # One drainer per key runs its tasks back to back, so order is kept
+        while True:
+            with self._lock:
+                queue = self._queues[key]
+                if not queue:
+                    del self._queues[key]
+                    return
+                fn, args, future = queue.popleft()
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args))
+                except BaseException as e:
+                    future.set_exception(e)
+            with self._lock:
+                self._depths[key] -= 1
+                if not self._depths[key]:
+                    del self._depths[key]
+
+    def queue_depths(self) -> Dict[Hashable, int]:
+        """Tasks waiting or running per key right now."""
+        with self._lock:
+            return dict(self._depths)
+
+    def shutdown(self, wait: bool = True):
+        self._pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "KeyedExecutor":
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown(wait=True)
@@ -0,0 +1,306 @@
+"""
+Project Matcher - links scanned sales events to known projects
+Canonicalizes street addresses and indexes active_bids / active_projects by
+house number and street tokens so each event can carry a project_id.
+"""
+
+import csv
+import logging
+import os
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PROJECT_SOURCES = [
+    ("bid", os.getenv("ACTIVE_BIDS_CSV", str(REPO_ROOT / "active_bids.csv"))),
+    ("project", os.getenv("ACTIVE_PROJECTS_CSV", str(REPO_ROOT / "active_projects.csv"))),
+]
+
+# Spelling variants -> canonical token
+TOKEN_ALIASES = {
+    "east": "e", "west": "w", "north": "n", "south": "s",
+    "street": "st", "str": "st",
+    "avenue": "ave", "av": "ave",
+    "road": "rd", "boulevard": "blvd", "place": "pl", "drive": "dr",
+    "parkway": "pkwy", "lane": "ln", "court": "ct", "terrace": "ter",
+    "expressway": "expy", "highway": "hwy", "saint": "st",
+}
+STREET_TYPES = {"st", "ave", "rd", "blvd", "pl", "dr", "pkwy", "ln", "ct", "ter", "expy", "hwy"}
+DIRECTIONS = {"e", "w", "n", "s"}
+FILLER_TOKENS = {"and", "the", "of", "at", "project", "site", "building", "bldg"}
+
+HOUSE_NUMBER = re.compile(r"^\d+(?:-\d+)?$")
+ORDINAL = re.compile(r"^(\d+)(?:st|nd|rd|th)$")
+TEXT_ADDRESS = re.compile(r"\b(\d{1,5}(?:-\d{1,4})?)\s+((?:[a-z0-9]+\s*){1,4})")
+
+MIN_CONFIDENCE = 0.6
+
+# daily_events columns the match is stored in, so reports can join on it.
+# Added once with `python project_matcher.py --init-columns`.
+DAILY_EVENTS_TABLE = "master-roofing-intelligence.ko_sales.daily_events"
+MATCH_COLUMNS = [("project_id", "STRING"), ("project_match_confidence", "FLOAT64")]
+
+
+def ordinal(number: str) -> str:
+    """'23' -> '23rd', '11' -> '11th'."""
+    n = int(number)
+    if 10 <= n % 100 <= 20:
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
+
+
+def canonical_tokens(text: str) -> List[str]:
+    """'1933 East 23 Street' -> ['1933', 'e', '23rd', 'st']."""
+    tokens = []
+    for raw in re.findall(r"[a-z0-9]+(?:-[0-9]+)?", (text or "").lower()):
+        match = ORDINAL.match(raw)
+        if match:
+            token = ordinal(match.group(1))
+        elif raw.isdigit() and tokens and tokens[-1] in DIRECTIONS:
+            token = ordinal(raw)  # 'E 144' is East 144th
+        else:
+            token = TOKEN_ALIASES.get(raw, raw)
+        if token not in FILLER_TOKENS:
+            tokens.append(token)
+    return tokens
+
+
+def split_addresses(tokens: List[str]) -> List[List[str]]:
+    """
+    One token list per house number: '2040 57th 2044 57th' -> two addresses,
+    '293 295 willoughby' -> ['293', 'willoughby'], ['295', 'willoughby'].
+    """
+    segments: List[Tuple[List[str], List[str]]] = []
+    for token in tokens:
+        if HOUSE_NUMBER.match(token):
+            if not segments or segments[-1][1]:
+                segments.append(([], []))
+            segments[-1][0].append(token)
+        elif segments:
+            segments[-1][1].append(token)
+        else:
+            segments.append(([], [token]))
+
+    addresses = []
+    for numbers, words in segments:
+        if not numbers:
+            addresses.append(words)
+        for number in numbers:
+            addresses.append([number] + words)
+    return addresses
+
+
+def street_core(tokens: List[str]) -> Tuple[str, ...]:
+    """Address tokens without the trailing street type: ('1933', 'e', '23rd')."""
+    core = list(tokens)
+    while len(core) > 2 and core[-1] in STREET_TYPES:
+        core.pop()
+    return tuple(core)
+
+
+def canonicalize_address(text: str) -> str:
+    """Canonical form used for exact comparison: '1933 E 23rd St.' -> '1933 e 23rd st'."""
+    return " ".join(canonical_tokens(text))
+
+
+class ProjectIndex:
+    """House-number and street-core indexes over known projects."""
+
+    def __init__(self):
+        self.projects: Dict[str, Dict] = {}
+        self.by_canonical: Dict[str, str] = {}
+        self.by_core: Dict[Tuple[str, ...], str] = {}
+        self.by_number: Dict[str, List[Tuple[Tuple[str, ...], str]]] = defaultdict(list)
+
+    def add(self, project_id: str, observed_key: str, gc_name: str, source: str):
+        if not project_id or project_id in self.projects:
+            return
+        self.projects[project_id] = {
+            "project_id": project_id,
+            "observed_key": observed_key,
+            "gc_name": gc_name,
+            "source": source,
+        }
+        for address in split_addresses(canonical_tokens(observed_key)):
+            if not HOUSE_NUMBER.match(address[0]) or len(address) < 2:
+                continue
+            self.by_canonical.setdefault(" ".join(address), project_id)
+            core = street_core(address)
+            self.by_core.setdefault(core, project_id)
+            self.by_number[address[0]].append((core, project_id))
+
+    def __len__(self):
+        return len(self.projects)
+
+
+def load_index(sources: List[Tuple[str, str]] = PROJECT_SOURCES) -> ProjectIndex:
+    """Load the project CSV exports into a ProjectIndex (bids first)."""
+    index = ProjectIndex()
+    for source, path in sources:
+        if not os.path.exists(path):
+            logger.warning(f"Project source not found: {path}")
+            continue
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                index.add(
+                    (row.get("project_id") or "").strip(),
+                    row.get("observed_key") or "",
+                    (row.get("gc_name") or "").strip(),
+                    source,
+                )
+    logger.info(f"Project matcher loaded {len(index)} projects")
+    return index
+
+
+class ProjectMatcher:
+    """
+    Matches free-text project names and email text to known project IDs.
+
+    Candidates come from the house-number bucket, so a lookup only compares
+    against the handful of projects sharing that number.
+    """
+
+    def __init__(self, index: Optional[ProjectIndex] = None):
+        self.index = index if index is not None else load_index()
+
+    def _score(self, tokens: List[str], core: Tuple[str, ...]) -> float:
+        """Confidence that an address token list (starting with the house number) names `core`."""
+        wanted = core[1:]
+        given = tokens[1:]
+        if not wanted:
+            return 0.0
+
+        # A conflicting direction (E 23rd vs W 23rd) is a different building
+        given_dirs = {t for t in given[:1] if t in DIRECTIONS}
+        wanted_dirs = {t for t in wanted[:1] if t in DIRECTIONS}
+        if given_dirs and wanted_dirs and given_dirs != wanted_dirs:
+            return 0.0
+
+        significant = [t for t in wanted if t not in DIRECTIONS]
+        if not significant:
+            return 0.0
+        matched = 0
+        for token in significant:
+            # Prefix match handles truncation ('willough' vs 'willoughby')
+            if any(g == token or (len(g) >= 4 and (token.startswith(g) or g.startswith(token))) for g in given):
+                matched += 1
+        if matched == 0:
+            return 0.0
+        return 0.6 + 0.3 * (matched / len(significant))
+
+    def _match_address(self, tokens: List[str], gc_name: Optional[str]) -> Tuple[Optional[str], float]:
+        index = self.index
+        if len(tokens) < 2:
+            return None, 0.0
+
+        project_id = index.by_canonical.get(" ".join(tokens))
+        if project_id:
+            return project_id, 1.0
+
+        core = street_core(tokens)
+        project_id = index.by_core.get(core)
+        if project_id:
+            return project_id, 0.95
+
+        best, best_score = None, 0.0
+        for candidate_core, candidate_id in index.by_number.get(tokens[0], ()):
+            score = self._score(tokens, candidate_core)
+            if score and gc_name and index.projects[candidate_id]["gc_name"].lower() == gc_name.lower():
+                score = min(0.94, score + 0.05)
+            if score > best_score:
+                best, best_score = candidate_id, score
+        return best, best_score
+
+    def match(self, project_name: Optional[str], text: str = "",
+              gc_name: Optional[str] = None) -> Tuple[Optional[str], float]:
+        """
+        Return (project_id, confidence) for an event.
+
+        project_name is tried first; any addresses found in `text` (subject or
+        summary) are tried after. Confidence below MIN_CONFIDENCE is a miss.
+        """
+        best, best_score = None, 0.0
+
+        if project_name:
+            for address in split_addresses(canonical_tokens(project_name)):
+                project_id, score = self._match_address(address, gc_name)
+                if score > best_score:
+                    best, best_score = project_id, score
+            if best_score >= 0.95:
+                return best, best_score
+
+        for number, rest in TEXT_ADDRESS.findall((text or "").lower()):
+            if number not in self.index.by_number:
+                continue
+            project_id, score = self._match_address([number] + canonical_tokens(rest), gc_name)
+            if score > best_score:
+                best, best_score = project_id, score
+
+        if best_score < MIN_CONFIDENCE:
+            return None, 0.0
+        return best, round(best_score, 2)
+
+    def attach(self, event: Dict, text: str = "") -> Dict:
+        """Set project_id / project_match_confidence on a scanned event."""
+        project_id, confidence = self.match(
+            event.get("project_name"),
+            text or event.get("summary", ""),
+            event.get("gc_name"),
+        )
+        event["project_id"] = project_id
+        event["project_match_confidence"] = confidence
+        return event
+
+
+def match_columns(event: Dict) -> Dict:
+    """The match fields of an event as daily_events column values."""
+    return {name: event.get(name) for name, _ in MATCH_COLUMNS}
+
+
+def ensure_match_columns(client, table_ref: str = DAILY_EVENTS_TABLE):
+    """
+    Add the match columns to daily_events if the table does not have them
+    yet. A one-off migration, not part of saving: streaming inserts only see
+    new columns after a propagation delay, so run it before deploying the
+    scanners that write them.
+    """
+    columns = ",\n".join(f"ADD COLUMN IF NOT EXISTS {name} {kind}" for name, kind in MATCH_COLUMNS)
+    client.query(f"ALTER TABLE `{table_ref}`\n{columns}").result()
+
+
+_matcher: Optional[ProjectMatcher] = None
+
+
+def get_matcher() -> ProjectMatcher:
+    """Get or create the shared matcher instance."""
+    global _matcher
+    if _matcher is None:
+        _matcher = ProjectMatcher()
+    return _matcher
+
+
+if __name__ == "__main__":
+    import argparse
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Match text to a project, or migrate daily_events")
+    parser.add_argument("text", nargs="*", help="Project names / addresses to match")
+    parser.add_argument("--init-columns", action="store_true",
+                        help="Add the project_id / project_match_confidence columns to daily_events and exit")
+    args = parser.parse_args()
+
+    if args.init_columns:
+        from google.cloud import bigquery
+        ensure_match_columns(bigquery.Client(project=DAILY_EVENTS_TABLE.split(".")[0]))
+        print(f"Match columns ready on {DAILY_EVENTS_TABLE}")
+    else:
+        matcher = get_matcher()
+        for arg in args.text or ["1933 E 23rd St", "RFP - 38-60 Berwyn roofing"]:
+            project_id, confidence = matcher.match(arg, arg)
+            key = matcher.index.projects[project_id]["observed_key"] if project_id else None
+            print(f"{arg!r} -> {project_id} ({key}) confidence={confidence}")
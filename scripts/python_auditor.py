@@ -14,21 +14,37 @@ Responsibilities:
 Run modes:
 - Single session: python python_auditor.py --session-id <id>
 - Batch (pending): python python_auditor.py --batch
+  (bulk by default: one insert per table and one MERGE per batch;
+  --serial audits and writes one session at a time)
 - Continuous: python python_auditor.py --daemon
+- Re-score history: python python_auditor.py --rescore --since 2025-01-01
+
+Batches are claimed with a lease (see session_store), so several daemons and
+/api/audit/batch can run side by side without auditing a session twice.
+Leases are renewed right before any write, so a worker that lost a lease
+writes no scores, events or agent status changes for that session.
 """
 
 import argparse
 import json
 import logging
+import os
+import socket
+import threading
 import time
 import uuid
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
-from dataclasses import dataclass, asdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Dict, List, Any, Tuple
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 
 from google.cloud import bigquery
 
+from rolling_baselines import BASELINES_PATH, RollingBaselines, utc_today
+from keyed_executor import KeyedExecutor
+from rule_engine import CompiledRules
+from session_store import LEASE_SECONDS, BigQuerySessionStore, LeaseLost, SessionStore
+
 # Configuration
 PROJECT_ID = "master-roofing-intelligence"
 DATASET = "ko_audit"
@@ -61,6 +77,32 @@ ESCALATION_TRIGGERS = {
     "random_sample_rate": 0.05,  # 5% random sampling
 }
 
+# Seconds before pause rules are reloaded in the background
+RULES_CACHE_TTL = 300
+
+# Daemon polling: full batches run back to back; empty polls back off
+# from the base interval by this factor up to the ceiling (seconds)
+IDLE_BACKOFF_FACTOR = 2
+MAX_IDLE_INTERVAL = 900
+
+# Threads for the per-session (--serial) path; sessions of one agent stay in order
+AUDIT_WORKERS = 8
+
+# Streaming insert request size for bulk writes (BigQuery recommends <= 500 rows)
+INSERT_CHUNK_SIZE = 500
+
+# agent_scores columns written by merge_scores (re-scores)
+SCORE_FIELDS = [
+    ("score_id", "STRING"),
+    ("agent_id", "STRING"),
+    ("scored_by", "STRING"),
+    ("score_type", "STRING"),
+    ("score_value", "FLOAT64"),
+    ("score_context", "STRING"),
+    ("sample_size", "INT64"),
+    ("evaluation_criteria", "STRING"),
+]
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -131,15 +173,149 @@ class AuditResult:
     escalation_reason: Optional[str]
 
 
+@dataclass
+class AuditPlan:
+    """Everything an audit decided for a session, before anything is written."""
+    result: AuditResult
+    events: List[Tuple[str, Dict]] = field(default_factory=list)         # (event_type, rule)
+    agent_actions: List[Tuple[str, str]] = field(default_factory=list)   # (pause|disable, reason)
+    notifications: List[Tuple[List[str], List[str], str]] = field(default_factory=list)
+
+
+@dataclass
+class BatchRun:
+    """Outcome of one run_batch call, kept for the daemon and /health."""
+    fetched: int
+    audited: int
+    audit_lag_seconds: float    # age of the oldest pending session (0 when none)
+    elapsed_seconds: float
+    finished_at: str
+
+
+@dataclass(frozen=True)
+class RulesSnapshot:
+    """One loaded version of the pause rules."""
+    version: int
+    pause_rules: List[Dict]
+    compiled_rules: CompiledRules
+    loaded_at: float        # time.time() when the load finished
+    load_seconds: float
+
+
+def session_age_seconds(ended_at: Any) -> float:
+    """Seconds since a session's ended_at (BigQuery returns UTC datetimes)."""
+    if not isinstance(ended_at, datetime):
+        return 0.0
+    if ended_at.tzinfo is None:
+        ended_at = ended_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (datetime.now(timezone.utc) - ended_at).total_seconds())
+
+
 class PythonAuditor:
     """
     Deterministic Python Auditor for agent sessions.
+
+    Pause rules are held in a RulesSnapshot. Once it is older than
+    cache_ttl, the next access starts a background reload; audits keep
+    using the current snapshot until the new one replaces it in a single
+    assignment. A failed reload keeps the last good snapshot.
+
+    Agent baselines are RollingBaselines updated by every logged score and
+    re-synced from agent_scores at startup and every SYNC_INTERVAL, so
+    scores logged by other workers are folded in too.
     """
 
-    def __init__(self):
+    def __init__(self, cache_ttl: float = RULES_CACHE_TTL, store: Optional[SessionStore] = None,
+                 worker_id: Optional[str] = None, lease_seconds: float = LEASE_SECONDS,
+                 baselines_path: Optional[str] = None):
         self.client = bigquery.Client(project=PROJECT_ID)
-        self.pause_rules = self._load_pause_rules()
-        self.agent_baselines = self._load_agent_baselines()
+        self.sessions = store or BigQuerySessionStore(self.client, f"{PROJECT_ID}.{DATASET}.agent_sessions")
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.lease_seconds = lease_seconds
+        self.baselines = RollingBaselines(path=baselines_path or BASELINES_PATH)
+        if not self.baselines.load():
+            logger.info("No saved baselines, bootstrapping from agent_scores")
+        self.sync_baselines()
+        self.cache_ttl = cache_ttl
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._next_refresh_at = 0.0
+        self.last_refresh_error: Optional[str] = None
+        self.last_batch: Optional[BatchRun] = None
+        self._snapshot = self._load_snapshot(version=1)
+        self._next_refresh_at = self._snapshot.loaded_at + cache_ttl
+
+    def _load_snapshot(self, version: int) -> RulesSnapshot:
+        start = time.perf_counter()
+        pause_rules = self._load_pause_rules()
+        compiled_rules = CompiledRules(pause_rules)
+        return RulesSnapshot(
+            version=version,
+            pause_rules=pause_rules,
+            compiled_rules=compiled_rules,
+            loaded_at=time.time(),
+            load_seconds=time.perf_counter() - start,
+        )
+
+    def refresh_rules(self, wait: bool = False) -> bool:
+        """
+        Reload the pause rules into a new snapshot. Runs in a background
+        thread unless wait=True; returns False if a reload is already running.
+        """
+        with self._refresh_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return False
+            self._refresh_thread = threading.Thread(target=self._refresh, name="auditor-rules-refresh", daemon=True)
+            self._refresh_thread.start()
+            thread = self._refresh_thread
+        if wait:
+            thread.join()
+        return True
+
+    def _refresh(self):
+        try:
+            snapshot = self._load_snapshot(self._snapshot.version + 1)
+        except Exception as e:
+            self.last_refresh_error = str(e)
+            logger.error(f"Rules refresh failed, keeping version {self._snapshot.version}: {e}")
+        else:
+            self._snapshot = snapshot
+            self.last_refresh_error = None
+            logger.info(f"Loaded rules version {snapshot.version}: {len(snapshot.pause_rules)} rules "
+                        f"in {snapshot.load_seconds:.2f}s")
+        self._next_refresh_at = time.time() + self.cache_ttl
+
+    @property
+    def snapshot(self) -> RulesSnapshot:
+        """Current snapshot; starts a background reload once it is past its TTL."""
+        if time.time() >= self._next_refresh_at:
+            self.refresh_rules()
+        return self._snapshot
+
+    @property
+    def pause_rules(self) -> List[Dict]:
+        return self.snapshot.pause_rules
+
+    @property
+    def compiled_rules(self) -> CompiledRules:
+        return self.snapshot.compiled_rules
+
+    @property
+    def agent_baselines(self) -> RollingBaselines:
+        return self.baselines
+
+    def cache_status(self) -> Dict[str, Any]:
+        """Version, age and load time of the current rules snapshot."""
+        snapshot = self._snapshot
+        return {
+            "rules_version": snapshot.version,
+            "rules_loaded_at": datetime.utcfromtimestamp(snapshot.loaded_at).isoformat() + "Z",
+            "rules_age_seconds": round(time.time() - snapshot.loaded_at, 1),
+            "rules_load_ms": round(snapshot.load_seconds * 1000, 1),
+            "rules_ttl_seconds": self.cache_ttl,
+            "refreshing": self._refresh_thread is not None and self._refresh_thread.is_alive(),
+            "last_refresh_error": self.last_refresh_error,
+        }
 
     def _load_pause_rules(self) -> List[Dict]:
         """Load active pause rules from BigQuery."""
@@ -158,48 +334,85 @@ class PythonAuditor:
         results = self.client.query(query).result()
         return [dict(row) for row in results]
 
-    def _load_agent_baselines(self) -> Dict[str, float]:
-        """Load 30-day baseline scores per agent."""
+    def _load_daily_scores(self, since: date) -> List[tuple]:
+        """
+        Per-agent daily truth-score (sum, count) for the UTC days from `since`
+        on. Re-scores are left out: they are stamped with the day they were
+        re-written, not the day the session ran.
+        """
         query = f"""
         SELECT
             agent_id,
-            AVG(score_value) as baseline_score
+            DATE(created_at) as day,
+            SUM(score_value) as score_sum,
+            COUNT(*) as score_count
         FROM `{PROJECT_ID}.{DATASET}.agent_scores`
-        WHERE created_at >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 30 DAY)
+        WHERE created_at >= TIMESTAMP(@since)
             AND score_type = 'truth_score'
-        GROUP BY agent_id
+            AND IFNULL(evaluation_criteria, '') != 'rescore'
+        GROUP BY agent_id, day
         """
-        results = self.client.query(query).result()
-        return {row.agent_id: row.baseline_score for row in results}
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ScalarQueryParameter("since", "DATE", since)]
+        )
+        results = self.client.query(query, job_config=job_config).result()
+        return [(row.agent_id, row.day, row.score_sum, row.score_count) for row in results]
+
+    def sync_baselines(self):
+        """Re-read the baseline days since the last sync from agent_scores and save."""
+        today = utc_today()
+        since = self.baselines.sync_start(today)
+        self.baselines.sync(self._load_daily_scores(since), since, today)
+        self.baselines.save()
+        logger.info(f"Synced baselines from {since} for {len(self.baselines)} agents")
+
+    def _maintain_baselines(self):
+        """Periodic baseline upkeep between audits: sync when due, else save when due."""
+        if self.baselines.sync_due():
+            try:
+                self.sync_baselines()
+                return
+            except Exception as e:
+                logger.error(f"Baseline sync failed, keeping local buckets: {e}")
+        self.baselines.save_if_due()
 
     def get_pending_sessions(self, limit: int = 100) -> List[Dict]:
-        """Get sessions pending audit."""
-        query = f"""
-        SELECT *
-        FROM `{PROJECT_ID}.{DATASET}.agent_sessions`
-        WHERE audit_status = 'pending'
-            AND ended_at IS NOT NULL
-        ORDER BY ended_at ASC
-        LIMIT {limit}
+        """Get sessions pending audit (unclaimed or lease expired), without claiming them."""
+        return self.sessions.pending(limit)
+
+    def claim_sessions(self, limit: int = 100) -> List[Dict]:
+        """Lease up to `limit` pending sessions to this worker, oldest first."""
+        return self.sessions.claim(self.worker_id, limit, self.lease_seconds)
+
+    def hold_leases(self, sessions: List[Dict]) -> Dict[str, Any]:
         """
-        results = self.client.query(query).result()
-        return [dict(row) for row in results]
+        Make sure this worker holds a fresh lease on each session before
+        writing anything for it: renew the ones it claimed, claim the others
+        (sessions fetched directly, e.g. --session-id). Returns session_id ->
+        lease token for the sessions held; the rest were lost.
+        """
+        claimed = {s["session_id"]: s["lease_expires_at"] for s in sessions
+                   if s.get("claimed_by") == self.worker_id and s.get("lease_expires_at") is not None}
+        held = self.sessions.renew(self.worker_id, claimed, self.lease_seconds)
+        unclaimed = [s["session_id"] for s in sessions if s["session_id"] not in claimed]
+        if unclaimed:
+            for row in self.sessions.claim(self.worker_id, len(unclaimed), self.lease_seconds, unclaimed):
+                held[row["session_id"]] = row["lease_expires_at"]
+        return held
+
+    def release_sessions(self, session_ids: List[str]):
+        """Hand claimed sessions back for another attempt; never raises."""
+        if not session_ids:
+            return
+        try:
+            self.sessions.release(self.worker_id, session_ids)
+            logger.info(f"Released {len(session_ids)} unfinished sessions")
+        except Exception as e:
+            logger.error(f"Failed to release {len(session_ids)} sessions, they wait out their lease: {e}")
 
     def get_session(self, session_id: str) -> Optional[Dict]:
         """Get a specific session by ID."""
-        query = f"""
-        SELECT *
-        FROM `{PROJECT_ID}.{DATASET}.agent_sessions`
-        WHERE session_id = @session_id
-        """
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("session_id", "STRING", session_id)
-            ]
-        )
-        results = self.client.query(query, job_config=job_config).result()
-        rows = list(results)
-        return dict(rows[0]) if rows else None
+        return self.sessions.get(session_id)
 
     def extract_metrics(self, session: Dict) -> SessionMetrics:
         """Extract metrics from session data."""
@@ -283,51 +496,42 @@ class PythonAuditor:
             format_score=round(format_score, 2),
         )
 
+    def calculate_scores_batch(self, metrics: List[SessionMetrics]) -> List[AuditScore]:
+        """calculate_scores for many sessions at once (vectorized, identical results)."""
+        from batch_scoring import calculate_scores_batch, columns_from_metrics, score_rows
+
+        if not metrics:
+            return []
+        scores = calculate_scores_batch(columns_from_metrics(metrics), SCORING_WEIGHTS, LATENCY_THRESHOLDS)
+        return [AuditScore(**row) for row in score_rows(scores)]
+
+    def rule_values(self, metrics: SessionMetrics, scores: AuditScore) -> Dict[str, float]:
+        """Values of the metrics pause rules can test."""
+        return {
+            "truth_score": scores.truth_score,
+            "accuracy_score": scores.accuracy_score,
+            "error_rate": (metrics.errors_count / metrics.message_count
+                           if metrics.message_count > 0 else 0),
+            "latency_ms": metrics.avg_response_time_ms,
+        }
+
     def check_rules(self, metrics: SessionMetrics, scores: AuditScore) -> List[Dict]:
         """Check which pause rules are triggered."""
-        triggered = []
-
-        # Calculate error rate for rule checking
-        error_rate = (metrics.errors_count / metrics.message_count
-                      if metrics.message_count > 0 else 0)
-
-        for rule in self.pause_rules:
-            metric_name = rule["metric"]
-            operator = rule["operator"]
-            threshold = rule["threshold_value"]
-
-            # Get actual value based on metric
-            if metric_name == "truth_score":
-                actual = scores.truth_score
-            elif metric_name == "accuracy_score":
-                actual = scores.accuracy_score
-            elif metric_name == "error_rate":
-                actual = error_rate
-            elif metric_name == "latency_ms":
-                actual = metrics.avg_response_time_ms
-            else:
-                continue
-
-            # Check if rule is triggered
-            triggered_flag = False
-            if operator == "lt" and actual < threshold:
-                triggered_flag = True
-            elif operator == "lte" and actual <= threshold:
-                triggered_flag = True
-            elif operator == "gt" and actual > threshold:
-                triggered_flag = True
-            elif operator == "gte" and actual >= threshold:
-                triggered_flag = True
-            elif operator == "eq" and actual == threshold:
-                triggered_flag = True
-
-            if triggered_flag:
-                triggered.append({
-                    **rule,
-                    "actual_value": actual,
-                })
-
-        return triggered
+        return self.compiled_rules.triggered(self.rule_values(metrics, scores))
+
+    def check_rules_batch(self, metrics: List[SessionMetrics], scores: List[AuditScore]) -> List[List[Dict]]:
+        """check_rules for a whole batch, evaluated against all rules at once."""
+        from batch_scoring import columns_from_metrics, error_rates
+
+        if not metrics:
+            return []
+        columns = columns_from_metrics(metrics)
+        return self.compiled_rules.triggered_batch({
+            "truth_score": [s.truth_score for s in scores],
+            "accuracy_score": [s.accuracy_score for s in scores],
+            "error_rate": error_rates(columns),
+            "latency_ms": columns["avg_response_time_ms"],
+        })
 
     def should_escalate_to_llm(self, metrics: SessionMetrics, scores: AuditScore) -> tuple[bool, Optional[str]]:
         """Determine if session should be escalated to LLM Auditor."""
@@ -336,8 +540,8 @@ class PythonAuditor:
         if metrics.message_count > ESCALATION_TRIGGERS["session_length"]:
             return True, "session_length"
 
-        # Check score drop from baseline
-        baseline = self.agent_baselines.get(metrics.agent_id, 85)
+        # Check score drop from baseline (current to the last logged score)
+        baseline = self.baselines.get(metrics.agent_id, 85)
         if baseline - scores.truth_score > ESCALATION_TRIGGERS["score_drop"]:
             return True, "score_drop"
 
@@ -348,12 +552,11 @@ class PythonAuditor:
 
         return False, None
 
-    def log_score(self, session_id: str, agent_id: str, scores: AuditScore):
-        """Log scores to agent_scores table."""
-        score_id = f"SCORE-{uuid.uuid4().hex[:8].upper()}"
-
-        rows = [{
-            "score_id": score_id,
+    def _score_row(self, session_id: str, agent_id: str, scores: AuditScore,
+                   criteria: str = "automated_metrics", score_id: Optional[str] = None) -> Dict:
+        """agent_scores row for a session's truth score."""
+        return {
+            "score_id": score_id or f"SCORE-{uuid.uuid4().hex[:8].upper()}",
             "agent_id": agent_id,
             "scored_by": AUDITOR_ID,
             "score_type": "truth_score",
@@ -363,14 +566,90 @@ class PythonAuditor:
                 "component_scores": scores.to_dict()
             }),
             "sample_size": 1,
-            "evaluation_criteria": "automated_metrics",
-        }]
+            "evaluation_criteria": criteria,
+        }
+
+    def _event_row(self, agent_id: str, session_id: str, event_type: str,
+                   rule: Dict, scores: AuditScore) -> Dict:
+        """audit_events row for a triggered rule or an escalation."""
+        return {
+            "event_id": f"EVT-{uuid.uuid4().hex[:8].upper()}",
+            "event_type": event_type,
+            "agent_id": agent_id,
+            "session_id": session_id,
+            "trigger_reason": rule["rule_name"],
+            "trigger_value": rule["actual_value"],
+            "threshold_value": rule["threshold_value"],
+            "truth_score": scores.truth_score,
+            "accuracy_score": scores.accuracy_score,
+            "latency_score": scores.latency_score,
+            "error_rate": None,  # TODO: Add error rate
+            "action_taken": rule["action"],
+            "escalated_to": LLM_AUDITOR_ID if event_type == "escalate" else None,
+            "created_by": AUDITOR_ID,
+        }
+
+    def insert_rows(self, table: str, rows: List[Dict], row_id_field: Optional[str] = None) -> List[Dict]:
+        """
+        Stream rows into a ko_audit table in INSERT_CHUNK_SIZE requests;
+        returns row errors. With row_id_field, that column is sent as the
+        insert ID so BigQuery drops duplicates of a retried request
+        (best effort, within about a minute).
+        """
+        table_ref = f"{PROJECT_ID}.{DATASET}.{table}"
+        errors = []
+        for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+            chunk = rows[start:start + INSERT_CHUNK_SIZE]
+            if row_id_field:
+                chunk_errors = self.client.insert_rows_json(
+                    table_ref, chunk, row_ids=[row[row_id_field] for row in chunk])
+            else:
+                chunk_errors = self.client.insert_rows_json(table_ref, chunk)
+            errors.extend({**e, "index": e.get("index", 0) + start} for e in chunk_errors)
+        return errors
+
+    def merge_scores(self, rows: List[Dict]) -> int:
+        """
+        Upsert agent_scores rows keyed on score_id with one MERGE: an
+        existing row gets the new value, a missing one is inserted. Unlike
+        streaming insert IDs this holds across any time gap, so re-running
+        a re-score page never duplicates its scores. Returns rows affected.
+        """
+        if not rows:
+            return 0
+        structs = [
+            bigquery.StructQueryParameter(
+                None, *(bigquery.ScalarQueryParameter(name, kind, row[name]) for name, kind in SCORE_FIELDS)
+            )
+            for row in rows
+        ]
+        columns = ", ".join(name for name, _ in SCORE_FIELDS)
+        job = self.client.query(f"""
+        MERGE `{PROJECT_ID}.{DATASET}.agent_scores` AS s
+        USING (SELECT * FROM UNNEST(@scores)) AS u
+        ON s.score_id = u.score_id
+        WHEN MATCHED THEN UPDATE SET
+            scored_by = u.scored_by,
+            score_value = u.score_value,
+            score_context = u.score_context,
+            evaluation_criteria = u.evaluation_criteria,
+            created_at = CURRENT_TIMESTAMP()
+        WHEN NOT MATCHED THEN
+            INSERT ({columns}, created_at)
+            VALUES ({", ".join(f"u.{name}" for name, _ in SCORE_FIELDS)}, CURRENT_TIMESTAMP())
+        """, job_config=bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ArrayQueryParameter("scores", "STRUCT", structs)]
+        ))
+        job.result()
+        return job.num_dml_affected_rows or 0
 
-        table_ref = f"{PROJECT_ID}.{DATASET}.agent_scores"
-        errors = self.client.insert_rows_json(table_ref, rows)
+    def log_score(self, session_id: str, agent_id: str, scores: AuditScore):
+        """Log scores to agent_scores table."""
+        errors = self.insert_rows("agent_scores", [self._score_row(session_id, agent_id, scores)])
         if errors:
             logger.error(f"Failed to log score: {errors}")
         else:
+            self.baselines.add(agent_id, scores.truth_score)
             logger.info(f"Logged score {scores.truth_score} for session {session_id}")
 
     def create_audit_event(
@@ -382,27 +661,7 @@ class PythonAuditor:
         scores: AuditScore
     ):
         """Create an audit event for warnings/pauses/alerts."""
-        event_id = f"EVT-{uuid.uuid4().hex[:8].upper()}"
-
-        rows = [{
-            "event_id": event_id,
-            "event_type": event_type,
-            "agent_id": agent_id,
-            "session_id": session_id,
-            "trigger_reason": rule["rule_name"],
-            "trigger_value": rule["actual_value"],
-            "threshold_value": rule["threshold_value"],
-            "truth_score": scores.truth_score,
-            "accuracy_score": scores.accuracy_score,
-            "latency_score": scores.latency_score,
-            "error_rate": None,  # TODO: Add error rate
-            "action_taken": rule["action"],
-            "escalated_to": LLM_AUDITOR_ID if event_type == "escalate" else None,
-            "created_by": AUDITOR_ID,
-        }]
-
-        table_ref = f"{PROJECT_ID}.{DATASET}.audit_events"
-        errors = self.client.insert_rows_json(table_ref, rows)
+        errors = self.insert_rows("audit_events", [self._event_row(agent_id, session_id, event_type, rule, scores)])
         if errors:
             logger.error(f"Failed to create audit event: {errors}")
         else:
@@ -452,40 +711,52 @@ class PythonAuditor:
         scores: AuditScore,
         status: AuditStatus,
         escalated: bool = False,
-        llm_report_id: Optional[str] = None
+        llm_report_id: Optional[str] = None,
+        lease_token: Any = None
     ):
-        """Update session with audit results."""
-        query = f"""
-        UPDATE `{PROJECT_ID}.{DATASET}.agent_sessions`
-        SET
-            truth_score = @truth_score,
-            accuracy_score = @accuracy_score,
-            completeness_score = @completeness_score,
-            latency_score = @latency_score,
-            format_score = @format_score,
-            audit_status = @audit_status,
-            audited_at = CURRENT_TIMESTAMP(),
-            audited_by = @auditor_id,
-            escalated_to_llm = @escalated,
-            llm_report_id = @llm_report_id,
-            updated_at = CURRENT_TIMESTAMP()
-        WHERE session_id = @session_id
-        """
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("session_id", "STRING", session_id),
-                bigquery.ScalarQueryParameter("truth_score", "FLOAT64", scores.truth_score),
-                bigquery.ScalarQueryParameter("accuracy_score", "FLOAT64", scores.accuracy_score),
-                bigquery.ScalarQueryParameter("completeness_score", "FLOAT64", scores.completeness_score),
-                bigquery.ScalarQueryParameter("latency_score", "FLOAT64", scores.latency_score),
-                bigquery.ScalarQueryParameter("format_score", "FLOAT64", scores.format_score),
-                bigquery.ScalarQueryParameter("audit_status", "STRING", status.value),
-                bigquery.ScalarQueryParameter("auditor_id", "STRING", AUDITOR_ID),
-                bigquery.ScalarQueryParameter("escalated", "BOOL", escalated),
-                bigquery.ScalarQueryParameter("llm_report_id", "STRING", llm_report_id),
-            ]
+        """Update session with audit results (fenced on this worker's lease)."""
+        rejected = self.sessions.complete(
+            self.worker_id,
+            [self._status_update(session_id, scores, status, escalated, llm_report_id, lease_token)],
+            AUDITOR_ID,
         )
-        self.client.query(query, job_config=job_config).result()
+        if rejected:
+            logger.warning(f"Status for session {session_id} rejected: lease lost to another worker")
+
+    @staticmethod
+    def _status_update(session_id: str, scores: AuditScore, status: AuditStatus,
+                       escalated: bool, llm_report_id: Optional[str] = None, lease_token: Any = None) -> Dict:
+        """SessionStore.complete() / update_audited() row for one session."""
+        return {
+            "session_id": session_id,
+            "lease_token": lease_token,
+            "truth_score": scores.truth_score,
+            "accuracy_score": scores.accuracy_score,
+            "completeness_score": scores.completeness_score,
+            "latency_score": scores.latency_score,
+            "format_score": scores.format_score,
+            "audit_status": status.value,
+            "escalated": escalated,
+            "llm_report_id": llm_report_id,
+        }
+
+    def merge_session_statuses(self, results: List[AuditResult], leases: Dict[str, Any]) -> List[str]:
+        """
+        Apply a batch of audit results to agent_sessions in one write (a
+        single MERGE for BigQuery) that also releases their leases. Only
+        sessions still leased under the given tokens are updated; returns
+        the rejected session IDs.
+        """
+        updates = [
+            self._status_update(r.session_id, r.scores, r.status, r.escalate_to_llm,
+                                lease_token=leases[r.session_id])
+            for r in results
+        ]
+        rejected = self.sessions.complete(self.worker_id, updates, AUDITOR_ID)
+        if rejected:
+            logger.warning(f"{len(rejected)} session statuses rejected, lease lost to another worker: "
+                           f"{rejected[:10]}")
+        return rejected
 
     def send_notification(self, channels: List[str], users: List[str], message: str):
         """Send notifications via configured channels."""
@@ -493,27 +764,31 @@ class PythonAuditor:
         # For now, just log
         logger.info(f"NOTIFICATION [{channels}] to {users}: {message}")
 
-    def audit_session(self, session: Dict) -> AuditResult:
+    def evaluate_session(self, session: Dict, metrics: Optional[SessionMetrics] = None,
+                         scores: Optional[AuditScore] = None,
+                         triggered_rules: Optional[List[Dict]] = None,
+                         allow_escalation: bool = True) -> AuditPlan:
         """
-        Main audit function for a single session.
-
-        Returns AuditResult with scores, status, and actions taken.
+        Score a session and decide its status, audit events and agent
+        actions without writing anything. Batch callers pass the metrics,
+        scores and triggered rules they already computed.
         """
         session_id = session["session_id"]
         agent_id = session["agent_id"]
 
-        logger.info(f"Auditing session {session_id} for agent {agent_id}")
-
         # Extract metrics
-        metrics = self.extract_metrics(session)
+        metrics = metrics or self.extract_metrics(session)
 
         # Calculate scores
-        scores = self.calculate_scores(metrics)
-        logger.info(f"Scores: truth={scores.truth_score}, accuracy={scores.accuracy_score}")
+        scores = scores or self.calculate_scores(metrics)
 
         # Check rules
-        triggered_rules = self.check_rules(metrics, scores)
+        if triggered_rules is None:
+            triggered_rules = self.check_rules(metrics, scores)
         actions_taken = []
+        events = []
+        agent_actions = []
+        notifications = []
 
         # Determine status based on score
         if scores.truth_score >= 80:
@@ -526,89 +801,285 @@ class PythonAuditor:
         # Process triggered rules (in priority order)
         for rule in triggered_rules:
             action = rule["action"]
+            channels = rule.get("notify_channels", [])
+            users = rule.get("notify_users", [])
 
             if action == ActionType.DISABLE.value:
-                self.disable_agent(agent_id, rule["rule_name"])
-                self.create_audit_event(agent_id, session_id, "disable", rule, scores)
-                self.send_notification(
-                    rule.get("notify_channels", []),
-                    rule.get("notify_users", []),
-                    f"AGENT DISABLED: {agent_id} - {rule['rule_name']}"
-                )
+                agent_actions.append(("disable", rule["rule_name"]))
+                events.append(("disable", rule))
+                notifications.append((channels, users, f"AGENT DISABLED: {agent_id} - {rule['rule_name']}"))
                 actions_taken.append(f"disabled:{rule['rule_id']}")
                 status = AuditStatus.FAILED
                 break  # Stop after disable
 
             elif action == ActionType.PAUSE.value:
-                self.pause_agent(agent_id, rule["rule_name"])
-                self.create_audit_event(agent_id, session_id, "pause", rule, scores)
-                self.send_notification(
-                    rule.get("notify_channels", []),
-                    rule.get("notify_users", []),
-                    f"AGENT PAUSED: {agent_id} - {rule['rule_name']}"
-                )
+                agent_actions.append(("pause", rule["rule_name"]))
+                events.append(("pause", rule))
+                notifications.append((channels, users, f"AGENT PAUSED: {agent_id} - {rule['rule_name']}"))
                 actions_taken.append(f"paused:{rule['rule_id']}")
                 status = AuditStatus.FAILED
 
             elif action == ActionType.ALERT.value:
-                self.create_audit_event(agent_id, session_id, "alert", rule, scores)
-                self.send_notification(
-                    rule.get("notify_channels", []),
-                    rule.get("notify_users", []),
+                events.append(("alert", rule))
+                notifications.append((
+                    channels, users,
                     f"AGENT ALERT: {agent_id} - {rule['rule_name']} (score: {scores.truth_score})"
-                )
+                ))
                 actions_taken.append(f"alerted:{rule['rule_id']}")
 
             elif action == ActionType.WARN.value:
-                self.create_audit_event(agent_id, session_id, "warning", rule, scores)
+                events.append(("warning", rule))
                 actions_taken.append(f"warned:{rule['rule_id']}")
 
             else:  # log
                 actions_taken.append(f"logged:{rule['rule_id']}")
 
         # Check if should escalate to LLM
-        escalate, escalation_reason = self.should_escalate_to_llm(metrics, scores)
+        if allow_escalation:
+            escalate, escalation_reason = self.should_escalate_to_llm(metrics, scores)
+        else:
+            escalate, escalation_reason = False, None
 
         if escalate:
             status = AuditStatus.ESCALATED
-            self.create_audit_event(
-                agent_id, session_id, "escalate",
+            events.append((
+                "escalate",
                 {"rule_name": escalation_reason, "actual_value": None,
                  "threshold_value": None, "action": "escalate"},
-                scores
-            )
+            ))
             actions_taken.append(f"escalated:{escalation_reason}")
-            logger.info(f"Escalated session {session_id} to LLM Auditor: {escalation_reason}")
-
-        # Log score
-        self.log_score(session_id, agent_id, scores)
-
-        # Update session
-        self.update_session_audit_status(session_id, scores, status, escalate)
-
-        return AuditResult(
-            session_id=session_id,
-            agent_id=agent_id,
-            scores=scores,
-            status=status,
-            triggered_rules=triggered_rules,
-            actions_taken=actions_taken,
-            escalate_to_llm=escalate,
-            escalation_reason=escalation_reason,
+
+        return AuditPlan(
+            result=AuditResult(
+                session_id=session_id,
+                agent_id=agent_id,
+                scores=scores,
+                status=status,
+                triggered_rules=triggered_rules,
+                actions_taken=actions_taken,
+                escalate_to_llm=escalate,
+                escalation_reason=escalation_reason,
+            ),
+            events=events,
+            agent_actions=agent_actions,
+            notifications=notifications,
         )
 
-    def run_batch(self, limit: int = 100) -> List[AuditResult]:
-        """Audit all pending sessions."""
-        sessions = self.get_pending_sessions(limit)
-        logger.info(f"Found {len(sessions)} pending sessions to audit")
+    def audit_session(self, session: Dict) -> AuditResult:
+        """
+        Main audit function for a single session.
+
+        Returns AuditResult with scores, status, and actions taken.
+        """
+        logger.info(f"Auditing session {session['session_id']} for agent {session['agent_id']}")
 
-        results = []
+        plan = self.evaluate_session(session)
+        result = plan.result
+        session_id, agent_id, scores = result.session_id, result.agent_id, result.scores
+        logger.info(f"Scores: truth={scores.truth_score}, accuracy={scores.accuracy_score}")
+
+        # Nothing is written unless this worker holds the session's lease
+        lease_token = self.hold_leases([session]).get(session_id)
+        if lease_token is None:
+            raise LeaseLost(session_id)
+
+        try:
+            for action, reason in plan.agent_actions:
+                if action == "disable":
+                    self.disable_agent(agent_id, reason)
+                else:
+                    self.pause_agent(agent_id, reason)
+
+            for event_type, rule in plan.events:
+                self.create_audit_event(agent_id, session_id, event_type, rule, scores)
+
+            for channels, users, message in plan.notifications:
+                self.send_notification(channels, users, message)
+
+            if result.escalate_to_llm:
+                logger.info(f"Escalated session {session_id} to LLM Auditor: {result.escalation_reason}")
+
+            # Log score
+            self.log_score(session_id, agent_id, scores)
+
+            # Update session
+            self.update_session_audit_status(session_id, scores, result.status, result.escalate_to_llm,
+                                             lease_token=lease_token)
+        except Exception:
+            self.release_sessions([session_id])
+            raise
+        self._maintain_baselines()
+
+        return result
+
+    def evaluate_batch(self, sessions: List[Dict], allow_escalation: bool = True) -> List[Tuple[Dict, AuditPlan]]:
+        """evaluate_session for a batch, with vectorized scoring and one rule pass."""
+        extracted = []
         for session in sessions:
             try:
-                result = self.audit_session(session)
-                results.append(result)
+                extracted.append((session, self.extract_metrics(session)))
+            except Exception as e:
+                logger.error(f"Error auditing session {session.get('session_id')}: {e}")
+        all_metrics = [metrics for _, metrics in extracted]
+        all_scores = self.calculate_scores_batch(all_metrics)
+        all_triggered = self.check_rules_batch(all_metrics, all_scores)
+
+        evaluated = []
+        for (session, metrics), scores, triggered in zip(extracted, all_scores, all_triggered):
+            try:
+                evaluated.append((session, self.evaluate_session(session, metrics, scores, triggered, allow_escalation)))
             except Exception as e:
                 logger.error(f"Error auditing session {session['session_id']}: {e}")
+        return evaluated
+
+    def audit_sessions_bulk(self, sessions: List[Dict]) -> List[AuditResult]:
+        """
+        Audit a batch in memory, renew the batch's leases, then write it for
+        the sessions still held: one streaming insert per table, one MERGE
+        for session statuses, and at most one registry update per agent
+        (disable wins over pause).
+        """
+        evaluated = self.evaluate_batch(sessions)
+        if not evaluated:
+            return []
+        leases = self.hold_leases([session for session, _ in evaluated])
+        plans = [plan for _, plan in evaluated if plan.result.session_id in leases]
+        if len(plans) < len(evaluated):
+            logger.warning(f"Lease lost on {len(evaluated) - len(plans)} sessions before writing; skipped them")
+        if not plans:
+            return []
+
+        score_rows = [self._score_row(p.result.session_id, p.result.agent_id, p.result.scores) for p in plans]
+        errors = self.insert_rows("agent_scores", score_rows)
+        if errors:
+            logger.error(f"Failed to log {len(errors)} of {len(score_rows)} scores: {errors[:5]}")
+        failed = {e["index"] for e in errors}
+        for i, plan in enumerate(plans):
+            if i not in failed:
+                self.baselines.add(plan.result.agent_id, plan.result.scores.truth_score)
+
+        event_rows = [
+            self._event_row(p.result.agent_id, p.result.session_id, event_type, rule, p.result.scores)
+            for p in plans
+            for event_type, rule in p.events
+        ]
+        if event_rows:
+            errors = self.insert_rows("audit_events", event_rows)
+            if errors:
+                logger.error(f"Failed to create {len(errors)} of {len(event_rows)} audit events: {errors[:5]}")
+
+        self.merge_session_statuses([p.result for p in plans], leases)
+
+        agent_actions: Dict[str, Tuple[str, str]] = {}
+        for plan in plans:
+            for action, reason in plan.agent_actions:
+                current = agent_actions.get(plan.result.agent_id)
+                if current is None or (action == "disable" and current[0] != "disable"):
+                    agent_actions[plan.result.agent_id] = (action, reason)
+        for agent_id, (action, reason) in agent_actions.items():
+            if action == "disable":
+                self.disable_agent(agent_id, reason)
+            else:
+                self.pause_agent(agent_id, reason)
+
+        for plan in plans:
+            for channels, users, message in plan.notifications:
+                self.send_notification(channels, users, message)
+
+        logger.info(f"Bulk wrote {len(score_rows)} scores, {len(event_rows)} events, "
+                    f"{len(agent_actions)} agent status changes")
+        return [p.result for p in plans]
+
+    def rescore_batch(self, sessions: List[Dict], score_tag: str) -> List[AuditResult]:
+        """
+        Re-score already audited sessions with the current weights,
+        thresholds and rules through the bulk write path: one agent_scores
+        MERGE and one session-status write. Nothing else happens - no
+        audit events, pauses, notifications, LLM escalations or baseline
+        updates. Sessions already escalated keep their escalation and LLM
+        report. Score IDs derive from score_tag + session_id and the MERGE
+        is keyed on them, so a re-run batch overwrites its own rows.
+        """
+        evaluated = self.evaluate_batch(sessions, allow_escalation=False)
+        if not evaluated:
+            return []
+
+        score_rows = [
+            self._score_row(
+                plan.result.session_id, plan.result.agent_id, plan.result.scores, criteria="rescore",
+                score_id=f"RESCORE-{uuid.uuid5(uuid.NAMESPACE_OID, score_tag + plan.result.session_id).hex[:12].upper()}",
+            )
+            for _, plan in evaluated
+        ]
+        self.merge_scores(score_rows)
+
+        updates = []
+        for session, plan in evaluated:
+            result = plan.result
+            if session.get("escalated_to_llm"):
+                result.status, result.escalate_to_llm = AuditStatus.ESCALATED, True
+            updates.append(self._status_update(
+                result.session_id, result.scores, result.status, result.escalate_to_llm,
+                session.get("llm_report_id")))
+        self.sessions.update_audited(updates, AUDITOR_ID)
+        return [plan.result for _, plan in evaluated]
+
+    def audit_sessions_keyed(self, sessions: List[Dict], workers: int = AUDIT_WORKERS) -> List[AuditResult]:
+        """
+        audit_session for every session on a KeyedExecutor keyed by agent_id:
+        different agents are audited concurrently, each agent's sessions run
+        in claim order. Results come back in input order.
+        """
+        with KeyedExecutor(max_workers=workers, thread_name_prefix="audit") as executor:
+            futures = [(session, executor.submit(session["agent_id"], self.audit_session, session))
+                       for session in sessions]
+            busiest = executor.peak_depths.most_common(3)
+            if busiest:
+                logger.info(f"Audit queues: {len(executor.peak_depths)} agents, busiest "
+                            + ", ".join(f"{agent}={depth}" for agent, depth in busiest))
+
+            results = []
+            for session, future in futures:
+                try:
+                    results.append(future.result())
+                except LeaseLost:
+                    logger.warning(f"Skipped session {session['session_id']}: lease lost to another worker")
+                except Exception as e:
+                    logger.error(f"Error auditing session {session['session_id']}: {e}")
+        return results
+
+    def run_batch(self, limit: int = 100, bulk: bool = True, workers: int = AUDIT_WORKERS) -> List[AuditResult]:
+        """
+        Audit all pending sessions: bulk writes by default, otherwise
+        per-session audits on `workers` threads keyed by agent.
+        """
+        started = time.perf_counter()
+        sessions = self.claim_sessions(limit)
+        # Claims come oldest first, so the first one is the audit lag
+        lag = session_age_seconds(sessions[0].get("ended_at")) if sessions else 0.0
+        logger.info(f"Claimed {len(sessions)} pending sessions to audit (audit lag {lag:.0f}s)")
+
+        try:
+            if bulk:
+                results = self.audit_sessions_bulk(sessions)
+            elif workers > 1:
+                results = self.audit_sessions_keyed(sessions, workers)
+            else:
+                results = []
+                for session in sessions:
+                    try:
+                        result = self.audit_session(session)
+                        results.append(result)
+                    except LeaseLost:
+                        logger.warning(f"Skipped session {session['session_id']}: lease lost to another worker")
+                    except Exception as e:
+                        logger.error(f"Error auditing session {session['session_id']}: {e}")
+        except Exception:
+            self.release_sessions([s["session_id"] for s in sessions])
+            raise
+        # Sessions that failed go back to the queue now instead of when their lease runs out
+        audited = {r.session_id for r in results}
+        self.release_sessions([s["session_id"] for s in sessions if s["session_id"] not in audited])
 
         # Summary
         passed = sum(1 for r in results if r.status == AuditStatus.PASSED)
@@ -617,22 +1088,51 @@ class PythonAuditor:
         escalated = sum(1 for r in results if r.escalate_to_llm)
 
         logger.info(f"Batch complete: {passed} passed, {warned} warnings, {failed} failed, {escalated} escalated")
-
+        self._maintain_baselines()
+        if self.baselines.dirty:
+            self.baselines.save()
+
+        self.last_batch = BatchRun(
+            fetched=len(sessions),
+            audited=len(results),
+            audit_lag_seconds=round(lag, 1),
+            elapsed_seconds=round(time.perf_counter() - started, 3),
+            finished_at=datetime.utcnow().isoformat() + "Z",
+        )
         return results
 
-    def run_daemon(self, interval_seconds: int = 60):
-        """Run continuously, checking for new sessions."""
-        logger.info(f"Starting daemon mode, checking every {interval_seconds}s")
+    def run_daemon(self, interval_seconds: int = 60, limit: int = 100, bulk: bool = True,
+                   max_interval: float = MAX_IDLE_INTERVAL, workers: int = AUDIT_WORKERS):
+        """
+        Run continuously, checking for new sessions.
+
+        A full batch means more sessions are waiting, so the next batch
+        starts at once. A partial batch drained the queue: wait
+        interval_seconds. Empty polls (and errors) back off by
+        IDLE_BACKOFF_FACTOR up to max_interval.
+        """
+        logger.info(f"Starting daemon mode, polling every {interval_seconds}s (idle backoff up to {max_interval}s)")
+        idle_delay = interval_seconds
 
         while True:
             try:
-                results = self.run_batch()
-                if not results:
-                    logger.debug("No pending sessions")
+                self.run_batch(limit, bulk, workers)
+                fetched = self.last_batch.fetched
             except Exception as e:
                 logger.error(f"Daemon error: {e}")
+                fetched = 0
 
-            time.sleep(interval_seconds)
+            if fetched >= limit:
+                idle_delay = interval_seconds
+                continue  # backlog: drain without sleeping
+
+            if fetched:
+                delay, idle_delay = interval_seconds, interval_seconds
+            else:
+                delay = idle_delay
+                idle_delay = min(idle_delay * IDLE_BACKOFF_FACTOR, max_interval)
+                logger.debug(f"No pending sessions, next poll in {delay}s")
+            time.sleep(delay)
 
 
 def main():
@@ -641,16 +1141,65 @@ def main():
     parser.add_argument("--batch", action="store_true", help="Audit all pending sessions")
     parser.add_argument("--daemon", action="store_true", help="Run continuously")
     parser.add_argument("--interval", type=int, default=60, help="Daemon check interval (seconds)")
+    parser.add_argument("--max-interval", type=int, default=MAX_IDLE_INTERVAL,
+                        help="Longest daemon wait after empty polls (seconds)")
     parser.add_argument("--limit", type=int, default=100, help="Max sessions per batch")
+    parser.add_argument("--rules-ttl", type=float, default=RULES_CACHE_TTL,
+                        help="Seconds before pause rules are reloaded")
+    parser.add_argument("--workers", type=int,
+                        help=f"Threads for --serial audits (default {AUDIT_WORKERS}; sessions of one agent "
+                             f"stay in order) or parallel --rescore chunks (default 4)")
+    parser.add_argument("--worker-id", help="Lease owner name (default host-pid-random)")
+    parser.add_argument("--lease", type=float, default=LEASE_SECONDS, help="Session lease length (seconds)")
+    parser.add_argument("--baselines", help=f"Baselines cache file (default {BASELINES_PATH}); "
+                                            f"a cache of agent_scores, so workers may share it")
+    parser.add_argument("--init-leases", action="store_true",
+                        help="Add the claimed_by / lease_expires_at columns to agent_sessions and exit")
+    parser.add_argument("--serial", action="store_true",
+                        help="Audit and write one session at a time instead of in bulk")
+    parser.add_argument("--rescore", action="store_true",
+                        help="Re-score audited sessions in --since/--until with the current config")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="Re-score start (ISO date/time, UTC)")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="Re-score end (default now)")
+    parser.add_argument("--chunk-hours", type=float, default=24, help="Re-score chunk size on ended_at")
+    parser.add_argument("--max-rate", type=float, default=1000,
+                        help="Re-score sessions per second across all chunks (0 = unthrottled)")
+    parser.add_argument("--checkpoint", help="Re-score checkpoint file")
 
     args = parser.parse_args()
 
-    auditor = PythonAuditor()
-
-    if args.session_id:
+    # A re-score pins the rules it started with, so the whole run matches one config
+    auditor = PythonAuditor(cache_ttl=float("inf") if args.rescore else args.rules_ttl,
+                            worker_id=args.worker_id, lease_seconds=args.lease, baselines_path=args.baselines)
+
+    if args.rescore:
+        from rescore import CHECKPOINT_PATH, RESCORE_WORKERS, Rescorer
+
+        if not args.since:
+            parser.error("--rescore needs --since")
+        summary = Rescorer(
+            auditor,
+            since=args.since,
+            until=args.until or datetime.utcnow(),
+            chunk_hours=args.chunk_hours,
+            workers=args.workers or RESCORE_WORKERS,
+            max_rate=args.max_rate,
+            checkpoint_path=args.checkpoint or CHECKPOINT_PATH,
+        ).run()
+        print(json.dumps(summary, indent=2))
+
+    elif args.init_leases:
+        auditor.sessions.ensure_schema()
+        print("Lease columns ready on agent_sessions")
+
+    elif args.session_id:
         session = auditor.get_session(args.session_id)
         if session:
-            result = auditor.audit_session(session)
+            try:
+                result = auditor.audit_session(session)
+            except LeaseLost:
+                print(f"Session {args.session_id} is already audited or being audited by another worker")
+                return
             print(json.dumps({
                 "session_id": result.session_id,
                 "agent_id": result.agent_id,
@@ -663,10 +1212,11 @@ def main():
             print(f"Session {args.session_id} not found")
 
     elif args.daemon:
-        auditor.run_daemon(args.interval)
+        auditor.run_daemon(args.interval, args.limit, bulk=not args.serial,
+                           max_interval=args.max_interval, workers=args.workers or AUDIT_WORKERS)
 
     else:  # Default to batch
-        results = auditor.run_batch(args.limit)
+        results = auditor.run_batch(args.limit, bulk=not args.serial, workers=args.workers or AUDIT_WORKERS)
         print(f"Audited {len(results)} sessions")
 
 
@@ -0,0 +1,195 @@
+"""
+CAO-AUD-001: Historical Re-score
+Re-scores already audited agent_sessions with the current SCORING_WEIGHTS,
+LATENCY_THRESHOLDS and pause rules, e.g. after a weight change.
+
+The [since, until) range is cut into time chunks on ended_at. Chunks run in
+parallel; each one pages through its sessions in (ended_at, session_id)
+order and writes every page through PythonAuditor.rescore_batch (bulk
+path). After each page the chunk's cursor goes to a checkpoint file, so a
+crashed run resumes where it stopped; at most the last page is repeated,
+and since re-scores are MERGEd on their deterministic score IDs the repeat
+overwrites the same rows instead of adding new ones. A shared
+rate limit keeps the backfill from crowding out live auditing.
+
+Usage:
+    python python_auditor.py --rescore --since 2025-01-01 [--until 2025-07-01]
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from rolling_baselines import STATE_DIR
+
+logger = logging.getLogger("CAO-AUD-001")
+
+CHUNK_HOURS = 24
+RESCORE_PAGE_SIZE = 2000
+RESCORE_WORKERS = 4
+MAX_RATE = 1000  # sessions per second across all chunks
+CHECKPOINT_PATH = os.getenv("AUDITOR_RESCORE_CHECKPOINT", str(STATE_DIR / "rescore_checkpoint.json"))
+
+
+def config_fingerprint(weights: Dict, latency_thresholds: Dict, rules: List[Dict]) -> str:
+    """Identifies the scoring config a re-score run applies."""
+    config = {
+        "weights": weights,
+        "latency_thresholds": latency_thresholds,
+        "rules": [
+            [r.get("rule_id"), r.get("metric"), r.get("operator"), r.get("threshold_value"), r.get("action")]
+            for r in rules
+        ],
+    }
+    return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+class Throttle:
+    """Shared sessions-per-second budget; acquire() sleeps until a batch fits."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, n: int):
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(self._next, now)
+            self._next = start + n / self.rate
+        if start > now:
+            time.sleep(start - now)
+
+
+class Checkpoint:
+    """
+    Per-chunk progress in a JSON file, keyed by chunk start:
+    {"end": iso, "done": bool, "after": [iso, id], "sessions": n}.
+    A file written for a different config, start or chunk size is ignored
+    and replaced. The end of the range is not part of the run key: when a
+    resumed run reaches further (e.g. --until defaulting to now), a chunk
+    whose end moved carries on from its cursor instead of starting over.
+    """
+
+    def __init__(self, path: str, run_key: Dict):
+        self.path = Path(path)
+        self.run_key = run_key
+        self.chunks: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        if self.path.exists():
+            with open(self.path) as f:
+                data = json.load(f)
+            if data.get("run") == run_key:
+                self.chunks = data.get("chunks", {})
+                logger.info(f"Resuming re-score from {self.path}: "
+                            f"{sum(1 for c in self.chunks.values() if c.get('done'))} chunks done")
+            else:
+                logger.warning(f"Ignoring checkpoint {self.path}: written for a different run")
+
+    def get(self, chunk: str) -> Dict:
+        with self._lock:
+            return dict(self.chunks.get(chunk, {}))
+
+    def update(self, chunk: str, end: datetime, after: Optional[Tuple[datetime, str]], sessions: int, done: bool):
+        with self._lock:
+            self.chunks[chunk] = {
+                "end": end.isoformat(),
+                "done": done,
+                "after": [after[0].isoformat(), after[1]] if after else None,
+                "sessions": sessions,
+            }
+            data = {"run": self.run_key, "chunks": self.chunks}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".rescore-")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=1)
+            os.replace(tmp, self.path)
+
+
+class Rescorer:
+    """Runs a checkpointed, throttled re-score over a time range."""
+
+    def __init__(self, auditor, since: datetime, until: datetime, chunk_hours: float = CHUNK_HOURS,
+                 workers: int = RESCORE_WORKERS, page_size: int = RESCORE_PAGE_SIZE,
+                 max_rate: float = MAX_RATE, checkpoint_path: str = CHECKPOINT_PATH):
+        from python_auditor import LATENCY_THRESHOLDS, SCORING_WEIGHTS
+
+        self.auditor = auditor
+        self.since = since if since.tzinfo else since.replace(tzinfo=timezone.utc)
+        self.until = until if until.tzinfo else until.replace(tzinfo=timezone.utc)
+        self.chunk = timedelta(hours=chunk_hours)
+        self.workers = workers
+        self.page_size = page_size
+        self.throttle = Throttle(max_rate)
+        self.fingerprint = config_fingerprint(SCORING_WEIGHTS, LATENCY_THRESHOLDS, auditor.pause_rules)
+        self.checkpoint = Checkpoint(checkpoint_path, {
+            "fingerprint": self.fingerprint,
+            "since": self.since.isoformat(),
+            "chunk_hours": chunk_hours,
+        })
+        self.rescored = 0
+        self._count_lock = threading.Lock()
+
+    def chunks(self) -> List[Tuple[datetime, datetime]]:
+        bounds = []
+        start = self.since
+        while start < self.until:
+            bounds.append((start, min(start + self.chunk, self.until)))
+            start += self.chunk
+        return bounds
+
+    def _run_chunk(self, start: datetime, end: datetime) -> int:
+        key = start.isoformat()
+        state = self.checkpoint.get(key)
+        if state.get("done") and state.get("end") == end.isoformat():
+            return 0
+        after = None
+        if state.get("after"):
+            after = (datetime.fromisoformat(state["after"][0]), state["after"][1])
+        count = state.get("sessions", 0)
+
+        while True:
+            sessions = self.auditor.sessions.scan(start, end, self.page_size, after)
+            if not sessions:
+                break
+            self.throttle.acquire(len(sessions))
+            self.auditor.rescore_batch(sessions, self.fingerprint)
+            last = sessions[-1]
+            after = (last["ended_at"], last["session_id"])
+            count += len(sessions)
+            with self._count_lock:
+                self.rescored += len(sessions)
+            done = len(sessions) < self.page_size
+            self.checkpoint.update(key, end, after, count, done)
+            if done:
+                return count
+        self.checkpoint.update(key, end, after, count, True)
+        return count
+
+    def run(self) -> Dict:
+        started = time.perf_counter()
+        bounds = self.chunks()
+        logger.info(f"Re-scoring {self.since:%Y-%m-%d %H:%M} .. {self.until:%Y-%m-%d %H:%M} "
+                    f"in {len(bounds)} chunks on {self.workers} workers (config {self.fingerprint})")
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="rescore") as pool:
+            list(pool.map(lambda b: self._run_chunk(*b), bounds))
+        elapsed = time.perf_counter() - started
+        summary = {
+            "fingerprint": self.fingerprint,
+            "chunks": len(bounds),
+            "sessions_rescored": self.rescored,
+            "elapsed_seconds": round(elapsed, 2),
+            "sessions_per_second": round(self.rescored / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+        logger.info(f"Re-score complete: {summary}")
+        return summary
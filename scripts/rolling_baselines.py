@@ -0,0 +1,184 @@
+"""
+CAO-AUD-001: Rolling Baselines
+Per-agent truth-score baselines kept incrementally as a ring of daily
+(sum, count) buckets. Each logged score updates today's bucket; the
+baseline is the mean over the last BASELINE_DAYS buckets.
+
+agent_scores stays the source of truth; the rings are a cache of its daily
+totals. sync() overwrites every bucket from the last synced day on with
+totals read back from agent_scores, so scores written by other workers or
+while this process was down are folded in. Days before the synced day are
+complete and never re-read. The rings are persisted as a small JSON file,
+so startup reads kilobytes and re-queries only the days since the last
+sync instead of scanning 30 days of agent_scores. Because every load
+re-syncs, processes sharing the file lose nothing when one overwrites
+another's save.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger("CAO-AUD-001")
+
+BASELINE_DAYS = 30
+SAVE_INTERVAL = 10.0    # seconds between opportunistic saves
+SYNC_INTERVAL = 900.0   # seconds between re-reads of recent days from agent_scores
+# Outside the source tree: $AUDITOR_STATE_DIR, else the user state directory
+STATE_DIR = Path(os.getenv("AUDITOR_STATE_DIR") or (
+    Path(os.getenv("XDG_STATE_HOME") or Path.home() / ".local" / "state") / "cao-auditor"
+))
+BASELINES_PATH = os.getenv("AUDITOR_BASELINES_PATH", str(STATE_DIR / "auditor_baselines.json"))
+
+
+def utc_today() -> date:
+    """Bucket days are UTC, matching DATE(created_at) in BigQuery."""
+    return datetime.utcnow().date()
+
+
+class RollingBaselines:
+    """
+    Slot `day % days` of an agent's ring holds [day, sum, count] for that
+    day (day = date.toordinal()); a slot whose day has aged out of the
+    window is reset on the next write and ignored on reads.
+    """
+
+    def __init__(self, days: int = BASELINE_DAYS, path: Optional[str] = BASELINES_PATH):
+        self.days = days
+        self.path = Path(path) if path else None
+        self.rings: Dict[str, List[List[float]]] = {}
+        self.synced_day: Optional[int] = None   # ordinal; earlier days are complete
+        self.synced_at = 0.0                    # time.monotonic() of the last sync
+        self.dirty = False
+        self.saved_at = 0.0
+        self._lock = threading.Lock()
+
+    def _ring(self, agent_id: str) -> List[List[float]]:
+        ring = self.rings.get(agent_id)
+        if ring is None:
+            ring = [[0, 0.0, 0] for _ in range(self.days)]
+            self.rings[agent_id] = ring
+        return ring
+
+    def add(self, agent_id: str, score: float, day: Optional[date] = None, count: int = 1):
+        """Add `count` scores summing to `score` to an agent's bucket for `day` (default today)."""
+        ordinal = (day or utc_today()).toordinal()
+        with self._lock:
+            slot = self._ring(agent_id)[ordinal % self.days]
+            if slot[0] != ordinal:
+                if slot[0] > ordinal:
+                    return  # older than the window already covered by this slot
+                slot[:] = [ordinal, 0.0, 0]
+            slot[1] += score
+            slot[2] += count
+            self.dirty = True
+
+    def baseline(self, agent_id: str, today: Optional[date] = None) -> Optional[float]:
+        """Mean score over the window ending today, or None with no scores."""
+        ring = self.rings.get(agent_id)
+        if ring is None:
+            return None
+        oldest = (today or utc_today()).toordinal() - self.days + 1
+        total, count = 0.0, 0
+        for day, day_sum, day_count in ring:
+            if day >= oldest:
+                total += day_sum
+                count += day_count
+        return total / count if count else None
+
+    # Mapping-style access, so callers can treat this like the old dict
+
+    def get(self, agent_id: str, default: Optional[float] = None) -> Optional[float]:
+        value = self.baseline(agent_id)
+        return default if value is None else value
+
+    def __len__(self) -> int:
+        return sum(1 for agent_id in self.rings if self.baseline(agent_id) is not None)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {agent_id: value for agent_id in list(self.rings)
+                if (value := self.baseline(agent_id)) is not None}
+
+    # Persistence
+
+    def load(self) -> bool:
+        """Read the rings from disk; False if there is no file to read."""
+        if not self.path or not self.path.exists():
+            return False
+        with open(self.path) as f:
+            data = json.load(f)
+        with self._lock:
+            self.rings = {}
+            for agent_id, buckets in data.get("agents", {}).items():
+                for day, day_sum, day_count in buckets:
+                    self._ring(agent_id)[day % self.days] = [day, day_sum, day_count]
+            self.synced_day = data.get("synced_day")
+            self.dirty = False
+        return True
+
+    def save(self):
+        """Write non-empty buckets to disk atomically (temp file + rename)."""
+        if not self.path:
+            return
+        with self._lock:
+            data = {
+                "days": self.days,
+                "synced_day": self.synced_day,
+                "agents": {
+                    agent_id: [list(slot) for slot in ring if slot[2]]
+                    for agent_id, ring in self.rings.items()
+                },
+            }
+            self.dirty = False
+            self.saved_at = time.monotonic()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".baselines-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def save_if_due(self, interval: float = SAVE_INTERVAL):
+        """save() when there are unsaved scores and the last save is `interval` seconds old."""
+        if self.dirty and time.monotonic() - self.saved_at >= interval:
+            self.save()
+
+    # Sync with agent_scores
+
+    def sync_start(self, today: Optional[date] = None) -> date:
+        """First day sync() needs: the last synced day, or the whole window if never synced."""
+        oldest = (today or utc_today()).toordinal() - self.days + 1
+        return date.fromordinal(max(self.synced_day or oldest, oldest))
+
+    def sync_due(self, interval: float = SYNC_INTERVAL) -> bool:
+        return time.monotonic() - self.synced_at >= interval
+
+    def sync(self, daily_totals: Iterable[Tuple[str, date, float, int]], since: date,
+             today: Optional[date] = None):
+        """
+        Replace every bucket from `since` on with (agent_id, day, sum, count)
+        rows read from agent_scores for those days. Days before today are
+        complete afterwards, so the next sync starts at today.
+        """
+        start = since.toordinal()
+        with self._lock:
+            for ring in self.rings.values():
+                for slot in ring:
+                    if slot[0] >= start:
+                        slot[:] = [0, 0.0, 0]
+            for agent_id, day, day_sum, day_count in daily_totals:
+                ordinal = day.toordinal()
+                if ordinal >= start:
+                    self._ring(agent_id)[ordinal % self.days] = [ordinal, day_sum, day_count]
+            self.synced_day = (today or utc_today()).toordinal()
+            self.synced_at = time.monotonic()
+            self.dirty = True
@@ -0,0 +1,128 @@
+"""
+CAO-AUD-001: Compiled Pause Rules
+Compiles agent_pause_rules once into per-metric, per-operator groups with
+sorted thresholds. For a given metric value, the triggered rules of a group
+form a contiguous run of its sorted thresholds, found with one bisect, so a
+check costs O(log n) per group instead of a pass over every rule. Triggered
+rules come back in the original (priority) order.
+
+Whole batches are evaluated the same way with np.searchsorted.
+"""
+
+import logging
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger("CAO-AUD-001")
+
+RULE_METRICS = ("truth_score", "accuracy_score", "error_rate", "latency_ms")
+
+# Which side of the sorted thresholds triggers, and where the run starts
+# ("left"/"right" = bisect_left/bisect_right of the actual value)
+OPERATORS = {
+    "lt": ("suffix", "right"),    # actual < threshold
+    "lte": ("suffix", "left"),    # actual <= threshold
+    "gt": ("prefix", "left"),     # actual > threshold
+    "gte": ("prefix", "right"),   # actual >= threshold
+    "eq": ("range", None),        # actual == threshold
+}
+
+
+@dataclass
+class RuleGroup:
+    """Rules sharing a metric and operator, sorted by threshold."""
+    metric: str
+    operator: str
+    thresholds: List[float] = field(default_factory=list)
+    rule_indexes: List[int] = field(default_factory=list)
+
+    def triggered(self, actual: float) -> List[int]:
+        kind, side = OPERATORS[self.operator]
+        if kind == "range":
+            return self.rule_indexes[bisect_left(self.thresholds, actual):bisect_right(self.thresholds, actual)]
+        cut = (bisect_left if side == "left" else bisect_right)(self.thresholds, actual)
+        return self.rule_indexes[cut:] if kind == "suffix" else self.rule_indexes[:cut]
+
+
+class CompiledRules:
+    """Indexed, read-only view of a pause-rule list."""
+
+    def __init__(self, rules: List[Dict]):
+        self.rules = list(rules)
+        pending: Dict[Tuple[str, str], List[Tuple[float, int]]] = {}
+        for index, rule in enumerate(self.rules):
+            metric, operator, threshold = rule.get("metric"), rule.get("operator"), rule.get("threshold_value")
+            if metric not in RULE_METRICS or operator not in OPERATORS:
+                continue  # check_rules never matched these
+            if threshold is None:
+                logger.warning(f"Skipping rule {rule.get('rule_id')}: no threshold_value")
+                continue
+            pending.setdefault((metric, operator), []).append((threshold, index))
+
+        self.by_metric: Dict[str, List[RuleGroup]] = {}
+        for (metric, operator), entries in pending.items():
+            entries.sort()
+            self.by_metric.setdefault(metric, []).append(RuleGroup(
+                metric=metric,
+                operator=operator,
+                thresholds=[threshold for threshold, _ in entries],
+                rule_indexes=[index for _, index in entries],
+            ))
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def triggered_indexes(self, values: Dict[str, float]) -> List[int]:
+        """Indexes of the rules triggered by one session's metric values, in rule order."""
+        hits = []
+        for metric, groups in self.by_metric.items():
+            actual = values[metric]
+            for group in groups:
+                hits.extend(group.triggered(actual))
+        hits.sort()
+        return hits
+
+    def triggered(self, values: Dict[str, float]) -> List[Dict]:
+        """Triggered rules with their actual_value, in priority order."""
+        return [
+            {**self.rules[i], "actual_value": values[self.rules[i]["metric"]]}
+            for i in self.triggered_indexes(values)
+        ]
+
+    def triggered_matrix(self, columns: Dict) -> "np.ndarray":
+        """
+        Boolean (sessions x rules) matrix for a batch, where `columns` maps
+        each RULE_METRICS name to a NumPy array of per-session values.
+        """
+        import numpy as np
+
+        n = len(next(iter(columns.values()))) if columns else 0
+        matrix = np.zeros((n, len(self.rules)), dtype=bool)
+        for metric, groups in self.by_metric.items():
+            actual = np.asarray(columns[metric], dtype=np.float64)
+            for group in groups:
+                thresholds = np.asarray(group.thresholds, dtype=np.float64)
+                positions = np.arange(len(thresholds))[None, :]
+                kind, side = OPERATORS[group.operator]
+                if kind == "range":
+                    left = np.searchsorted(thresholds, actual, side="left")[:, None]
+                    right = np.searchsorted(thresholds, actual, side="right")[:, None]
+                    mask = (positions >= left) & (positions < right)
+                else:
+                    cut = np.searchsorted(thresholds, actual, side=side)[:, None]
+                    mask = positions >= cut if kind == "suffix" else positions < cut
+                matrix[:, group.rule_indexes] = mask
+        return matrix
+
+    def triggered_batch(self, columns: Dict) -> List[List[Dict]]:
+        """triggered() for every session in a batch, from one matrix evaluation."""
+        import numpy as np
+
+        matrix = self.triggered_matrix(columns)
+        values = {metric: np.asarray(column).tolist() for metric, column in columns.items()}
+        results: List[List[Dict]] = [[] for _ in range(matrix.shape[0])]
+        for row, index in zip(*np.nonzero(matrix)):
+            rule = self.rules[index]
+            results[row].append({**rule, "actual_value": values[rule["metric"]][row]})
+        return results
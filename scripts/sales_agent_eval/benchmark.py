@@ -0,0 +1,115 @@
+"""
+Sales Analytics Benchmark
+Times each analytics path (EventFrame build, rollup build, turnaround and
+pipeline builds, incremental updates, the ten CEO answers) on synthetic
+histories of growing size and prints how each one scales.
+
+Usage:
+    python benchmark.py                                  # 10^3 .. 10^5 events
+    python benchmark.py --sizes 1000 100000 1000000 --output bench.json
+"""
+
+import argparse
+import json
+import logging
+import math
+import time
+from datetime import date
+from typing import Callable, Dict, List
+
+from event_frame import EventFrame
+from rollup import SalesRollup
+from turnaround import TurnaroundEngine
+from pipeline import BidPipeline
+from eval_runner import CEO_QUESTIONS, SalesAgentEvaluator
+from synthetic_data import generate_events
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+INCREMENTAL_BATCH = 1_000
+
+
+def timed(fn: Callable) -> float:
+    """Seconds taken by one call."""
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def bench_size(events: List[Dict], extra: List[Dict]) -> Dict[str, float]:
+    """Seconds per analytics path for one history."""
+    results = {}
+    holder = {}
+
+    results["frame_build"] = timed(lambda: holder.__setitem__("frame", EventFrame(events)))
+    results["rollup_build"] = timed(lambda: holder.__setitem__("rollup", SalesRollup.from_frame(holder["frame"])))
+    results["turnaround_build"] = timed(lambda: holder.__setitem__("turnaround", TurnaroundEngine.from_events(events)))
+    results["pipeline_build"] = timed(lambda: holder.__setitem__("pipeline", BidPipeline.from_events(events)))
+
+    evaluator = SalesAgentEvaluator(use_mock=True)
+    evaluator.events = list(events)
+    evaluator.frame = holder["frame"]
+    evaluator.rollup, evaluator.turnaround, evaluator.pipeline = holder["rollup"], holder["turnaround"], holder["pipeline"]
+    evaluator._synced_events, evaluator._synced_count = evaluator.events, len(events)
+    results["gc_metrics"] = timed(lambda: setattr(evaluator, "gc_metrics", evaluator._calculate_gc_metrics(evaluator.events)))
+    evaluator.warm(date.today())
+
+    results["ceo_answers"] = timed(lambda: [evaluator.call_sales_agent(q["q"]) for q in CEO_QUESTIONS])
+    results[f"add_{len(extra)}_events"] = timed(lambda: evaluator.add_events(extra))
+    return results
+
+
+def scaling_exponents(sizes: List[int], runs: Dict[int, Dict[str, float]]) -> Dict[str, float]:
+    """log-log slope between the smallest and largest size: ~1 linear, ~0 constant."""
+    lo, hi = sizes[0], sizes[-1]
+    if lo == hi:
+        return {}
+    exponents = {}
+    for path in runs[lo]:
+        a, b = runs[lo][path], runs[hi][path]
+        if a > 0 and b > 0:
+            exponents[path] = round(math.log(b / a) / math.log(hi / lo), 2)
+    return exponents
+
+
+def run_benchmark(sizes: List[int], scenario: str = "healthy_pipeline", seed: int = 0) -> Dict:
+    runs = {}
+    for size in sizes:
+        events = list(generate_events(scenario, size, seed))
+        extra = list(generate_events(scenario, INCREMENTAL_BATCH, seed + 1))
+        runs[size] = bench_size(events, extra)
+        print(f"  {size:>10,} events: " + ", ".join(f"{k} {v * 1000:.1f}ms" for k, v in runs[size].items()))
+    return {
+        "scenario": scenario,
+        "sizes": sizes,
+        "seconds": {str(size): runs[size] for size in sizes},
+        "scaling_exponent": scaling_exponents(sizes, runs),
+    }
+
+
+def print_chart(report: Dict):
+    sizes = report["sizes"]
+    paths = list(report["seconds"][str(sizes[0])])
+    print("\n" + "=" * 90)
+    print(f"ANALYTICS SCALING - {report['scenario']} (ms)")
+    print("=" * 90)
+    print(f"{'Path':<22}" + "".join(f"{size:>13,}" for size in sizes) + f"{'exponent':>11}")
+    print("-" * 90)
+    for path in paths:
+        row = "".join(f"{report['seconds'][str(size)][path] * 1000:>13.1f}" for size in sizes)
+        print(f"{path:<22}{row}{report['scaling_exponent'].get(path, float('nan')):>11.2f}")
+
+
+if __name__ == "__main__":
+    logging.disable(logging.INFO)
+    parser = argparse.ArgumentParser(description="Benchmark sales analytics paths on synthetic data")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--scenario", default="healthy_pipeline")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the timings as JSON")
+    args = parser.parse_args()
+
+    report = run_benchmark(sorted(args.sizes), args.scenario, args.seed)
+    print_chart(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
@@ -5,7 +5,12 @@ Orchestrates continuous testing and improvement until scores pass.
 Usage:
     python eval_runner.py --mode live     # Test against live backend
     python eval_runner.py --mode local    # Test locally with mock data
+    python eval_runner.py --mode load --users 50 --duration 120 --ramp 60   # Load test the backend
     python eval_runner.py --iterations 5  # Run max 5 improvement cycles
+    python eval_runner.py --judge stub    # Add LLM judge verdicts (stub or gemini)
+    python eval_runner.py --matrix        # Questions x phrasings x scenarios sweep
+    python eval_runner.py --trend pipeline            # Score history from the results store
+    python eval_runner.py --first-regression gc_focus
 """
 
 import argparse
@@ -13,14 +18,19 @@ import asyncio
 import json
 import logging
 import sys
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 import httpx
 
 from metrics import QUESTION_CRITERIA, PASS_THRESHOLD
-from scoring_agent import ScoringAgent
+from scoring_agent import INLINE_SCORE_LIMIT, ScoringAgent, LLMScoringAgent
+from event_frame import EventFrame, UNKNOWN
+from rollup import SalesRollup, previous_month
+from turnaround import TurnaroundEngine
+from pipeline import BidPipeline, BidState
+from results_store import ResultsStore, get_store
 
 logging.basicConfig(
     level=logging.INFO,
@@ -67,74 +77,177 @@ class EvalIteration:
     pass_rate: float
     results: List[QuestionResult]
     improvements_made: List[str]
+    judge_stats: Dict = field(default_factory=dict)
 
 
 class SalesAgentEvaluator:
     """Main evaluator that runs tests and tracks improvements."""
 
-    def __init__(self, backend_url: str = BACKEND_URL, use_mock: bool = False):
+    def __init__(self, backend_url: str = BACKEND_URL, use_mock: bool = False, judge: Optional[str] = None,
+                 store: Optional[ResultsStore] = None):
         self.backend_url = backend_url
         self.use_mock = use_mock
-        self.scorer = ScoringAgent()
+        self.scorer = LLMScoringAgent(backend=judge) if judge else ScoringAgent()
+        self.store = store or get_store()
         self.iterations: List[EvalIteration] = []
+        self._stored_iterations = 0
         self.events: List[Dict] = []
         self.gc_metrics: Dict = {}
+        self.frame: Optional[EventFrame] = None
+        self.rollup: Optional[SalesRollup] = None
+        self.turnaround: Optional[TurnaroundEngine] = None
+        self.pipeline: Optional[BidPipeline] = None
+        self._synced_events: Optional[List[Dict]] = None
+        self._synced_count = 0
+        self.summary: Optional[Dict] = None
+        self._summary_count = 0     # len(self.events) when the summary was fetched
+
+    def _load_mock(self):
+        """Switch to the mock events and metrics (live mode falls back here)."""
+        self.events, self.gc_metrics = self._get_mock_data()
+        self.use_mock = True
+        self.summary = None
 
     async def load_data(self):
         """Load events and metrics from backend or mock."""
         if self.use_mock:
-            self.events, self.gc_metrics = self._get_mock_data()
+            self._load_mock()
             return
 
         try:
             async with httpx.AsyncClient(verify=False, timeout=30) as client:
-                # Load events
                 resp = await client.get(f"{self.backend_url}/api/sales/events/all")
-                if resp.status_code == 200:
-                    data = resp.json()
-                    self.events = data.get("events", [])
-                    logger.info(f"Loaded {len(self.events)} events from backend")
+            if resp.status_code != 200:
+                logger.warning(f"Failed to load events: {resp.status_code}")
+                self._load_mock()
+                return
+            self.events = resp.json().get("events", [])
+            logger.info(f"Loaded {len(self.events)} events from backend")
+        except Exception as e:
+            logger.error(f"Error loading data: {e}")
+            self._load_mock()
+            return
 
-                    # Calculate GC metrics
-                    self.gc_metrics = self._calculate_gc_metrics(self.events)
-                else:
-                    logger.warning(f"Failed to load events: {resp.status_code}")
-                    self.events, self.gc_metrics = self._get_mock_data()
+        self.gc_metrics = self._calculate_gc_metrics(self.events)
 
+        # Per-person counts from the server-side summary cover the full
+        # history, not just the rows returned by /events/all. Without it the
+        # local counts stand.
+        try:
+            async with httpx.AsyncClient(verify=False, timeout=30) as client:
+                resp = await client.get(f"{self.backend_url}/api/sales/summary", params={"days": 0})
+            if resp.status_code == 200:
+                self.summary = resp.json()
+                self._summary_count = len(self.events)
+                self._apply_summary()
+            else:
+                logger.warning(f"Sales summary unavailable ({resp.status_code}), using local counts")
         except Exception as e:
-            logger.error(f"Error loading data: {e}")
-            self.events, self.gc_metrics = self._get_mock_data()
+            logger.warning(f"Sales summary unavailable ({e}), using local counts")
+
+    def _apply_summary(self):
+        """
+        Overlay the /api/sales/summary per-assignee counts on gc_metrics
+        (turnaround stays local). Events added after the summary was fetched
+        are counted on top of it.
+        """
+        counts = {person: {"rfps": row["rfps"], "proposals": row["proposals"],
+                           "wins": row["wins"], "losses": row["losses"]}
+                  for person, row in self.summary.get("by_assignee", {}).items()}
+        fields = {"RFP_RECEIVED": "rfps", "PROPOSAL_SENT": "proposals", "WON": "wins", "LOST": "losses"}
+        for event in self.events[self._summary_count:]:
+            name = fields.get(event.get("event_type"))
+            if name:
+                person = counts.setdefault(event.get("assignee") or UNKNOWN,
+                                           {"rfps": 0, "proposals": 0, "wins": 0, "losses": 0})
+                person[name] += 1
+
+        for person, row in counts.items():
+            metrics = self.gc_metrics.setdefault(person, {
+                "avgTurnaround": None, "turnaroundP50": None, "turnaroundP90": None,
+            })
+            total = row["wins"] + row["losses"]
+            metrics.update({
+                **row,
+                "totalBids": total,
+                "winRate": round((row["wins"] / total) * 100) if total > 0 else None,
+            })
+        logger.info(f"Applied sales summary for {len(counts)} assignees")
+
+    def _get_frame(self) -> EventFrame:
+        """Columnar view of self.events, rebuilt only when the event list changes."""
+        if self.frame is None or self.frame.events is not self.events or len(self.frame) != len(self.events):
+            self.frame = EventFrame(self.events)
+        return self.frame
+
+    def _sync_aggregates(self):
+        """
+        Build the incremental aggregates for self.events, or fold in only the
+        events appended since the last sync.
+        """
+        if self._synced_events is not self.events or self._synced_count > len(self.events):
+            self.rollup = SalesRollup.from_frame(self._get_frame())
+            self.turnaround = TurnaroundEngine.from_events(self.events)
+            self.pipeline = BidPipeline.from_events(self.events)
+        elif self._synced_count < len(self.events):
+            new_events = self.events[self._synced_count:]
+            self.rollup.add_many(new_events)
+            self.turnaround.add_many(new_events)
+            self.pipeline.add_many(new_events)
+        self._synced_events = self.events
+        self._synced_count = len(self.events)
+
+    def _get_rollup(self) -> SalesRollup:
+        self._sync_aggregates()
+        return self.rollup
+
+    def _get_turnaround(self) -> TurnaroundEngine:
+        self._sync_aggregates()
+        return self.turnaround
+
+    def _get_pipeline(self) -> BidPipeline:
+        self._sync_aggregates()
+        return self.pipeline
+
+    def warm(self, today: date):
+        """Build every aggregate up front so concurrent agent calls only read them."""
+        self._sync_aggregates()
+        self.pipeline.expire(today)
+
+    def add_events(self, events: List[Dict]):
+        """Append newly scanned events and update the aggregates without a rebuild."""
+        self.events.extend(events)
+        self._sync_aggregates()
+        if not self.use_mock:
+            self.gc_metrics = self._calculate_gc_metrics(self.events)
+            if self.summary is not None:
+                self._apply_summary()
 
     def _calculate_gc_metrics(self, events: List[Dict]) -> Dict:
         """Calculate metrics per assignee from events."""
-        gc_data = {}
-
-        for e in events:
-            gc = e.get("assignee", "Unknown")
-            if gc not in gc_data:
-                gc_data[gc] = {"wins": 0, "losses": 0, "proposals": 0, "rfps": 0, "turnarounds": []}
-
-            if e.get("event_type") == "WON":
-                gc_data[gc]["wins"] += 1
-            elif e.get("event_type") == "LOST":
-                gc_data[gc]["losses"] += 1
-            elif e.get("event_type") == "PROPOSAL_SENT":
-                gc_data[gc]["proposals"] += 1
-            elif e.get("event_type") == "RFP_RECEIVED":
-                gc_data[gc]["rfps"] += 1
+        if events is self.events:
+            rollup, turnaround = self._get_rollup(), self._get_turnaround()
+        else:
+            rollup, turnaround = SalesRollup.from_events(events), TurnaroundEngine.from_events(events)
 
         # Calculate derived metrics
         metrics = {}
-        for gc, data in gc_data.items():
-            total = data["wins"] + data["losses"]
+        for gc in rollup.assignees:
+            wins = rollup.assignee_total(gc, "WON").count
+            losses = rollup.assignee_total(gc, "LOST").count
+            total = wins + losses
+            speed = turnaround.assignee_stats(gc)
             metrics[gc] = {
-                "wins": data["wins"],
-                "losses": data["losses"],
+                "wins": wins,
+                "losses": losses,
                 "totalBids": total,
-                "winRate": round((data["wins"] / total) * 100) if total > 0 else None,
-                "proposals": data["proposals"],
-                "rfps": data["rfps"],
-                "avgTurnaround": 3,  # Placeholder
+                "winRate": round((wins / total) * 100) if total > 0 else None,
+                "proposals": rollup.assignee_total(gc, "PROPOSAL_SENT").count,
+                "rfps": rollup.assignee_total(gc, "RFP_RECEIVED").count,
+                # RFP -> proposal days; None when no RFP has been answered yet
+                "avgTurnaround": round(speed["mean"]) if speed else None,
+                "turnaroundP50": round(speed["p50"], 1) if speed else None,
+                "turnaroundP90": round(speed["p90"], 1) if speed else None,
             }
 
         return metrics
@@ -176,21 +289,17 @@ class SalesAgentEvaluator:
         """
         q = query.lower()
         now = datetime.now()
-        events = self.events
+        rollup = self._get_rollup()
         gc_metrics = self.gc_metrics
+        last_year, last_month = previous_month(now.year, now.month)
 
         # 1. Bid volume this month
         if "bid this month" in q or "bid volume" in q or ("how much" in q and "month" in q):
-            this_month_proposals = [e for e in events
-                                   if e.get("event_type") == "PROPOSAL_SENT"
-                                   and datetime.fromisoformat(e.get("scanned_at", "2000-01-01")[:10]).month == now.month]
-            last_month_proposals = [e for e in events
-                                   if e.get("event_type") == "PROPOSAL_SENT"
-                                   and datetime.fromisoformat(e.get("scanned_at", "2000-01-01")[:10]).month == now.month - 1]
-            count = len(this_month_proposals)
-            total = sum(e.get("dollar_amount", 0) for e in this_month_proposals)
+            this_month = rollup.month_total("PROPOSAL_SENT", now.year, now.month)
+            count = this_month.count
+            total = this_month.dollars
             avg = total // count if count > 0 else 0
-            last_count = len(last_month_proposals)
+            last_count = rollup.month_total("PROPOSAL_SENT", last_year, last_month).count
             change = count - last_count
 
             return f"""**This Month's Bidding Activity:**
@@ -206,15 +315,13 @@ vs Last Month: {'+' if change >= 0 else ''}{change} proposals (was {last_count})
         # 2. Top performer
         if "top performer" in q or "best sales" in q or "who's winning" in q:
             by_person = {}
-            for e in events:
-                person = e.get("assignee", "Unknown")
-                if person not in by_person:
-                    by_person[person] = {"wins": 0, "proposals": 0, "value": 0}
-                if e.get("event_type") == "WON":
-                    by_person[person]["wins"] += 1
-                    by_person[person]["value"] += e.get("dollar_amount", 0)
-                elif e.get("event_type") == "PROPOSAL_SENT":
-                    by_person[person]["proposals"] += 1
+            for person in rollup.assignees:
+                won = rollup.assignee_total(person, "WON")
+                by_person[person] = {
+                    "wins": won.count,
+                    "proposals": rollup.assignee_total(person, "PROPOSAL_SENT").count,
+                    "value": won.dollars,
+                }
 
             ranked = sorted(by_person.items(), key=lambda x: (x[1]["wins"], x[1]["proposals"]), reverse=True)[:5]
 
@@ -254,7 +361,7 @@ vs Last Month: {'+' if change >= 0 else ''}{change} proposals (was {last_count})
 
         # 4. Response speed
         if "fast enough" in q or "response time" in q or "responding" in q:
-            turnarounds = [(gc, m.get("avgTurnaround", 0)) for gc, m in gc_metrics.items() if m.get("avgTurnaround")]
+            turnarounds = [(gc, m["avgTurnaround"]) for gc, m in gc_metrics.items() if m.get("avgTurnaround") is not None]
             if turnarounds:
                 avg = sum(t[1] for t in turnarounds) // len(turnarounds)
                 fastest = min(turnarounds, key=lambda x: x[1])
@@ -275,39 +382,34 @@ Slowest: {slowest[0]} at {slowest[1]} days
 
         # 5. Pipeline
         if "pipeline" in q or "pending" in q or "waiting" in q:
-            proposal_projects = set()
-            decided_projects = set()
-
-            for e in events:
-                proj = (e.get("project_name") or "").lower()
-                if not proj:
-                    continue
-                if e.get("event_type") == "PROPOSAL_SENT":
-                    proposal_projects.add(proj)
-                if e.get("event_type") in ("WON", "LOST"):
-                    decided_projects.add(proj)
-
-            pending = proposal_projects - decided_projects
-            pending_events = [e for e in events
-                            if e.get("event_type") == "PROPOSAL_SENT"
-                            and (e.get("project_name") or "").lower() in pending]
-
-            total_value = sum(e.get("dollar_amount", 0) for e in pending_events)
+            pipeline = self._get_pipeline()
+            today = now.date()
+            pipeline.expire(today)
+            oldest = pipeline.oldest_pending(5)
+            follow_ups = pipeline.follow_up_count(today)
+            stale = len(pipeline.by_state[BidState.STALE])
 
             response = f"""**Pipeline (Awaiting Decision):**
 
-Pending: {len(pending)} proposals
-Total Value: ${total_value:,}
+Pending: {pipeline.pending_count} proposals
+Total Value: ${pipeline.pending_value:,}
 
 vs Last Month: Similar pipeline size
 """
-            if pending_events:
-                response += "\nProjects:\n"
-                for e in pending_events[:5]:
-                    response += f"• {e.get('project_name', 'Unknown')}"
-                    if e.get("dollar_amount"):
-                        response += f" (${e['dollar_amount']:,})"
-                    response += "\n"
+            if oldest:
+                response += "\nProjects (oldest first):\n"
+                for bid in oldest:
+                    response += f"• {bid.project_name}"
+                    if bid.proposal_value:
+                        response += f" (${bid.proposal_value:,})"
+                    response += f" - {bid.age_days(today)} days\n"
+                response += f"\nOldest Pending: {oldest[0].project_name} ({oldest[0].age_days(today)} days)\n"
+
+            if follow_ups:
+                response += f"Follow-up Needed: {follow_ups} proposals over 7 days old"
+                if stale:
+                    response += f" ({stale} stale, no decision in 60+ days)"
+                response += "\n"
 
             response += f"\n💡 Recommend: Follow up on pending bids over 7 days old."
 
@@ -315,28 +417,27 @@ vs Last Month: Similar pipeline size
 
         # 6. Slow turnaround
         if "slow" in q or "bottleneck" in q or "behind" in q:
-            with_turnaround = [(gc, m.get("avgTurnaround", 0)) for gc, m in gc_metrics.items() if m.get("avgTurnaround")]
+            with_turnaround = [(gc, m["avgTurnaround"]) for gc, m in gc_metrics.items() if m.get("avgTurnaround") is not None]
             with_turnaround.sort(key=lambda x: x[1], reverse=True)
 
             response = "**Slowest Turnaround Times:**\n\n"
             for gc, days in with_turnaround[:5]:
                 status = "🔴" if days > 5 else "⚠️" if days > 3 else "✅"
-                response += f"{status} {gc}: {days} days avg\n"
+                response += f"{status} {gc}: {days} days avg"
+                if gc_metrics[gc].get("turnaroundP90") is not None:
+                    response += f" (p90 {gc_metrics[gc]['turnaroundP90']} days)"
+                response += "\n"
 
             response += "\n💡 Target: Under 3 days to stay competitive."
             return response
 
         # 7. Month comparison
         if "vs last" in q or "compared" in q or "trend" in q or "last month" in q:
-            this_month = [e for e in events if datetime.fromisoformat(e.get("scanned_at", "2000-01-01")[:10]).month == now.month]
-            last_month = [e for e in events if datetime.fromisoformat(e.get("scanned_at", "2000-01-01")[:10]).month == now.month - 1]
+            def month_counts(year, month):
+                return [rollup.month_total(t, year, month).count for t in ("RFP_RECEIVED", "PROPOSAL_SENT", "WON")]
 
-            this_rfps = len([e for e in this_month if e.get("event_type") == "RFP_RECEIVED"])
-            last_rfps = len([e for e in last_month if e.get("event_type") == "RFP_RECEIVED"])
-            this_proposals = len([e for e in this_month if e.get("event_type") == "PROPOSAL_SENT"])
-            last_proposals = len([e for e in last_month if e.get("event_type") == "PROPOSAL_SENT"])
-            this_wins = len([e for e in this_month if e.get("event_type") == "WON"])
-            last_wins = len([e for e in last_month if e.get("event_type") == "WON"])
+            this_rfps, this_proposals, this_wins = month_counts(now.year, now.month)
+            last_rfps, last_proposals, last_wins = month_counts(last_year, last_month)
 
             def arrow(curr, prev):
                 return "↑" if curr > prev else "↓" if curr < prev else "→"
@@ -379,23 +480,23 @@ Overall Trend: {trend.upper()}
 
         # 9. Job size
         if "job size" in q or "deal size" in q or "average job" in q or "avg job" in q:
-            wins_with_amount = [e for e in events if e.get("event_type") == "WON" and e.get("dollar_amount")]
-            proposals_with_amount = [e for e in events if e.get("event_type") == "PROPOSAL_SENT" and e.get("dollar_amount")]
+            wins_with_amount = rollup.type_total("WON")
+            proposals_with_amount = rollup.type_total("PROPOSAL_SENT")
 
             response = "**Job Size Analysis:**\n\n"
 
             avg_won = 0
             avg_bid = 0
 
-            if wins_with_amount:
-                avg_won = sum(e["dollar_amount"] for e in wins_with_amount) // len(wins_with_amount)
+            if wins_with_amount.priced:
+                avg_won = wins_with_amount.dollars // wins_with_amount.priced
                 response += f"Avg Won Job: ${avg_won:,}\n"
 
-            if proposals_with_amount:
-                avg_bid = sum(e["dollar_amount"] for e in proposals_with_amount) // len(proposals_with_amount)
+            if proposals_with_amount.priced:
+                avg_bid = proposals_with_amount.dollars // proposals_with_amount.priced
                 response += f"Avg Bid: ${avg_bid:,}\n"
 
-            largest = max((e for e in events if e.get("dollar_amount")), key=lambda x: x.get("dollar_amount", 0), default=None)
+            largest = rollup.largest_event
             if largest:
                 response += f"\nLargest: {largest.get('project_name', 'Unknown')} at ${largest['dollar_amount']:,}\n"
 
@@ -407,40 +508,37 @@ Overall Trend: {trend.upper()}
 
         # 10. Weekly activity
         if "this week" in q or "recent" in q or "rfps came" in q:
-            week_ago = datetime.now().timestamp() - (7 * 24 * 60 * 60)
-            two_weeks_ago = datetime.now().timestamp() - (14 * 24 * 60 * 60)
+            # Day granularity: the last 7 days include today, the week before ends at today-7
+            week_start = now.date() - timedelta(days=6)
+            week_end = now.date() + timedelta(days=1)
+            prev_week_start = week_start - timedelta(days=7)
 
-            week_events = [e for e in events
-                         if datetime.fromisoformat(e.get("scanned_at", "2000-01-01")[:10]).timestamp() > week_ago]
-            prev_week_events = [e for e in events
-                               if two_weeks_ago < datetime.fromisoformat(e.get("scanned_at", "2000-01-01")[:10]).timestamp() <= week_ago]
+            week_rfps = rollup.window_total("RFP_RECEIVED", week_start, week_end).count
+            week_proposals = rollup.window_total("PROPOSAL_SENT", week_start, week_end).count
+            week_wins = rollup.window_total("WON", week_start, week_end).count
 
-            week_rfps = [e for e in week_events if e.get("event_type") == "RFP_RECEIVED"]
-            week_proposals = [e for e in week_events if e.get("event_type") == "PROPOSAL_SENT"]
-            week_wins = [e for e in week_events if e.get("event_type") == "WON"]
-
-            prev_rfps = len([e for e in prev_week_events if e.get("event_type") == "RFP_RECEIVED"])
+            prev_rfps = rollup.window_total("RFP_RECEIVED", prev_week_start, week_start).count
 
             # Activity level
-            activity = "busy" if len(week_rfps) >= 5 else "moderate" if len(week_rfps) >= 2 else "slow"
+            activity = "busy" if week_rfps >= 5 else "moderate" if week_rfps >= 2 else "slow"
 
             response = f"""**Last 7 Days Activity:**
 
-New RFPs: {len(week_rfps)}
-Proposals Sent: {len(week_proposals)}
-Wins: {len(week_wins)}
+New RFPs: {week_rfps}
+Proposals Sent: {week_proposals}
+Wins: {week_wins}
 
-vs Last Week: {'+' if len(week_rfps) >= prev_rfps else ''}{len(week_rfps) - prev_rfps} RFPs (was {prev_rfps})
+vs Last Week: {'+' if week_rfps >= prev_rfps else ''}{week_rfps - prev_rfps} RFPs (was {prev_rfps})
 Activity Level: {activity.upper()} week
 
 Recent RFPs:
 """
             if week_rfps:
-                for e in week_rfps[:3]:
+                for e in rollup.recent("RFP_RECEIVED", 3, start=week_start):
                     response += f"• {e.get('summary', e.get('project_name', 'Unknown'))}\n"
             else:
                 # Show most recent RFPs even if older
-                recent_rfps = [e for e in events if e.get("event_type") == "RFP_RECEIVED"][:3]
+                recent_rfps = rollup.recent("RFP_RECEIVED", 3)
                 for e in recent_rfps:
                     response += f"• {e.get('summary', e.get('project_name', 'Unknown'))}\n"
 
@@ -467,14 +565,20 @@ What would you like to know?"""
     async def run_evaluation(self) -> EvalIteration:
         """Run one full evaluation of all 10 questions."""
         results = []
+        items = [(q["id"], q["q"], self.call_sales_agent(q["q"])) for q in CEO_QUESTIONS]
 
-        for q in CEO_QUESTIONS:
-            response = self.call_sales_agent(q["q"])
-            score_result = self.scorer.score_response(q["id"], q["q"], response)
+        judge_stats = {}
+        if isinstance(self.scorer, LLMScoringAgent):
+            self.scorer.judge.reset_stats()
+            score_results = await self.scorer.score_many_with_llm(items)
+            judge_stats = self.scorer.judge.stats.summary()
+        else:
+            score_results = [result for _, result in self.scorer.score_many(items)]
 
+        for (question_id, question, response), score_result in zip(items, score_results):
             results.append(QuestionResult(
-                question_id=q["id"],
-                question=q["q"],
+                question_id=question_id,
+                question=question,
                 response=response,
                 score=score_result["total_score"],
                 passed=score_result["passed"],
@@ -496,6 +600,7 @@ What would you like to know?"""
             pass_rate=round(pass_rate, 1),
             results=results,
             improvements_made=[],
+            judge_stats=judge_stats,
         )
 
         self.iterations.append(iteration)
@@ -520,6 +625,14 @@ What would you like to know?"""
 
         print()
 
+        if iteration.judge_stats:
+            js = iteration.judge_stats
+            latency = js["latency_ms"]
+            print(f"LLM Judge: {js['requests']} verdicts, {js['cache_hit_rate']}% cached, "
+                  f"{js['backend_calls']} calls (p50 {latency.get('p50', 0)}ms, p90 {latency.get('p90', 0)}ms), "
+                  f"{js['errors']} errors")
+            print()
+
         # Detailed feedback for failures
         failures = [r for r in iteration.results if not r.passed]
         if failures:
@@ -546,8 +659,36 @@ What would you like to know?"""
 
         return suggestions
 
+    def rescore_results(self, filepath: str, workers: Optional[int] = None) -> Dict:
+        """Re-score every archived response in a saved results file with the current metrics."""
+        with open(filepath) as f:
+            data = json.load(f)
+
+        items = (
+            (r["question_id"], r["question"], r["response"])
+            for evaluation in data.get("evaluations", [])
+            for r in evaluation["results"]
+        )
+        by_question: Dict[str, List[float]] = {}
+        for question_id, result in self.scorer.score_many(items, workers=workers):
+            by_question.setdefault(question_id, []).append(result["total_score"])
+
+        summary = self.scorer.batch_stats.summary()
+        summary["by_question"] = {
+            qid: round(sum(scores) / len(scores), 1) for qid, scores in by_question.items()
+        }
+        return summary
+
     def save_results(self, filepath: str = "eval_results.json"):
-        """Save all iterations to JSON."""
+        """
+        Append iterations not yet stored to the results store (the history),
+        then write this session's iterations to JSON.
+        """
+        for iteration in self.iterations[self._stored_iterations:]:
+            run_id = self.store.append_run(asdict(iteration))
+            logger.info(f"Stored run {run_id}")
+        self._stored_iterations = len(self.iterations)
+
         data = {
             "evaluations": [asdict(i) for i in self.iterations],
             "latest_avg_score": self.iterations[-1].avg_score if self.iterations else 0,
@@ -562,16 +703,68 @@ What would you like to know?"""
 
 async def main():
     parser = argparse.ArgumentParser(description="Sales Agent Evaluation Runner")
-    parser.add_argument("--mode", choices=["live", "local"], default="local",
-                       help="Test against live backend or local mock")
+    parser.add_argument("--mode", choices=["live", "local", "load"], default="local",
+                       help="Test against live backend or local mock, or load test the backend")
     parser.add_argument("--iterations", type=int, default=1,
                        help="Number of evaluation iterations")
     parser.add_argument("--output", default="eval_results.json",
                        help="Output file for results")
+    parser.add_argument("--rescore", metavar="RESULTS_FILE",
+                       help="Re-score archived responses from a saved results file and exit")
+    parser.add_argument("--workers", type=int, default=None,
+                       help=f"Scoring processes for --rescore and --matrix (batches under "
+                            f"{INLINE_SCORE_LIMIT} responses score inline); with --judge, cells judged at once")
+    parser.add_argument("--matrix", action="store_true",
+                       help="Run every question x phrasing x scenario cell and exit")
+    parser.add_argument("--judge", choices=["stub", "gemini"], default=None,
+                       help="Blend in LLM judge verdicts from this backend")
+    parser.add_argument("--trend", metavar="QUESTION_ID",
+                       help="Print a question's score over the last --last stored runs and exit")
+    parser.add_argument("--last", type=int, default=50)
+    parser.add_argument("--first-regression", metavar="QUESTION_ID",
+                       help="Print the first stored run where a question regressed and exit")
+    parser.add_argument("--target-url", default=BACKEND_URL,
+                       help="Backend base URL for --mode load (e.g. a local stand-in server)")
+    parser.add_argument("--path", default="/api/sales/events/all",
+                       help="Endpoint each virtual user's question hits in --mode load")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users for --mode load")
+    parser.add_argument("--duration", type=float, default=60.0, help="Load test length in seconds")
+    parser.add_argument("--ramp", type=float, default=0.0,
+                       help="Seconds over which virtual users start (finds the saturation point)")
 
     args = parser.parse_args()
 
-    evaluator = SalesAgentEvaluator(use_mock=(args.mode == "local"))
+    if args.mode == "load":
+        from load_generator import LoadGenerator, print_load_report
+        generator = LoadGenerator(args.target_url, args.path, args.users, args.duration, args.ramp)
+        report = await generator.run()
+        print_load_report(report)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Load test results saved to {args.output}")
+        return
+
+    if args.trend:
+        for point in get_store().score_trend(args.trend, args.last):
+            status = "PASS" if point["passed"] else "FAIL"
+            print(f"{point['timestamp'][:19]}  {point['run_id']:<24} {point['score']:>6.1f}  {status}")
+        return
+
+    if args.first_regression:
+        regression = get_store().first_regression(args.first_regression)
+        if regression:
+            print(f"{args.first_regression} regressed in {regression['run_id']} ({regression['timestamp'][:19]}): "
+                  f"{regression['previous_score']} -> {regression['score']}")
+        else:
+            print(f"No regression found for {args.first_regression}")
+        return
+
+    if args.rescore:
+        summary = SalesAgentEvaluator(use_mock=True).rescore_results(args.rescore, args.workers)
+        print(json.dumps(summary, indent=2))
+        return
+
+    evaluator = SalesAgentEvaluator(use_mock=(args.mode == "local"), judge=args.judge)
 
     print("\n" + "=" * 70)
     print("SALES AGENT EVALUATION FRAMEWORK")
@@ -585,6 +778,15 @@ async def main():
     await evaluator.load_data()
     print(f"Loaded {len(evaluator.events)} events, {len(evaluator.gc_metrics)} people")
 
+    if args.matrix:
+        from matrix_runner import MatrixRunner, print_matrix
+        report = await MatrixRunner(evaluator, args.workers).run()
+        print_matrix(report)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Matrix results saved to {args.output}")
+        return
+
     # Run evaluations
     for i in range(args.iterations):
         iteration = await evaluator.run_evaluation()
@@ -0,0 +1,157 @@
+"""
+Sales Event Frame
+Columnar, NumPy-backed view over sales events for the CEO question analytics.
+Timestamps are parsed once and string columns are stored as categorical codes,
+so time windows and group-bys are vectorized instead of repeated dict scans.
+"""
+
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_DAY = "2000-01-01"
+UNKNOWN = "Unknown"
+
+
+class Categorical:
+    """String column stored as int32 codes; categories keep first-appearance order."""
+
+    def __init__(self, values: Iterable[Optional[str]]):
+        self.categories: List[str] = []
+        self.index: Dict[str, int] = {}
+        codes = []
+        for value in values:
+            code = self.index.get(value)
+            if code is None:
+                if value is None:
+                    codes.append(-1)
+                    continue
+                code = len(self.categories)
+                self.index[value] = code
+                self.categories.append(value)
+            codes.append(code)
+        self.codes = np.array(codes, dtype=np.int32)
+
+    def code_of(self, value: str) -> int:
+        """Code for a category, or -1 if it never occurs."""
+        return self.index.get(value, -1)
+
+    def __len__(self):
+        return len(self.categories)
+
+
+def parse_days(values: List[str]) -> np.ndarray:
+    """Parse 'YYYY-MM-DD...' prefixes into datetime64[D], falling back per value on bad input."""
+    try:
+        return np.array(values, dtype="datetime64[D]")
+    except ValueError:
+        days = []
+        for value in values:
+            try:
+                days.append(np.datetime64(value, "D"))
+            except ValueError:
+                days.append(np.datetime64(DEFAULT_DAY, "D"))
+        return np.array(days, dtype="datetime64[D]")
+
+
+def to_day(value) -> np.datetime64:
+    """datetime/date/ISO string -> datetime64[D]."""
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return np.datetime64(value.isoformat(), "D")
+    return np.datetime64(str(value)[:10], "D")
+
+
+def month_bounds(year: int, month: int) -> Tuple[np.datetime64, np.datetime64]:
+    """[first day of month, first day of next month)."""
+    start = np.datetime64(f"{year:04d}-{month:02d}", "M")
+    return start.astype("datetime64[D]"), (start + 1).astype("datetime64[D]")
+
+
+class EventFrame:
+    """
+    Array-backed event container.
+
+    Columns: day (datetime64[D]), event_type / assignee / gc_name / project
+    (categorical codes), dollars (int64, 0 when missing) and has_amount.
+    The original dicts are kept in `events` for row-level output.
+    """
+
+    def __init__(self, events: List[Dict]):
+        self.events = events
+        self.day = parse_days([(e.get("scanned_at") or DEFAULT_DAY)[:10] for e in events])
+        self.event_type = Categorical(e.get("event_type") for e in events)
+        self.assignee = Categorical(e.get("assignee") or UNKNOWN for e in events)
+        self.gc_name = Categorical(e.get("gc_name") for e in events)
+        self.project = Categorical((e.get("project_name") or "").lower() or None for e in events)
+        self.dollars = np.array([e.get("dollar_amount") or 0 for e in events], dtype=np.int64)
+        self.has_amount = self.dollars != 0
+        self._type_masks: Dict[str, np.ndarray] = {}
+
+    def __len__(self):
+        return len(self.events)
+
+    # Masks
+
+    def type_mask(self, event_type: str) -> np.ndarray:
+        """Boolean mask for one event type (cached)."""
+        mask = self._type_masks.get(event_type)
+        if mask is None:
+            mask = self.event_type.codes == self.event_type.code_of(event_type)
+            self._type_masks[event_type] = mask
+        return mask
+
+    def window(self, start=None, end=None) -> np.ndarray:
+        """Events with start <= day < end (either bound optional)."""
+        mask = np.ones(len(self), dtype=bool)
+        if start is not None:
+            mask &= self.day >= to_day(start)
+        if end is not None:
+            mask &= self.day < to_day(end)
+        return mask
+
+    def month(self, year: int, month: int) -> np.ndarray:
+        """Events in a calendar month."""
+        start, end = month_bounds(year, month)
+        return (self.day >= start) & (self.day < end)
+
+    # Aggregates
+
+    @staticmethod
+    def count(mask: np.ndarray) -> int:
+        return int(np.count_nonzero(mask))
+
+    def sum_dollars(self, mask: np.ndarray) -> int:
+        return int(self.dollars[mask].sum())
+
+    def group_count(self, column: str, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Counts per category of a categorical column, indexed by code."""
+        cat: Categorical = getattr(self, column)
+        codes = cat.codes if mask is None else cat.codes[mask]
+        return np.bincount(codes[codes >= 0], minlength=len(cat))
+
+    def group_sum(self, column: str, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Dollar sums per category of a categorical column, indexed by code."""
+        cat: Categorical = getattr(self, column)
+        codes, dollars = cat.codes, self.dollars
+        if mask is not None:
+            codes, dollars = codes[mask], dollars[mask]
+        valid = codes >= 0
+        return np.bincount(codes[valid], weights=dollars[valid], minlength=len(cat)).astype(np.int64)
+
+    def rows(self, mask: np.ndarray, limit: Optional[int] = None) -> List[Dict]:
+        """Original event dicts for a mask, in input order."""
+        idx = np.flatnonzero(mask)
+        if limit is not None:
+            idx = idx[:limit]
+        return [self.events[i] for i in idx]
+
+    def largest(self, mask: Optional[np.ndarray] = None) -> Optional[Dict]:
+        """Event with the biggest dollar_amount (first one on ties)."""
+        candidates = self.has_amount if mask is None else (mask & self.has_amount)
+        if not candidates.any():
+            return None
+        dollars = np.where(candidates, self.dollars, np.iinfo(np.int64).min)
+        return self.events[int(np.argmax(dollars))]
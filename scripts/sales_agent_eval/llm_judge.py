@@ -0,0 +1,285 @@
+"""
+LLM Judge
+Asks an LLM whether a Sales Agent answer is actually useful to the CEO.
+Judge calls run concurrently under a semaphore, verdicts are cached in SQLite
+by hash of (question, response, rubric version), and the backend is pluggable
+(Gemini in production, a deterministic local stub for offline runs).
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from stats import distribution
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever JUDGE_PROMPT or the verdict fields change; old verdicts stop matching
+RUBRIC_VERSION = "1"
+MAX_CONCURRENCY = 8
+# Outside the source tree: $LLM_JUDGE_CACHE, else the user cache directory
+CACHE_PATH = os.getenv("LLM_JUDGE_CACHE") or str(
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "sales_agent_eval" / "judge_cache.sqlite"
+)
+
+JUDGE_PROMPT = '''You are reviewing an answer from a sales analytics assistant for a roofing company CEO.
+Return ONLY a JSON object, no other text.
+
+QUESTION: {question}
+
+ANSWER:
+{response}
+
+Judge the answer:
+- Is it actually helpful to a CEO making decisions?
+- Does it contain misleading or unsupported statements?
+- Is the tone direct and appropriate for an executive?
+
+Return JSON:
+{{"score": 0-100, "helpful": true/false, "misleading": true/false, "tone_ok": true/false, "feedback": "one sentence"}}'''
+
+
+@dataclass
+class Verdict:
+    score: float
+    helpful: bool
+    misleading: bool
+    tone_ok: bool
+    feedback: str
+    cached: bool = False
+
+
+def verdict_key(question: str, response: str, rubric_version: str = RUBRIC_VERSION) -> str:
+    return hashlib.sha256("\x00".join((question, response, rubric_version)).encode("utf-8")).hexdigest()
+
+
+def parse_verdict(text: str) -> Optional[Verdict]:
+    """Pull the first JSON object out of a judge reply."""
+    match = re.search(r"\{.*\}", text or "", re.DOTALL)
+    if not match:
+        return None
+    try:
+        data = json.loads(match.group(0))
+        return Verdict(
+            score=max(0.0, min(100.0, float(data["score"]))),
+            helpful=bool(data.get("helpful", True)),
+            misleading=bool(data.get("misleading", False)),
+            tone_ok=bool(data.get("tone_ok", True)),
+            feedback=str(data.get("feedback", "")),
+        )
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+# Backends
+
+class JudgeBackend(ABC):
+    """Turns a judge prompt into raw model text."""
+    name = "base"
+
+    @abstractmethod
+    async def complete(self, prompt: str) -> str:
+        ...
+
+
+class GeminiJudgeBackend(JudgeBackend):
+    def __init__(self, model: str = "gemini-2.0-flash"):
+        import google.generativeai as genai
+        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+        self.name = f"gemini:{model}"
+        self.model = genai.GenerativeModel(model)
+
+    async def complete(self, prompt: str) -> str:
+        response = await self.model.generate_content_async(prompt)
+        return response.text
+
+
+class StubJudgeBackend(JudgeBackend):
+    """
+    Offline judge: a deterministic verdict derived from the answer text, with
+    an optional simulated delay so concurrency and caching can be exercised.
+    """
+    name = "stub"
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    async def complete(self, prompt: str) -> str:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        answer = prompt.split("ANSWER:\n", 1)[-1].split("\n\nJudge the answer:", 1)[0]
+        has_numbers = bool(re.search(r"\d", answer))
+        has_tip = "💡" in answer or bool(re.search(r"recommend|focus|should", answer, re.IGNORECASE))
+        score = 50 + (25 if has_numbers else 0) + (25 if has_tip else 0)
+        return json.dumps({
+            "score": score,
+            "helpful": has_numbers,
+            "misleading": False,
+            "tone_ok": True,
+            "feedback": "Stub verdict" + ("" if has_tip else " - no recommendation"),
+        })
+
+
+def get_backend(name: str = "gemini", model: str = "gemini-2.0-flash") -> JudgeBackend:
+    if name == "stub":
+        return StubJudgeBackend()
+    return GeminiJudgeBackend(model)
+
+
+# Cache
+
+class VerdictCache:
+    """Persistent verdict store; rows are keyed by verdict_key and backend name."""
+
+    def __init__(self, path: str = CACHE_PATH):
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS verdicts (
+                key TEXT NOT NULL,
+                backend TEXT NOT NULL,
+                verdict TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (key, backend)
+            )
+        ''')
+        self.conn.commit()
+
+    def get(self, key: str, backend: str) -> Optional[Verdict]:
+        row = self.conn.execute(
+            "SELECT verdict FROM verdicts WHERE key = ? AND backend = ?", (key, backend)
+        ).fetchone()
+        if row is None:
+            return None
+        verdict = Verdict(**json.loads(row[0]))
+        verdict.cached = True
+        return verdict
+
+    def put(self, key: str, backend: str, verdict: Verdict):
+        data = asdict(verdict)
+        data.pop("cached")
+        self.conn.execute(
+            "INSERT OR REPLACE INTO verdicts (key, backend, verdict, created_at) VALUES (?, ?, ?, ?)",
+            (key, backend, json.dumps(data), time.time()),
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+# Judge
+
+@dataclass
+class JudgeStats:
+    requests: int = 0
+    cache_hits: int = 0
+    errors: int = 0
+    latencies_ms: List[float] = field(default_factory=list)   # backend calls only
+
+    def summary(self) -> Dict:
+        latency = distribution(sorted(self.latencies_ms), (50, 90, 99)) if self.latencies_ms else {}
+        return {
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "cache_hit_rate": round(self.cache_hits / self.requests * 100, 1) if self.requests else 0.0,
+            "backend_calls": len(self.latencies_ms),
+            "errors": self.errors,
+            "latency_ms": {k: round(v, 1) for k, v in latency.items()},
+        }
+
+
+class LLMJudge:
+    """Concurrent, cached judge over a pluggable backend."""
+
+    def __init__(self, backend: JudgeBackend, cache: Optional[VerdictCache] = None,
+                 max_concurrency: int = MAX_CONCURRENCY, rubric_version: str = RUBRIC_VERSION):
+        self.backend = backend
+        self.cache = cache
+        self.rubric_version = rubric_version
+        self.max_concurrency = max_concurrency
+        self.stats = JudgeStats()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    def reset_stats(self):
+        self.stats = JudgeStats()
+
+    async def judge(self, question: str, response: str) -> Optional[Verdict]:
+        """Verdict for one answer; None when the backend fails or replies with junk."""
+        self.stats.requests += 1
+        key = verdict_key(question, response, self.rubric_version)
+
+        if self.cache is not None:
+            verdict = self.cache.get(key, self.backend.name)
+            if verdict is not None:
+                self.stats.cache_hits += 1
+                return verdict
+
+        # Identical answers in the same run share one backend call
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            self.stats.cache_hits += 1
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            verdict = await self._call_backend(question, response)
+            if verdict is not None and self.cache is not None:
+                self.cache.put(key, self.backend.name, verdict)
+            future.set_result(verdict)
+            return verdict
+        finally:
+            if not future.done():
+                future.set_result(None)
+            del self._in_flight[key]
+
+    async def _call_backend(self, question: str, response: str) -> Optional[Verdict]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        prompt = JUDGE_PROMPT.format(question=question, response=response)
+
+        async with self._semaphore:
+            start = time.perf_counter()
+            try:
+                text = await self.backend.complete(prompt)
+            except Exception as e:
+                self.stats.errors += 1
+                logger.warning(f"Judge call failed: {str(e)[:80]}")
+                return None
+            finally:
+                self.stats.latencies_ms.append((time.perf_counter() - start) * 1000)
+
+        verdict = parse_verdict(text)
+        if verdict is None:
+            self.stats.errors += 1
+            logger.warning(f"Unparseable judge reply: {(text or '')[:80]}")
+        return verdict
+
+    async def judge_many(self, items: Iterable[Tuple[str, str]]) -> List[Optional[Verdict]]:
+        """Judge (question, response) pairs concurrently; results keep input order."""
+        return await asyncio.gather(*(self.judge(question, response) for question, response in items))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    async def demo():
+        judge = LLMJudge(StubJudgeBackend(delay=0.05), VerdictCache(":memory:"))
+        items = [("How much did we bid this month?", f"Proposals Sent: {n}\n💡 Keep pace") for n in range(20)]
+        await judge.judge_many(items)
+        await judge.judge_many(items)
+        print(judge.stats.summary())
+
+    asyncio.run(demo())
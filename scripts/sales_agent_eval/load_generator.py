@@ -0,0 +1,151 @@
+"""
+Sales Agent Load Generator
+Drives N concurrent virtual users against the backend the Sales Agent
+answers from. The agent answers in the browser (generateSalesResponse in
+sales-dashboard.jsx) from the events payload, so every CEO question costs the
+backend the same data request (GET /api/sales/events/all by default); each
+user repeats it over one pooled keep-alive httpx.AsyncClient. Reports
+throughput, error rate and latency percentiles overall and per time bucket,
+so saturation shows up as users ramp. There is no per-question breakdown:
+the questions are indistinguishable on the wire.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import httpx
+
+from eval_runner import BACKEND_URL
+from stats import distribution
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = "/api/sales/events/all"
+BUCKET_SECONDS = 5.0
+REQUEST_TIMEOUT = 30.0
+
+
+@dataclass
+class RequestSample:
+    user: int
+    started: float          # seconds since the run started
+    latency_ms: float
+    ok: bool
+    status: Optional[int]
+
+
+def summarize(samples: List[RequestSample], elapsed: float) -> Dict:
+    """Throughput, error rate and latency percentiles for a set of samples."""
+    if not samples:
+        return {"requests": 0, "errors": 0, "error_rate": 0.0, "throughput_rps": 0.0, "latency_ms": {}}
+    errors = sum(1 for s in samples if not s.ok)
+    latency = distribution(sorted(s.latency_ms for s in samples if s.ok), (50, 90, 99)) if errors < len(samples) else {}
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "error_rate": round(errors / len(samples) * 100, 2),
+        "throughput_rps": round(len(samples) / elapsed, 1) if elapsed > 0 else 0.0,
+        "latency_ms": {k: round(v, 1) for k, v in latency.items()},
+    }
+
+
+class LoadGenerator:
+    """Virtual users repeating the dashboard's data request against one target."""
+
+    def __init__(self, target_url: str = BACKEND_URL, path: str = DEFAULT_PATH, users: int = 10,
+                 duration: float = 60.0, ramp_seconds: float = 0.0, bucket_seconds: float = BUCKET_SECONDS,
+                 think_time: float = 0.0, verify: bool = False):
+        self.target_url = target_url.rstrip("/")
+        self.path = path
+        self.users = users
+        self.duration = duration
+        self.ramp_seconds = ramp_seconds
+        self.bucket_seconds = bucket_seconds
+        self.think_time = think_time
+        self.verify = verify
+        self.samples: List[RequestSample] = []
+
+    async def _user(self, user: int, client: httpx.AsyncClient, started: float):
+        # Users start evenly spread across the ramp, then loop until the deadline
+        if self.ramp_seconds and self.users > 1:
+            await asyncio.sleep(self.ramp_seconds * user / (self.users - 1))
+        deadline = started + self.duration
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            status = None
+            try:
+                resp = await client.get(self.path)
+                status = resp.status_code
+                await resp.aread()
+                ok = resp.status_code < 400
+            except httpx.HTTPError as e:
+                ok = False
+                logger.debug(f"User {user} request failed: {e}")
+            self.samples.append(RequestSample(
+                user=user,
+                started=start - started,
+                latency_ms=(time.perf_counter() - start) * 1000,
+                ok=ok,
+                status=status,
+            ))
+            if self.think_time:
+                await asyncio.sleep(self.think_time)
+
+    async def run(self) -> Dict:
+        self.samples = []
+        limits = httpx.Limits(max_connections=self.users, max_keepalive_connections=self.users)
+        async with httpx.AsyncClient(base_url=self.target_url, limits=limits, verify=self.verify,
+                                     timeout=REQUEST_TIMEOUT) as client:
+            started = time.perf_counter()
+            await asyncio.gather(*(self._user(i, client, started) for i in range(self.users)))
+            elapsed = time.perf_counter() - started
+        return self.report(elapsed)
+
+    def _active_users(self, at: float) -> int:
+        if not self.ramp_seconds or self.users <= 1:
+            return self.users
+        return min(self.users, int(at / (self.ramp_seconds / (self.users - 1))) + 1)
+
+    def report(self, elapsed: float) -> Dict:
+        buckets: Dict[int, List[RequestSample]] = {}
+        for sample in self.samples:
+            buckets.setdefault(int(sample.started // self.bucket_seconds), []).append(sample)
+
+        timeline = []
+        for index in sorted(buckets):
+            start = index * self.bucket_seconds
+            span = min(self.bucket_seconds, max(elapsed - start, 1e-9))
+            point = summarize(buckets[index], span)
+            point["t"] = round(start, 1)
+            point["active_users"] = self._active_users(start + span)
+            timeline.append(point)
+
+        return {
+            "target": f"{self.target_url}{self.path}",
+            "users": self.users,
+            "duration_seconds": round(elapsed, 2),
+            "overall": summarize(self.samples, elapsed),
+            "timeline": timeline,
+        }
+
+
+def print_load_report(report: Dict):
+    overall = report["overall"]
+    print("\n" + "=" * 70)
+    print(f"LOAD TEST - {report['users']} users -> {report['target']}")
+    print("=" * 70)
+    print(f"Requests: {overall['requests']} in {report['duration_seconds']}s "
+          f"({overall['throughput_rps']} req/s), errors {overall['error_rate']}%")
+    latency = overall["latency_ms"]
+    if latency:
+        print(f"Latency: p50 {latency['p50']}ms  p90 {latency['p90']}ms  p99 {latency['p99']}ms")
+    print()
+    print(f"{'t (s)':>7} {'users':>6} {'req/s':>8} {'err%':>6} {'p50':>8} {'p90':>8} {'p99':>8}")
+    print("-" * 70)
+    for point in report["timeline"]:
+        lat = point["latency_ms"]
+        print(f"{point['t']:>7.1f} {point['active_users']:>6} {point['throughput_rps']:>8.1f} {point['error_rate']:>6.1f} "
+              f"{lat.get('p50', 0):>8.1f} {lat.get('p90', 0):>8.1f} {lat.get('p99', 0):>8.1f}")
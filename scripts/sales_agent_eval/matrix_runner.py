@@ -0,0 +1,166 @@
+"""
+Sales Agent Evaluation Matrix
+Runs every CEO question x phrasing (base + QUESTION_VARIANTS) x scenario
+dataset (TEST_SCENARIOS) as independent cells. Agent answers come from one
+warmed evaluator per scenario and take well under a millisecond each, so the
+cells are answered in sequence; scoring, the CPU-heavy part, happens in one
+batch afterwards through ScoringAgent.score_many. That batch uses a process
+pool of `workers` only from INLINE_SCORE_LIMIT cells up; the default matrix
+is smaller and scores inline. With a judge, `workers` bounds how many cells
+are judged at once.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, asdict
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from metrics import TEST_SCENARIOS
+from test_harness import QUESTION_VARIANTS
+from eval_runner import CEO_QUESTIONS, SalesAgentEvaluator
+from scoring_agent import LLMScoringAgent
+from synthetic_data import SCENARIO_PROFILES, generate_events
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MatrixCell:
+    scenario: str
+    question_id: str
+    variant: int            # 0 = base question, 1.. = QUESTION_VARIANTS index + 1
+    question: str
+    response: str = ""
+    response_time_ms: float = 0.0
+    score: float = 0.0
+    passed: bool = False
+    meets_scenario_min: bool = False
+    feedback: str = ""
+
+
+def build_cells(scenarios: Optional[List[str]] = None) -> List[MatrixCell]:
+    """Expand questions x phrasings x scenarios."""
+    cells = []
+    for scenario in scenarios or [s for s in TEST_SCENARIOS if s in SCENARIO_PROFILES]:
+        for q in CEO_QUESTIONS:
+            phrasings = [q["q"]] + QUESTION_VARIANTS.get(q["id"], [])
+            for variant, question in enumerate(phrasings):
+                cells.append(MatrixCell(scenario=scenario, question_id=q["id"], variant=variant, question=question))
+    return cells
+
+
+def scenario_data(scenario: str, evaluator: SalesAgentEvaluator, n_events: Optional[int] = None,
+                  seed: int = 0) -> Tuple[List[Dict], Dict]:
+    """Seeded synthetic dataset for a scenario (its default size unless n_events is given)."""
+    events = list(generate_events(scenario, n_events, seed))
+    return events, evaluator._calculate_gc_metrics(events)
+
+
+class MatrixRunner:
+    """Runs the evaluation matrix with one warmed evaluator per scenario dataset."""
+
+    def __init__(self, base: SalesAgentEvaluator, workers: Optional[int] = None,
+                 scenario_events: Optional[int] = None, seed: int = 0):
+        self.base = base
+        self.scorer = base.scorer
+        self.workers = workers      # scoring processes / concurrent judged cells; None = default
+        self.scenario_events = scenario_events
+        self.seed = seed
+        self.evaluators: Dict[str, SalesAgentEvaluator] = {}
+
+    def _evaluator_for(self, scenario: str) -> SalesAgentEvaluator:
+        evaluator = self.evaluators.get(scenario)
+        if evaluator is None:
+            evaluator = SalesAgentEvaluator(use_mock=True)
+            evaluator.events, evaluator.gc_metrics = scenario_data(
+                scenario, evaluator, self.scenario_events, self.seed)
+            evaluator.warm(date.today())
+            self.evaluators[scenario] = evaluator
+        return evaluator
+
+    def _run_cell(self, cell: MatrixCell):
+        evaluator = self.evaluators[cell.scenario]
+        start = time.perf_counter()
+        cell.response = evaluator.call_sales_agent(cell.question)
+        cell.response_time_ms = round((time.perf_counter() - start) * 1000, 2)
+
+    async def run(self, scenarios: Optional[List[str]] = None) -> Dict:
+        """Run every cell and return the per-cell results plus rollups."""
+        started = time.perf_counter()
+        cells = build_cells(scenarios)
+        for scenario in {cell.scenario for cell in cells}:
+            self._evaluator_for(scenario)
+
+        for cell in cells:
+            self._run_cell(cell)
+
+        items = [(cell.question_id, cell.question, cell.response) for cell in cells]
+        if isinstance(self.scorer, LLMScoringAgent):
+            score_results = await self.scorer.score_many_with_llm(items, workers=self.workers)
+        else:
+            score_results = [result for _, result in self.scorer.score_many(items, workers=self.workers)]
+
+        for cell, result in zip(cells, score_results):
+            cell.score = result["total_score"]
+            cell.passed = result["passed"]
+            cell.meets_scenario_min = cell.score >= TEST_SCENARIOS[cell.scenario]["expected_scores"]["min"]
+            cell.feedback = result["feedback"]
+
+        return self._report(cells, time.perf_counter() - started)
+
+    @staticmethod
+    def _report(cells: List[MatrixCell], elapsed: float) -> Dict:
+        def rollup(key) -> Dict[str, Dict]:
+            groups: Dict[str, List[MatrixCell]] = {}
+            for cell in cells:
+                groups.setdefault(key(cell), []).append(cell)
+            return {
+                name: {
+                    "cells": len(group),
+                    "avg_score": round(sum(c.score for c in group) / len(group), 1),
+                    "pass_rate": round(sum(1 for c in group if c.passed) / len(group) * 100, 1),
+                    "min_score": min(c.score for c in group),
+                }
+                for name, group in groups.items()
+            }
+
+        by_scenario = rollup(lambda c: c.scenario)
+        for name, summary in by_scenario.items():
+            expected = TEST_SCENARIOS[name]["expected_scores"]
+            summary["expected_min"] = expected["min"]
+            summary["expected_target"] = expected["target"]
+            summary["meets_min"] = summary["avg_score"] >= expected["min"]
+
+        return {
+            "cells": [asdict(cell) for cell in cells],
+            "by_scenario": by_scenario,
+            "by_question": rollup(lambda c: c.question_id),
+            "weakest_phrasings": [
+                {"scenario": c.scenario, "question_id": c.question_id, "question": c.question, "score": c.score}
+                for c in sorted(cells, key=lambda c: c.score)[:10]
+            ],
+            "elapsed_seconds": round(elapsed, 3),
+        }
+
+
+def print_matrix(report: Dict):
+    """Print the scenario and question rollups of a matrix report."""
+    print("\n" + "=" * 70)
+    print(f"EVALUATION MATRIX - {len(report['cells'])} cells in {report['elapsed_seconds']}s")
+    print("=" * 70)
+    print(f"{'Scenario':<20} {'Avg':>6} {'Pass%':>7} {'Min':>6} {'Expected':>9}")
+    print("-" * 70)
+    for name, s in report["by_scenario"].items():
+        status = "✓" if s["meets_min"] else "✗"
+        print(f"{name:<20} {s['avg_score']:>6.1f} {s['pass_rate']:>7.1f} {s['min_score']:>6.1f} {s['expected_min']:>7}+ {status}")
+
+    print()
+    print(f"{'Question':<20} {'Avg':>6} {'Pass%':>7} {'Min':>6}")
+    print("-" * 70)
+    for name, s in report["by_question"].items():
+        print(f"{name:<20} {s['avg_score']:>6.1f} {s['pass_rate']:>7.1f} {s['min_score']:>6.1f}")
+
+    print("\nWEAKEST PHRASINGS:")
+    for c in report["weakest_phrasings"][:5]:
+        print(f"  [{c['scenario']}] {c['question']!r} -> {c['score']}")
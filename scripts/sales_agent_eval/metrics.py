@@ -15,6 +15,12 @@ WEIGHTS = {
 # Minimum acceptable score (0-100)
 PASS_THRESHOLD = 75
 
+# Maximum acceptable p95 response time in timing mode (milliseconds)
+LATENCY_SLO_MS = 500
+
+# Share of the total taken by the LLM judge when LLMScoringAgent is used
+LLM_WEIGHT = 0.30
+
 # Each question's expected elements
 QUESTION_CRITERIA = {
     "bid_volume": {
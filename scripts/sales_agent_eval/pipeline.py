@@ -0,0 +1,170 @@
+"""
+Bid Pipeline State Machine
+Tracks each project through RFP -> PROPOSAL -> WON / LOST (or STALE when a
+proposal goes unanswered), updated one event at a time. Pending projects are
+indexed by proposal age, open and stale proposals separately, so expiring
+only moves the newly aged prefix and pipeline counts are bisect positions.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from heapq import merge
+from itertools import islice
+from datetime import date, timedelta
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from event_frame import UNKNOWN
+from turnaround import event_time, project_key
+
+STALE_AFTER_DAYS = 60     # No decision this long after the last proposal
+FOLLOW_UP_AFTER_DAYS = 7
+
+
+class BidState(Enum):
+    RFP = "rfp"
+    PROPOSAL = "proposal"
+    STALE = "stale"
+    WON = "won"
+    LOST = "lost"
+
+
+AWAITING_DECISION = (BidState.PROPOSAL, BidState.STALE)
+DECIDED = {"WON": BidState.WON, "LOST": BidState.LOST}
+
+
+@dataclass
+class ProjectBid:
+    key: str
+    project_name: str
+    state: BidState
+    assignee: str = UNKNOWN
+    gc_name: Optional[str] = None
+    rfp_at: Optional[date] = None
+    proposal_at: Optional[date] = None
+    proposal_value: int = 0       # latest quoted amount
+    proposals: int = 0
+    decided_at: Optional[date] = None
+
+    def age_days(self, today: date) -> int:
+        return (today - self.proposal_at).days if self.proposal_at else 0
+
+
+class BidPipeline:
+    """Per-project bid states with a by-state index and a proposal-age index."""
+
+    def __init__(self):
+        self.projects: Dict[str, ProjectBid] = {}
+        self.by_state: Dict[BidState, Dict[str, ProjectBid]] = {state: {} for state in BidState}
+        self.pending_value = 0
+        self._by_age: List[Tuple[date, str]] = []   # (proposal_at, key) for PROPOSAL projects
+        self._stale: List[Tuple[date, str]] = []    # (proposal_at, key) for STALE projects
+
+    @classmethod
+    def from_events(cls, events: Iterable[Dict]) -> "BidPipeline":
+        # Transitions are order-independent (decisions are terminal, proposal dates take the max)
+        pipeline = cls()
+        pipeline.add_many(events)
+        return pipeline
+
+    def _move(self, bid: ProjectBid, state: BidState):
+        del self.by_state[bid.state][bid.key]
+        bid.state = state
+        self.by_state[state][bid.key] = bid
+
+    def _age_index(self, state: BidState) -> List[Tuple[date, str]]:
+        return self._stale if state == BidState.STALE else self._by_age
+
+    def _unindex(self, bid: ProjectBid):
+        if bid.state in AWAITING_DECISION:
+            index = self._age_index(bid.state)
+            del index[bisect_left(index, (bid.proposal_at, bid.key))]
+            self.pending_value -= bid.proposal_value
+
+    def _index(self, bid: ProjectBid):
+        if bid.state in AWAITING_DECISION:
+            insort(self._age_index(bid.state), (bid.proposal_at, bid.key))
+            self.pending_value += bid.proposal_value
+
+    def add(self, event: Dict):
+        """Apply one event to its project's state."""
+        event_type = event.get("event_type")
+        if event_type not in ("RFP_RECEIVED", "PROPOSAL_SENT", "WON", "LOST"):
+            return
+        key = project_key(event)
+        if key is None:
+            return
+        day = event_time(event).date()
+
+        bid = self.projects.get(key)
+        if bid is None:
+            bid = ProjectBid(key=key, project_name=event.get("project_name") or key, state=BidState.RFP,
+                             assignee=event.get("assignee") or UNKNOWN, gc_name=event.get("gc_name"))
+            self.projects[key] = bid
+            self.by_state[BidState.RFP][key] = bid
+        if not bid.gc_name and event.get("gc_name"):
+            bid.gc_name = event["gc_name"]
+
+        if bid.state in (BidState.WON, BidState.LOST):
+            return
+
+        if event_type == "RFP_RECEIVED":
+            if bid.rfp_at is None or day < bid.rfp_at:
+                bid.rfp_at = day
+
+        elif event_type == "PROPOSAL_SENT":
+            self._unindex(bid)
+            bid.proposals += 1
+            if bid.proposal_at is None or day >= bid.proposal_at:
+                bid.proposal_at = day
+                bid.proposal_value = event.get("dollar_amount") or bid.proposal_value
+                bid.assignee = event.get("assignee") or bid.assignee
+            if bid.state != BidState.PROPOSAL:
+                self._move(bid, BidState.PROPOSAL)
+            self._index(bid)
+
+        else:
+            self._unindex(bid)
+            bid.decided_at = day
+            self._move(bid, DECIDED[event_type])
+
+    def add_many(self, events: Iterable[Dict]):
+        for event in events:
+            self.add(event)
+
+    def expire(self, today: date, stale_after_days: int = STALE_AFTER_DAYS) -> int:
+        """
+        Mark proposals older than the cutoff STALE. Only open proposals are in
+        _by_age, so this touches just the prefix that aged out since the last
+        call and moves it to the stale index.
+        """
+        cutoff = today - timedelta(days=stale_after_days)
+        end = bisect_right(self._by_age, (cutoff, "\uffff"))
+        if not end:
+            return 0
+        expired = self._by_age[:end]
+        del self._by_age[:end]
+        for _, key in expired:
+            self._move(self.projects[key], BidState.STALE)
+        # Two sorted runs: timsort merges them in linear time
+        self._stale.extend(expired)
+        self._stale.sort()
+        return end
+
+    # Queries
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._by_age) + len(self._stale)
+
+    def oldest_pending(self, limit: int = 5) -> List[ProjectBid]:
+        """Projects awaiting decision (open or stale), longest-waiting first."""
+        return [self.projects[key] for _, key in islice(merge(self._stale, self._by_age), limit)]
+
+    def follow_up_count(self, today: date, after_days: int = FOLLOW_UP_AFTER_DAYS) -> int:
+        """How many pending proposals were sent at least `after_days` ago."""
+        bound = (today - timedelta(days=after_days), "\uffff")
+        return bisect_right(self._stale, bound) + bisect_right(self._by_age, bound)
+
+    def in_state(self, state: BidState) -> List[ProjectBid]:
+        return list(self.by_state[state].values())
@@ -0,0 +1,152 @@
+"""
+Eval Results Store
+Append-only history of evaluation runs. Each run's question results go to
+runs/<run_id>.jsonl and one summary line (per-question scores) is appended to
+index.jsonl, so trend and regression queries read only the index - from the
+tail for recent history, streamed from the start for first-occurrence scans.
+"""
+
+import json
+import logging
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from metrics import PASS_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+# Outside the source tree: $EVAL_STORE_DIR, else the user data directory
+STORE_DIR = os.getenv("EVAL_STORE_DIR") or str(
+    Path(os.getenv("XDG_DATA_HOME") or Path.home() / ".local" / "share") / "sales_agent_eval" / "eval_store"
+)
+TAIL_BLOCK_SIZE = 64 * 1024
+REGRESSION_DROP = 5.0  # Score points lost vs the previous run that count as a regression
+
+
+def tail_lines(path: Path, n: int, block_size: int = TAIL_BLOCK_SIZE) -> List[str]:
+    """Last n lines of a file, reading backwards in blocks."""
+    if n <= 0 or not path.exists():
+        return []
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b""
+        while position > 0 and data.count(b"\n") <= n:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+    lines = [line for line in data.decode("utf-8").splitlines() if line.strip()]
+    return lines[-n:]
+
+
+class ResultsStore:
+    """JSONL run files plus a one-line-per-run index."""
+
+    def __init__(self, root: str = STORE_DIR):
+        self.root = Path(root)
+        self.runs_dir = self.root / "runs"
+        self.index_path = self.root / "index.jsonl"
+
+    # Writing
+
+    def append_run(self, iteration: Dict, run_id: Optional[str] = None) -> str:
+        """
+        Persist one evaluation iteration (an asdict(EvalIteration)). The run
+        file is written before its index line, so the index never points at a
+        missing run.
+        """
+        self.runs_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = iteration.get("timestamp") or datetime.utcnow().isoformat()
+        run_id = run_id or f"{datetime.fromisoformat(timestamp):%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:6]}"
+
+        with open(self.runs_dir / f"{run_id}.jsonl", "w") as f:
+            for result in iteration["results"]:
+                f.write(json.dumps(result) + "\n")
+
+        entry = {
+            "run_id": run_id,
+            "timestamp": timestamp,
+            "iteration": iteration.get("iteration"),
+            "avg_score": iteration.get("avg_score"),
+            "pass_rate": iteration.get("pass_rate"),
+            "scores": {r["question_id"]: r["score"] for r in iteration["results"]},
+            "passed": {r["question_id"]: r["passed"] for r in iteration["results"]},
+        }
+        with open(self.index_path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        return run_id
+
+    # Reading
+
+    def iter_runs(self) -> Iterator[Dict]:
+        """Index entries oldest first, streamed."""
+        if not self.index_path.exists():
+            return
+        with open(self.index_path) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def recent_runs(self, limit: int) -> List[Dict]:
+        """Last `limit` index entries, oldest first, without reading the whole index."""
+        return [json.loads(line) for line in tail_lines(self.index_path, limit)]
+
+    def load_run(self, run_id: str) -> List[Dict]:
+        with open(self.runs_dir / f"{run_id}.jsonl") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    # Queries
+
+    def score_trend(self, question_id: str, last_n: int = 50) -> List[Dict]:
+        """(run_id, timestamp, score, passed) for a question over the last N runs."""
+        return [
+            {
+                "run_id": run["run_id"],
+                "timestamp": run["timestamp"],
+                "score": run["scores"][question_id],
+                "passed": run["passed"][question_id],
+            }
+            for run in self.recent_runs(last_n)
+            if question_id in run["scores"]
+        ]
+
+    def first_regression(self, question_id: str, min_drop: float = REGRESSION_DROP,
+                         threshold: float = PASS_THRESHOLD) -> Optional[Dict]:
+        """
+        First run where the question scored at least `min_drop` below the
+        previous run, or fell under `threshold` after passing it.
+        """
+        previous = None
+        for run in self.iter_runs():
+            score = run["scores"].get(question_id)
+            if score is None:
+                continue
+            if previous is not None:
+                prev_score, prev_run = previous
+                if prev_score - score >= min_drop or (prev_score >= threshold > score):
+                    return {
+                        "run_id": run["run_id"],
+                        "timestamp": run["timestamp"],
+                        "score": score,
+                        "previous_run_id": prev_run,
+                        "previous_score": prev_score,
+                    }
+            previous = (score, run["run_id"])
+        return None
+
+
+_store: Optional[ResultsStore] = None
+
+
+def get_store() -> ResultsStore:
+    """Get or create the shared store instance."""
+    global _store
+    if _store is None:
+        _store = ResultsStore()
+    return _store
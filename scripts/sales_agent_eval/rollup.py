@@ -0,0 +1,191 @@
+"""
+Sales Rollup Cube
+Pre-aggregated counts and dollar sums keyed by (assignee, gc, event_type, day),
+plus the marginals the CEO questions read. Built once from an EventFrame and
+updated event by event, so answers cost the same regardless of history length.
+"""
+
+from bisect import insort
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from event_frame import EventFrame, DEFAULT_DAY, UNKNOWN
+
+RECENT_LIMIT = 10  # Most recent events kept per type for listings
+
+CubeKey = Tuple[str, Optional[str], str, date]
+
+
+@dataclass
+class RollupCell:
+    count: int = 0
+    dollars: int = 0
+    priced: int = 0      # events that carried a dollar_amount
+
+    def add(self, count: int, dollars: int, priced: int):
+        self.count += count
+        self.dollars += dollars
+        self.priced += priced
+
+
+def event_day(event: Dict) -> date:
+    """scanned_at -> date, matching EventFrame's parsing."""
+    try:
+        return date.fromisoformat((event.get("scanned_at") or DEFAULT_DAY)[:10])
+    except ValueError:
+        return date.fromisoformat(DEFAULT_DAY)
+
+
+def previous_month(year: int, month: int) -> Tuple[int, int]:
+    return (year - 1, 12) if month == 1 else (year, month - 1)
+
+
+class SalesRollup:
+    """Incrementally maintained rollup store for the sales analytics."""
+
+    def __init__(self):
+        self.cube: Dict[CubeKey, RollupCell] = {}
+        self.by_type: Dict[str, RollupCell] = {}
+        self.by_type_day: Dict[Tuple[str, date], RollupCell] = {}
+        self.by_assignee: Dict[Tuple[str, str], RollupCell] = {}
+        self.by_gc: Dict[Tuple[str, str], RollupCell] = {}
+        self.assignees: Dict[str, None] = {}      # first-appearance order
+        self.gcs: Dict[str, None] = {}
+        self.event_count = 0
+        self.largest_event: Optional[Dict] = None
+        self._largest_amount = 0
+        self._recent: Dict[str, List[Tuple[int, int, Dict]]] = {}
+        self._seq = 0
+
+    # Building
+
+    @classmethod
+    def from_events(cls, events: List[Dict]) -> "SalesRollup":
+        return cls.from_frame(EventFrame(events))
+
+    @classmethod
+    def from_frame(cls, frame: EventFrame) -> "SalesRollup":
+        """Bulk build: one vectorized group-by over the frame, then one dict write per cube cell."""
+        rollup = cls()
+        n = len(frame)
+        if n == 0:
+            return rollup
+
+        for person in frame.assignee.categories:
+            rollup.assignees[person] = None
+
+        # Composite cell key; -1 (missing) codes are shifted to 0
+        day_int = frame.day.astype(np.int64)
+        day_min = int(day_int.min())
+        n_days = int(day_int.max()) - day_min + 1
+        n_types = len(frame.event_type) + 1
+        n_gcs = len(frame.gc_name) + 1
+        key = (((frame.assignee.codes.astype(np.int64) * n_gcs + frame.gc_name.codes + 1) * n_types
+                + frame.event_type.codes + 1) * n_days + (day_int - day_min))
+
+        cells, inverse = np.unique(key, return_inverse=True)
+        counts = np.bincount(inverse, minlength=len(cells))
+        dollars = np.bincount(inverse, weights=frame.dollars, minlength=len(cells)).astype(np.int64)
+        priced = np.bincount(inverse, weights=frame.has_amount, minlength=len(cells)).astype(np.int64)
+
+        rest, day_off = np.divmod(cells, n_days)
+        rest, type_code = np.divmod(rest, n_types)
+        assignee_code, gc_code = np.divmod(rest, n_gcs)
+
+        types = [None] + frame.event_type.categories
+        gcs = [None] + frame.gc_name.categories
+        for i in range(len(cells)):
+            day = date.fromordinal(date(1970, 1, 1).toordinal() + day_min + int(day_off[i]))
+            cube_key = (frame.assignee.categories[assignee_code[i]], gcs[gc_code[i]], types[type_code[i]], day)
+            rollup._add_cell(cube_key, int(counts[i]), int(dollars[i]), int(priced[i]))
+
+        rollup.event_count = n
+        rollup._seq = n
+        largest = frame.largest()
+        if largest is not None:
+            rollup.largest_event = largest
+            rollup._largest_amount = largest["dollar_amount"]
+
+        # Latest events per type, ties in input order
+        order = np.lexsort((np.arange(n), -day_int))
+        for code, event_type in enumerate(frame.event_type.categories):
+            idx = order[frame.event_type.codes[order] == code][:RECENT_LIMIT]
+            rollup._recent[event_type] = [(-int(day_int[i]), int(i), frame.events[i]) for i in idx]
+
+        return rollup
+
+    def _add_cell(self, key: CubeKey, count: int, dollars: int, priced: int):
+        assignee, gc, event_type, day = key
+        for table, k in ((self.cube, key),
+                         (self.by_type, event_type),
+                         (self.by_type_day, (event_type, day)),
+                         (self.by_assignee, (assignee, event_type)),
+                         (self.by_gc, (gc, event_type))):
+            cell = table.get(k)
+            if cell is None:
+                cell = table[k] = RollupCell()
+            cell.add(count, dollars, priced)
+        self.assignees.setdefault(assignee, None)
+        if gc is not None:
+            self.gcs.setdefault(gc, None)
+
+    def add(self, event: Dict):
+        """Fold one new event into every aggregate."""
+        amount = event.get("dollar_amount") or 0
+        day = event_day(event)
+        key = (event.get("assignee") or UNKNOWN, event.get("gc_name"), event.get("event_type"), day)
+        self._add_cell(key, 1, amount, 1 if amount else 0)
+        self.event_count += 1
+
+        if amount > self._largest_amount:
+            self._largest_amount = amount
+            self.largest_event = event
+
+        recent = self._recent.setdefault(event.get("event_type"), [])
+        insort(recent, (-(day - date(1970, 1, 1)).days, self._seq, event), key=lambda r: r[:2])
+        del recent[RECENT_LIMIT:]
+        self._seq += 1
+
+    def add_many(self, events: Iterable[Dict]):
+        for event in events:
+            self.add(event)
+
+    # Queries
+
+    def type_total(self, event_type: str) -> RollupCell:
+        return self.by_type.get(event_type) or RollupCell()
+
+    def window_total(self, event_type: str, start: date, end: date) -> RollupCell:
+        """Totals for start <= day < end; cost is the window length in days."""
+        total = RollupCell()
+        day = start
+        while day < end:
+            cell = self.by_type_day.get((event_type, day))
+            if cell is not None:
+                total.add(cell.count, cell.dollars, cell.priced)
+            day += timedelta(days=1)
+        return total
+
+    def month_total(self, event_type: str, year: int, month: int) -> RollupCell:
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return self.window_total(event_type, date(year, month, 1), date(next_year, next_month, 1))
+
+    def assignee_total(self, assignee: str, event_type: str) -> RollupCell:
+        return self.by_assignee.get((assignee, event_type)) or RollupCell()
+
+    def gc_total(self, gc: str, event_type: str) -> RollupCell:
+        return self.by_gc.get((gc, event_type)) or RollupCell()
+
+    def recent(self, event_type: str, limit: int, start: Optional[date] = None) -> List[Dict]:
+        """Most recent events of a type (newest first), optionally on/after `start`."""
+        rows = []
+        for neg_day, _, event in self._recent.get(event_type, ()):
+            if start is not None and -neg_day < (start - date(1970, 1, 1)).days:
+                break
+            rows.append(event)
+            if len(rows) == limit:
+                break
+        return rows
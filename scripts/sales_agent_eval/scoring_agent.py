@@ -4,15 +4,67 @@ Evaluates Sales Agent responses against defined metrics.
 Uses both rule-based scoring and LLM-based evaluation.
 """
 
+import asyncio
+import os
 import re
 import logging
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain, islice
+from multiprocessing import Pool
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
+from dataclasses import dataclass, field
 
-from metrics import QUESTION_CRITERIA, WEIGHTS, PASS_THRESHOLD
+from metrics import QUESTION_CRITERIA, WEIGHTS, PASS_THRESHOLD, LLM_WEIGHT
 
 logger = logging.getLogger(__name__)
 
+FEATURE_CACHE_SIZE = 4096  # Eval runs re-score identical responses across iterations
+SCORE_CHUNK_SIZE = 64      # Responses per process-pool task
+INLINE_SCORE_LIMIT = 256   # Smaller batches are scored in-process; pool startup costs more
+
+ScoreItem = Tuple[str, str, str]  # (question_id, question, response)
+
+# Case-insensitive patterns are compiled twice: a case-sensitive version run on
+# the lowercased response (much faster) and the IGNORECASE original. The only
+# characters IGNORECASE folds differently from str.lower() onto the ASCII
+# letters these patterns use are İ, ı and ſ; responses containing them take
+# the IGNORECASE path so scores stay identical.
+FOLD_EXCEPTIONS = re.compile("[\u0130\u0131\u017f]")
+
+
+def compile_pair(pattern: str) -> Tuple[Pattern, Pattern]:
+    """(case-sensitive, IGNORECASE) compiled versions of a lowercase pattern."""
+    return re.compile(pattern), re.compile(pattern, re.IGNORECASE)
+
+
+# Compiled once at import; every dimension reads the features extracted with these
+NUMBER = re.compile(r'\d+')
+DOLLARS = re.compile(r'\$[\d,]+')
+PERCENTAGE = re.compile(r'\d+%')
+TIME_CONTEXT = compile_pair(r'days?|month|week|last')
+BOLD = re.compile(r'\*\*.*\*\*')
+LIST_ITEM = re.compile(r'[•\-]\s|\d+\.')
+
+ACTIONABLE_INDICATORS = [compile_pair(p) for p in (
+    r"💡",                          # Tip icon
+    r"recommend|suggest|should|consider",
+    r"focus\s*on",
+    r"target|goal",
+    r"✅|⚠️|🔴",                   # Status indicators
+    r"top\s*\d+|best|worst",
+    r"action|priority",
+)]
+
+CONTEXT_INDICATORS = [compile_pair(p) for p in (
+    r"vs\s*(last|previous)",        # Comparison
+    r"was\s*\d+",                   # Historical
+    r"[↑↓→]",                       # Trend arrows
+    r"benchmark|target|goal",
+    r"industry|standard|competitive",
+    r"compared|comparison",
+    r"better|worse|same",
+)]
+
 
 @dataclass
 class ScoreResult:
@@ -24,12 +76,91 @@ class ScoreResult:
     feedback: str
 
 
+@dataclass
+class BatchStats:
+    """Running aggregates over a score_many stream."""
+    count: int = 0
+    passed: int = 0
+    score_sum: float = 0.0
+    min_score: Optional[float] = None
+    max_score: Optional[float] = None
+    dimension_sums: Dict[str, float] = field(default_factory=dict)
+
+    def add(self, result: Dict):
+        score = result["total_score"]
+        self.count += 1
+        self.passed += 1 if result["passed"] else 0
+        self.score_sum += score
+        self.min_score = score if self.min_score is None else min(self.min_score, score)
+        self.max_score = score if self.max_score is None else max(self.max_score, score)
+        for dim, value in result["dimension_scores"].items():
+            self.dimension_sums[dim] = self.dimension_sums.get(dim, 0.0) + value
+
+    @property
+    def avg_score(self) -> float:
+        return self.score_sum / self.count if self.count else 0.0
+
+    @property
+    def pass_rate(self) -> float:
+        return self.passed / self.count * 100 if self.count else 0.0
+
+    def summary(self) -> Dict:
+        return {
+            "count": self.count,
+            "avg_score": round(self.avg_score, 1),
+            "pass_rate": round(self.pass_rate, 1),
+            "min_score": self.min_score,
+            "max_score": self.max_score,
+            "dimension_avgs": {dim: round(total / self.count, 1) for dim, total in self.dimension_sums.items()},
+        }
+
+
+@dataclass(frozen=True)
+class ResponseFeatures:
+    """Everything the rule-based dimensions need from a response, extracted in one pass."""
+    lower: str
+    fold_safe: bool       # case-sensitive patterns on `lower` match like IGNORECASE
+    number_count: int
+    has_dollars: bool
+    has_percentages: bool
+    has_time_context: bool
+    actionable_matches: int
+    context_matches: int
+    has_bold: bool
+    has_list: bool
+    line_breaks: int
+    word_count: int
+
+
+@lru_cache(maxsize=FEATURE_CACHE_SIZE)
+def extract_features(response: str) -> ResponseFeatures:
+    """Run every response-level regex once (memoized per response text)."""
+    lower = response.lower()
+    fold_safe = FOLD_EXCEPTIONS.search(response) is None
+    text, which = (lower, 0) if fold_safe else (response, 1)
+    return ResponseFeatures(
+        lower=lower,
+        fold_safe=fold_safe,
+        number_count=len(NUMBER.findall(response)),
+        has_dollars=DOLLARS.search(response) is not None,
+        has_percentages=PERCENTAGE.search(response) is not None,
+        has_time_context=TIME_CONTEXT[which].search(text) is not None,
+        actionable_matches=sum(1 for pair in ACTIONABLE_INDICATORS if pair[which].search(text)),
+        context_matches=sum(1 for pair in CONTEXT_INDICATORS if pair[which].search(text)),
+        has_bold=BOLD.search(response) is not None,
+        has_list=LIST_ITEM.search(response) is not None,
+        line_breaks=response.count('\n'),
+        word_count=len(response.split()),
+    )
+
+
 class ScoringAgent:
     """Scores Sales Agent responses against defined criteria."""
 
     def __init__(self, use_llm: bool = False):
         self.use_llm = use_llm
         self.element_patterns = self._build_element_patterns()
+        self.compiled_elements = self._compile_element_patterns(self.element_patterns)
 
     def _build_element_patterns(self) -> Dict[str, Dict[str, List[str]]]:
         """Build regex patterns to detect required elements in responses."""
@@ -92,25 +223,31 @@ class ScoringAgent:
             },
         }
 
-    def _check_element(self, response: str, patterns: List[str]) -> bool:
-        """Check if any pattern matches in the response."""
-        response_lower = response.lower()
-        for pattern in patterns:
-            if re.search(pattern, response_lower, re.IGNORECASE):
-                return True
-        return False
+    @staticmethod
+    def _compile_element_patterns(
+        element_patterns: Dict[str, Dict[str, List[str]]]
+    ) -> Dict[str, List[Tuple[str, Tuple[Pattern, Pattern]]]]:
+        """One compiled alternation per element; it matches iff any of its patterns does."""
+        return {
+            question_id: [
+                (element, compile_pair("|".join(f"(?:{p})" for p in patterns)))
+                for element, patterns in elements.items()
+            ]
+            for question_id, elements in element_patterns.items()
+        }
 
-    def _score_completeness(self, question_id: str, response: str) -> Tuple[float, List[str], List[str]]:
+    def _score_completeness(self, question_id: str, features: ResponseFeatures) -> Tuple[float, List[str], List[str]]:
         """Score how many required elements are present."""
-        if question_id not in self.element_patterns:
+        if question_id not in self.compiled_elements:
             return 50.0, [], ["unknown_question_type"]
 
-        patterns = self.element_patterns[question_id]
+        patterns = self.compiled_elements[question_id]
         found = []
         missing = []
 
-        for element, element_patterns in patterns.items():
-            if self._check_element(response, element_patterns):
+        which = 0 if features.fold_safe else 1
+        for element, pair in patterns:
+            if pair[which].search(features.lower):
                 found.append(element)
             else:
                 missing.append(element)
@@ -121,52 +258,31 @@ class ScoringAgent:
         score = (len(found) / len(patterns)) * 100
         return score, found, missing
 
-    def _score_accuracy(self, question_id: str, response: str) -> float:
+    def _score_accuracy(self, features: ResponseFeatures) -> float:
         """
         Score accuracy of data/calculations.
         In production, this would verify against actual data.
         For now, check for presence of numbers and consistency.
         """
         # Check for numbers (should have data)
-        numbers = re.findall(r'\d+', response)
-        if not numbers:
+        if not features.number_count:
             return 30.0  # No data = low accuracy score
 
-        # Check for dollar amounts
-        has_dollars = bool(re.search(r'\$[\d,]+', response))
-
-        # Check for percentages
-        has_percentages = bool(re.search(r'\d+%', response))
-
-        # Check for dates/time references
-        has_time_context = bool(re.search(r'days?|month|week|last', response, re.IGNORECASE))
-
         score = 50.0  # Base score
-        if has_dollars:
+        if features.has_dollars:
             score += 15
-        if has_percentages:
+        if features.has_percentages:
             score += 15
-        if has_time_context:
+        if features.has_time_context:
             score += 10
-        if len(numbers) >= 3:
+        if features.number_count >= 3:
             score += 10
 
         return min(100, score)
 
-    def _score_actionability(self, response: str) -> float:
+    def _score_actionability(self, features: ResponseFeatures) -> float:
         """Score how actionable the insights are."""
-        actionable_indicators = [
-            r"💡",                          # Tip icon
-            r"recommend|suggest|should|consider",
-            r"focus\s*on",
-            r"target|goal",
-            r"✅|⚠️|🔴",                   # Status indicators
-            r"top\s*\d+|best|worst",
-            r"action|priority",
-        ]
-
-        matches = sum(1 for pattern in actionable_indicators
-                     if re.search(pattern, response, re.IGNORECASE))
+        matches = features.actionable_matches
 
         # Score based on matches (0-3+ indicators)
         if matches >= 3:
@@ -178,20 +294,9 @@ class ScoringAgent:
         else:
             return 40.0
 
-    def _score_context(self, response: str) -> float:
+    def _score_context(self, features: ResponseFeatures) -> float:
         """Score presence of context/benchmarks."""
-        context_indicators = [
-            r"vs\s*(last|previous)",        # Comparison
-            r"was\s*\d+",                   # Historical
-            r"[↑↓→]",                       # Trend arrows
-            r"benchmark|target|goal",
-            r"industry|standard|competitive",
-            r"compared|comparison",
-            r"better|worse|same",
-        ]
-
-        matches = sum(1 for pattern in context_indicators
-                     if re.search(pattern, response, re.IGNORECASE))
+        matches = features.context_matches
 
         if matches >= 3:
             return 100.0
@@ -202,25 +307,24 @@ class ScoringAgent:
         else:
             return 25.0
 
-    def _score_formatting(self, response: str) -> float:
+    def _score_formatting(self, features: ResponseFeatures) -> float:
         """Score readability and formatting."""
         score = 50.0  # Base
 
         # Has markdown formatting
-        if re.search(r'\*\*.*\*\*', response):
+        if features.has_bold:
             score += 15
 
         # Has bullet points or numbered lists
-        if re.search(r'[•\-]\s|\d+\.', response):
+        if features.has_list:
             score += 15
 
         # Has line breaks (not a wall of text)
-        if response.count('\n') >= 2:
+        if features.line_breaks >= 2:
             score += 10
 
         # Reasonable length (not too short, not too long)
-        word_count = len(response.split())
-        if 30 <= word_count <= 200:
+        if 30 <= features.word_count <= 200:
             score += 10
 
         return min(100, score)
@@ -228,12 +332,13 @@ class ScoringAgent:
     def score_response(self, question_id: str, question: str, response: str) -> Dict:
         """Score a response across all dimensions."""
 
-        # Score each dimension
-        completeness, found, missing = self._score_completeness(question_id, response)
-        accuracy = self._score_accuracy(question_id, response)
-        actionability = self._score_actionability(response)
-        context = self._score_context(response)
-        formatting = self._score_formatting(response)
+        # Score each dimension from a single feature pass
+        features = extract_features(response)
+        completeness, found, missing = self._score_completeness(question_id, features)
+        accuracy = self._score_accuracy(features)
+        actionability = self._score_actionability(features)
+        context = self._score_context(features)
+        formatting = self._score_formatting(features)
 
         dimension_scores = {
             "completeness": completeness,
@@ -263,6 +368,35 @@ class ScoringAgent:
             "feedback": feedback,
         }
 
+    def score_many(self, items: Iterable[ScoreItem], workers: Optional[int] = None,
+                   chunksize: int = SCORE_CHUNK_SIZE,
+                   stats: Optional[BatchStats] = None) -> Iterator[Tuple[str, Dict]]:
+        """
+        Score (question_id, question, response) items, yielding (question_id, result)
+        in input order as they complete. Batches of INLINE_SCORE_LIMIT or more are
+        scored in `chunksize` chunks across a process pool (rule-based scoring only).
+        Aggregates accumulate in `stats` (also kept as self.batch_stats).
+        """
+        self.batch_stats = stats if stats is not None else BatchStats()
+        workers = workers or os.cpu_count() or 1
+        items = iter(items)
+        head = list(islice(items, INLINE_SCORE_LIMIT))
+
+        if len(head) < INLINE_SCORE_LIMIT or workers == 1:
+            for question_id, question, response in chain(head, items):
+                result = self.score_response(question_id, question, response)
+                self.batch_stats.add(result)
+                yield question_id, result
+            return
+
+        remaining = chain(head, items)
+        chunks = iter(lambda: list(islice(remaining, chunksize)), [])
+        with Pool(workers) as pool:
+            for scored in pool.imap(_score_chunk, chunks):
+                for question_id, result in scored:
+                    self.batch_stats.add(result)
+                    yield question_id, result
+
     def _generate_feedback(self, scores: Dict, found: List, missing: List, passed: bool) -> str:
         """Generate actionable feedback."""
         feedback_parts = []
@@ -287,26 +421,67 @@ class ScoringAgent:
         return "; ".join(feedback_parts)
 
 
+_worker_scorer: Optional[ScoringAgent] = None
+
+
+def _score_chunk(chunk: List[ScoreItem]) -> List[Tuple[str, Dict]]:
+    """Process-pool task: score one chunk with a per-worker ScoringAgent."""
+    global _worker_scorer
+    if _worker_scorer is None:
+        _worker_scorer = ScoringAgent()
+    return [(item[0], _worker_scorer.score_response(*item)) for item in chunk]
+
+
 class LLMScoringAgent(ScoringAgent):
     """Extended scoring agent that uses LLM for nuanced evaluation."""
 
-    def __init__(self, model: str = "gemini-2.0-flash"):
+    def __init__(self, model: str = "gemini-2.0-flash", backend: str = "gemini",
+                 max_concurrency: Optional[int] = None, cache_path: Optional[str] = None):
         super().__init__(use_llm=True)
+        from llm_judge import LLMJudge, VerdictCache, get_backend, MAX_CONCURRENCY, CACHE_PATH
         self.model = model
+        self.judge = LLMJudge(
+            get_backend(backend, model),
+            VerdictCache(cache_path or CACHE_PATH),
+            max_concurrency=max_concurrency or MAX_CONCURRENCY,
+        )
 
     async def score_with_llm(self, question_id: str, question: str, response: str) -> Dict:
         """Use LLM to score response quality."""
         # Get rule-based scores first
         base_scores = self.score_response(question_id, question, response)
 
-        # TODO: Add LLM-based evaluation for nuanced feedback
-        # This would call Gemini/Claude to evaluate:
-        # - Is the response actually helpful to a CEO?
-        # - Are there any misleading statements?
-        # - Is the tone appropriate?
-
+        verdict = await self.judge.judge(question, response)
+        if verdict is None:
+            return base_scores  # Judge unavailable - rule-based only
+
+        total = base_scores["total_score"] * (1 - LLM_WEIGHT) + verdict.score * LLM_WEIGHT
+        base_scores["total_score"] = round(total, 1)
+        base_scores["passed"] = total >= PASS_THRESHOLD and not verdict.misleading
+        base_scores["dimension_scores"]["llm_judge"] = round(verdict.score, 1)
+        base_scores["llm_verdict"] = {
+            "helpful": verdict.helpful,
+            "misleading": verdict.misleading,
+            "tone_ok": verdict.tone_ok,
+            "cached": verdict.cached,
+        }
+        if verdict.feedback:
+            base_scores["feedback"] = f"{base_scores['feedback']}; Judge: {verdict.feedback}"
         return base_scores
 
+    async def score_many_with_llm(self, items: Iterable[ScoreItem], workers: Optional[int] = None) -> List[Dict]:
+        """
+        Score (question_id, question, response) items, at most `workers` at a
+        time (default: the judge's max_concurrency). Results are in input order.
+        """
+        limit = asyncio.Semaphore(workers or self.judge.max_concurrency)
+
+        async def bounded(item: ScoreItem) -> Dict:
+            async with limit:
+                return await self.score_with_llm(*item)
+
+        return await asyncio.gather(*(bounded(item) for item in items))
+
 
 if __name__ == "__main__":
     # Test the scorer
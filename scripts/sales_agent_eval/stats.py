@@ -0,0 +1,29 @@
+"""
+Small statistics helpers shared by the analytics and timing code.
+"""
+
+import math
+from typing import Dict, Sequence
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Linear-interpolated percentile of an already sorted sequence (pct in 0-100)."""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100
+    lo = math.floor(rank)
+    hi = math.ceil(rank)
+    if lo == hi:
+        return float(sorted_values[lo])
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (rank - lo)
+
+
+def distribution(sorted_values: Sequence[float], percentiles: Sequence[int] = (50, 90)) -> Dict[str, float]:
+    """count / mean / pNN summary of a sorted sequence."""
+    summary = {
+        "count": len(sorted_values),
+        "mean": sum(sorted_values) / len(sorted_values) if sorted_values else 0.0,
+    }
+    for pct in percentiles:
+        summary[f"p{pct}"] = percentile(sorted_values, pct)
+    return summary
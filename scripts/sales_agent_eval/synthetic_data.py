@@ -0,0 +1,176 @@
+"""
+Synthetic Sales Events
+Seeded generator for realistic sales event histories matching the
+TEST_SCENARIOS (healthy_pipeline, sparse_data, no_wins). Projects run through
+RFP -> proposal (-> revised proposal / follow-up) -> won / lost, with
+per-assignee turnaround speed and lognormal bid sizes. Events are produced
+lazily and can be streamed to JSONL, so 10^7-event histories never sit in memory.
+
+Usage:
+    python synthetic_data.py healthy_pipeline 1000000 events.jsonl --seed 7
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import random
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+GC_NAMES_CSV = os.getenv("GC_NAMES_CSV", str(REPO_ROOT / "gc_names_consolidated.csv"))
+
+ASSIGNEES = ["fkohn", "bshinde", "csufrin", "tkode", "srosman", "jfogel", "lathuru", "ahirsch"]
+FALLBACK_GCS = [
+    "AIG Builders", "Emerald Builders", "Fettman Design", "B Contractors Group LLC",
+    "Lionstone Construction", "Apex Building Group", "Hudson Meridian", "Tri-State GC",
+]
+STREETS = [
+    "E 23rd St", "W 57th St", "Willoughby Ave", "Lafayette Ave", "Berwyn St", "Remsen St",
+    "Atlantic Ave", "Ocean Pkwy", "Broadway", "Myrtle Ave", "Nostrand Ave", "Flatbush Ave",
+    "Grand Concourse", "Jamaica Ave", "Queens Blvd", "Bedford Ave", "Eastern Pkwy", "E 144th St",
+]
+EVENT_LABELS = {
+    "RFP_RECEIVED": "RFP received", "PROPOSAL_SENT": "Proposal sent", "FOLLOW_UP": "Follow-up",
+    "WON": "Awarded", "LOST": "Not awarded",
+}
+PROJECT_TYPES = ["Roofing", "Waterproofing", "Roof replacement", "Facade + roofing", "Insulation"]
+
+
+@dataclass
+class ScenarioProfile:
+    history_days: int
+    assignees: int            # how many of ASSIGNEES are active
+    gcs: int                  # size of the GC pool
+    proposal_rate: float      # RFPs that get a proposal
+    revision_rate: float      # proposals revised once
+    follow_up_rate: float
+    win_rate: float           # of proposals
+    loss_rate: float          # of proposals; the rest stay pending
+    priced_rate: float        # events that carry a dollar_amount
+    default_events: int
+
+
+SCENARIO_PROFILES = {
+    "healthy_pipeline": ScenarioProfile(730, 8, 60, 0.85, 0.20, 0.35, 0.30, 0.45, 0.95, 2000),
+    "sparse_data": ScenarioProfile(30, 3, 8, 0.60, 0.05, 0.10, 0.25, 0.35, 0.60, 40),
+    "no_wins": ScenarioProfile(180, 6, 30, 0.80, 0.15, 0.40, 0.0, 0.0, 0.90, 800),
+}
+
+BID_MEDIAN = 120_000     # lognormal bid size parameters
+BID_SIGMA = 0.9
+TURNAROUND_MEDIAN_DAYS = 3.0
+DECISION_MEDIAN_DAYS = 25.0
+
+
+def load_gc_names(path: str = GC_NAMES_CSV) -> List[str]:
+    if not os.path.exists(path):
+        return list(FALLBACK_GCS)
+    with open(path, newline="", encoding="utf-8") as f:
+        names = [(row.get("gc_name") or "").strip() for row in csv.DictReader(f)]
+    return [n for n in names if n] or list(FALLBACK_GCS)
+
+
+def generate_events(scenario: str, n_events: Optional[int] = None, seed: int = 0,
+                    end: Optional[date] = None) -> Iterator[Dict]:
+    """
+    Yield `n_events` events for a scenario (its default size when None),
+    ending at `end` (default today).
+    Output is deterministic for a given (scenario, n_events, seed, end).
+    """
+    profile = SCENARIO_PROFILES[scenario]
+    n_events = profile.default_events if n_events is None else n_events
+    end = end or date.today()
+    rng = random.Random(f"{scenario}:{seed}")
+
+    assignees = ASSIGNEES[:profile.assignees]
+    speed = {a: rng.uniform(0.5, 2.5) for a in assignees}   # turnaround multiplier per person
+    gc_pool = load_gc_names()
+    rng.shuffle(gc_pool)
+    gcs = gc_pool[:profile.gcs]
+    gc_weights = [1 / (i + 1) for i in range(len(gcs))]       # a few GCs send most RFPs
+    end_dt = datetime.combine(end, datetime.min.time()) + timedelta(hours=18)
+    start_dt = end_dt - timedelta(days=profile.history_days)
+
+    emitted = 0
+    project = 0
+    while emitted < n_events:
+        project += 1
+        assignee = rng.choice(assignees)
+        gc = rng.choices(gcs, gc_weights)[0]
+        number = rng.randint(1, 2999)
+        name = f"{number} {rng.choice(STREETS)}"
+        project_id = f"syn-{scenario}-{seed}-{project}"
+        rfp_at = start_dt + timedelta(seconds=rng.uniform(0, profile.history_days * 86400))
+
+        timeline = [("RFP_RECEIVED", rfp_at, None)]
+        if rng.random() < profile.proposal_rate:
+            amount = int(round(rng.lognormvariate(math.log(BID_MEDIAN), BID_SIGMA), -2))
+            proposal_at = rfp_at + timedelta(days=rng.lognormvariate(math.log(TURNAROUND_MEDIAN_DAYS * speed[assignee]), 0.6))
+            timeline.append(("PROPOSAL_SENT", proposal_at, amount))
+            if rng.random() < profile.revision_rate:
+                amount = int(round(amount * rng.uniform(0.85, 1.1), -2))
+                proposal_at += timedelta(days=rng.uniform(2, 14))
+                timeline.append(("PROPOSAL_SENT", proposal_at, amount))
+            if rng.random() < profile.follow_up_rate:
+                timeline.append(("FOLLOW_UP", proposal_at + timedelta(days=rng.uniform(5, 20)), None))
+            outcome = rng.random()
+            decided_at = proposal_at + timedelta(days=rng.lognormvariate(math.log(DECISION_MEDIAN_DAYS), 0.7))
+            if outcome < profile.win_rate:
+                timeline.append(("WON", decided_at, amount))
+            elif outcome < profile.win_rate + profile.loss_rate:
+                timeline.append(("LOST", decided_at, None))
+
+        for event_type, at, amount in timeline:
+            if at > end_dt or emitted >= n_events:
+                break   # the rest of this lifecycle hasn't happened yet
+            emitted += 1
+            event = {
+                "event_id": f"{project_id}-{emitted}",
+                "event_type": event_type,
+                "assignee": assignee,
+                "gc_name": gc,
+                "project_name": name,
+                "project_id": project_id,
+                "scanned_at": at.isoformat(timespec="seconds"),
+                "date": at.isoformat(timespec="seconds"),
+                "summary": f"{EVENT_LABELS[event_type]} - {rng.choice(PROJECT_TYPES)} at {name}",
+            }
+            if amount is not None and rng.random() < profile.priced_rate:
+                event["dollar_amount"] = amount
+            yield event
+
+
+def write_jsonl(path: str, scenario: str, n_events: Optional[int] = None, seed: int = 0,
+                end: Optional[date] = None) -> int:
+    """Stream a generated history to disk; returns the number of events written."""
+    count = 0
+    with open(path, "w") as f:
+        for event in generate_events(scenario, n_events, seed, end):
+            f.write(json.dumps(event) + "\n")
+            count += 1
+    return count
+
+
+def read_jsonl(path: str, limit: Optional[int] = None) -> Iterator[Dict]:
+    with open(path) as f:
+        for i, line in enumerate(f):
+            if limit is not None and i >= limit:
+                return
+            yield json.loads(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic sales events")
+    parser.add_argument("scenario", choices=list(SCENARIO_PROFILES))
+    parser.add_argument("events", type=int)
+    parser.add_argument("output")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    written = write_jsonl(args.output, args.scenario, args.events, args.seed)
+    print(f"Wrote {written} {args.scenario} events to {args.output}")
@@ -3,13 +3,18 @@ Sales Agent Test Harness
 Feeds questions to the Sales Agent and collects responses for scoring.
 """
 
+import argparse
 import asyncio
 import json
 import logging
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from dataclasses import dataclass, asdict
 
+from metrics import LATENCY_SLO_MS
+from stats import distribution
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -27,6 +32,21 @@ class TestResult:
     passed: bool
     feedback: str
 
+@dataclass
+class TimingResult:
+    question_id: str
+    question: str
+    warmup: int
+    repetitions: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    max_ms: float
+    throughput_per_sec: float
+    slo_ms: Optional[float]
+    within_slo: bool
+
 @dataclass
 class EvalRun:
     run_id: str
@@ -109,26 +129,73 @@ QUESTION_VARIANTS = {
 class SalesAgentTester:
     """Tests the Sales Agent responses."""
 
-    def __init__(self, events: List[Dict], gc_metrics: Dict):
+    def __init__(self, events: List[Dict], gc_metrics: Dict,
+                 agent: Optional[Callable[[str], str]] = None):
         self.events = events
         self.gc_metrics = gc_metrics
+        self.agent = agent
         self.results: List[TestResult] = []
+        self.timings: List[TimingResult] = []
+
+    def _ask(self, question: str) -> str:
+        if self.agent is not None:
+            return self.agent(question)
 
-    def call_agent(self, question: str) -> str:
-        """
-        Call the generateSalesResponse function.
-        In production, this would call the actual API.
-        For now, we import and call directly.
-        """
         # Import the response generator
         # This simulates what the frontend does
         from sales_response_generator import generate_sales_response
+        return generate_sales_response(question, self.events, self.gc_metrics, None).get("text", "")
 
-        start = datetime.now()
-        response = generate_sales_response(question, self.events, self.gc_metrics, None)
-        elapsed = (datetime.now() - start).total_seconds() * 1000
+    def call_agent(self, question: str) -> str:
+        """
+        Call the generateSalesResponse function (or the agent callable given
+        to the tester). In production, this would call the actual API.
+        """
+        start = time.perf_counter()
+        response = self._ask(question)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        return response, int(elapsed)
+
+    def time_question(self, question_id: str, question: str, warmup: int = 3,
+                      repetitions: int = 30, slo_ms: Optional[float] = LATENCY_SLO_MS) -> TimingResult:
+        """Warm up, then time `repetitions` calls and report latency percentiles."""
+        for _ in range(warmup):
+            self._ask(question)
+
+        samples = []
+        started = time.perf_counter()
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            self._ask(question)
+            samples.append((time.perf_counter() - start) * 1000)
+        total = time.perf_counter() - started
+
+        samples.sort()
+        dist = distribution(samples, (50, 95, 99))
+        return TimingResult(
+            question_id=question_id,
+            question=question,
+            warmup=warmup,
+            repetitions=repetitions,
+            p50_ms=round(dist["p50"], 3),
+            p95_ms=round(dist["p95"], 3),
+            p99_ms=round(dist["p99"], 3),
+            mean_ms=round(dist["mean"], 3),
+            max_ms=round(samples[-1], 3),
+            throughput_per_sec=round(repetitions / total, 1) if total > 0 else 0.0,
+            slo_ms=slo_ms,
+            within_slo=slo_ms is None or dist["p95"] <= slo_ms,
+        )
 
-        return response.get("text", ""), int(elapsed)
+    def run_timing(self, warmup: int = 3, repetitions: int = 30,
+                   slo_ms: Optional[float] = LATENCY_SLO_MS) -> List[TimingResult]:
+        """Timing mode: latency percentiles and throughput for every test question."""
+        self.timings = [
+            self.time_question(q["id"], q["question"], warmup, repetitions, slo_ms)
+            for q in TEST_QUESTIONS
+        ]
+        return self.timings
 
     def run_single_test(self, question_id: str, question: str, scorer) -> TestResult:
         """Run a single question test."""
@@ -173,13 +240,27 @@ class SalesAgentTester:
         self.results.append(result)
         return result
 
-    def run_full_evaluation(self, scorer) -> EvalRun:
-        """Run all 10 questions and return evaluation results."""
+    def run_full_evaluation(self, scorer, timing: bool = False, warmup: int = 3, repetitions: int = 30,
+                            latency_slo_ms: Optional[float] = LATENCY_SLO_MS) -> EvalRun:
+        """
+        Run all 10 questions and return evaluation results. In timing mode a
+        question also fails when its p95 latency exceeds latency_slo_ms
+        (None reports latency without gating).
+        """
         self.results = []
+        self.timings = []
 
         for q in TEST_QUESTIONS:
             self.run_single_test(q["id"], q["question"], scorer)
 
+        if timing:
+            timings = {t.question_id: t for t in self.run_timing(warmup, repetitions, latency_slo_ms)}
+            for result in self.results:
+                t = timings[result.question_id]
+                if not t.within_slo:
+                    result.passed = False
+                    result.feedback += f"; p95 {t.p95_ms:.1f}ms over {t.slo_ms:g}ms SLO"
+
         # Calculate aggregate metrics
         scores = [r.total_score for r in self.results]
         avg_score = sum(scores) / len(scores) if scores else 0
@@ -202,6 +283,12 @@ class SalesAgentTester:
         """Generate improvement recommendations based on results."""
         recommendations = []
 
+        for timing in self.timings:
+            if not timing.within_slo:
+                recommendations.append(
+                    f"[{timing.question_id}] Too slow: p95 {timing.p95_ms:.1f}ms (SLO {timing.slo_ms:g}ms)"
+                )
+
         for result in self.results:
             if not result.passed:
                 if result.elements_missing:
@@ -241,18 +328,48 @@ def load_test_data() -> tuple:
     return events, gc_metrics
 
 
+def print_timings(timings: List[TimingResult]):
+    print("\n" + "=" * 60)
+    print("LATENCY (ms)")
+    print("=" * 60)
+    print(f"{'Question':<20} {'p50':>8} {'p95':>8} {'p99':>8} {'req/s':>9}  SLO")
+    for t in timings:
+        status = "-" if t.slo_ms is None else ("OK" if t.within_slo else "SLOW")
+        print(f"{t.question_id:<20} {t.p50_ms:>8.2f} {t.p95_ms:>8.2f} {t.p99_ms:>8.2f} {t.throughput_per_sec:>9.1f}  {status}")
+
+
 if __name__ == "__main__":
     from scoring_agent import ScoringAgent
 
+    parser = argparse.ArgumentParser(description="Sales Agent Test Harness")
+    parser.add_argument("--timing", action="store_true",
+                        help="Time each question (warmup + repetitions) and gate on the latency SLO")
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--repetitions", type=int, default=30)
+    parser.add_argument("--slo-ms", type=float, default=LATENCY_SLO_MS,
+                        help="p95 latency SLO in ms (0 disables the gate)")
+    parser.add_argument("--mock-agent", action="store_true",
+                        help="Use eval_runner's Python port of the agent instead of sales_response_generator")
+    args = parser.parse_args()
+
     # Load test data
     events, gc_metrics = load_test_data()
 
+    agent = None
+    if args.mock_agent:
+        from eval_runner import SalesAgentEvaluator
+        evaluator = SalesAgentEvaluator(use_mock=True)
+        evaluator.events, evaluator.gc_metrics = events, gc_metrics
+        agent = evaluator.call_sales_agent
+
     # Initialize tester and scorer
-    tester = SalesAgentTester(events, gc_metrics)
+    tester = SalesAgentTester(events, gc_metrics, agent)
     scorer = ScoringAgent()
 
     # Run evaluation
-    eval_run = tester.run_full_evaluation(scorer)
+    eval_run = tester.run_full_evaluation(scorer, args.timing, args.warmup, args.repetitions, args.slo_ms or None)
+    if tester.timings:
+        print_timings(tester.timings)
 
     # Print results
     print("\n" + "=" * 60)
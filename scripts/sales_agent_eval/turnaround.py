@@ -0,0 +1,168 @@
+"""
+RFP-to-Proposal Turnaround Engine
+Pairs each RFP_RECEIVED with the next PROPOSAL_SENT on the same project and
+keeps per-assignee turnaround distributions. The initial build is one sort
+(O(n log n)); new events only re-pair the project they belong to.
+"""
+
+import json
+from bisect import insort, bisect_left
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from event_frame import DEFAULT_DAY, UNKNOWN
+from stats import distribution
+
+RFP = "RFP_RECEIVED"
+PROPOSAL = "PROPOSAL_SENT"
+
+# (time, seq, event_type, assignee)
+TimelineEntry = Tuple[datetime, int, str, str]
+
+
+def project_key(event: Dict) -> Optional[str]:
+    """Matched project_id when the scanner found one, else the lowercased project name."""
+    if event.get("project_id"):
+        return event["project_id"]
+    name = (event.get("project_name") or "").strip().lower()
+    return name or None
+
+
+def parse_time(value) -> Optional[datetime]:
+    """datetime, ISO string or ISO-prefixed string -> naive UTC datetime; None if unparseable."""
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value))
+        except ValueError:
+            try:
+                parsed = datetime.fromisoformat(str(value)[:10])
+            except ValueError:
+                return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def event_time(event: Dict) -> datetime:
+    """
+    When the email happened: the email `date` carried by the scanner (top-level
+    or inside raw_data), falling back to scanned_at. Returned as naive UTC.
+    A value that does not parse (RFC 2822 headers, '06/02/2025') falls back
+    to scanned_at, then DEFAULT_DAY, like EventFrame does per value.
+    """
+    value = event.get("date")
+    if not value and isinstance(event.get("raw_data"), str):
+        try:
+            value = json.loads(event["raw_data"]).get("date")
+        except (ValueError, AttributeError):
+            value = None
+    for candidate in (value, event.get("scanned_at"), DEFAULT_DAY):
+        if candidate:
+            parsed = parse_time(candidate)
+            if parsed is not None:
+                return parsed
+
+
+def pair_timeline(timeline: List[TimelineEntry]) -> List[Tuple[str, float]]:
+    """
+    (assignee, days) for each RFP answered by a proposal. Repeated RFP emails
+    before a proposal count once, from the first of them.
+    """
+    pairs = []
+    open_rfp: Optional[TimelineEntry] = None
+    for entry in timeline:
+        if entry[2] == RFP:
+            if open_rfp is None:
+                open_rfp = entry
+        elif open_rfp is not None:
+            days = (entry[0] - open_rfp[0]).total_seconds() / 86400
+            assignee = entry[3] if entry[3] != UNKNOWN else open_rfp[3]
+            pairs.append((assignee, days))
+            open_rfp = None
+    return pairs
+
+
+class TurnaroundEngine:
+    """Per-project timelines plus sorted per-assignee turnaround samples."""
+
+    def __init__(self):
+        self._timelines: Dict[str, List[TimelineEntry]] = {}
+        self._pairs: Dict[str, List[Tuple[str, float]]] = {}
+        self._samples: Dict[str, List[float]] = {}
+        self._seq = 0
+
+    @staticmethod
+    def _entry(event: Dict, seq: int) -> Optional[Tuple[str, TimelineEntry]]:
+        event_type = event.get("event_type")
+        if event_type not in (RFP, PROPOSAL):
+            return None
+        key = project_key(event)
+        if key is None:
+            return None
+        return key, (event_time(event), seq, event_type, event.get("assignee") or UNKNOWN)
+
+    @classmethod
+    def from_events(cls, events: Iterable[Dict]) -> "TurnaroundEngine":
+        """Bulk build: sort by (project, time) once and sweep."""
+        engine = cls()
+        entries = []
+        for event in events:
+            entry = engine._entry(event, engine._seq)
+            engine._seq += 1
+            if entry is not None:
+                entries.append(entry)
+        entries.sort(key=lambda e: (e[0], e[1][0], e[1][1]))
+
+        for key, entry in entries:
+            engine._timelines.setdefault(key, []).append(entry)
+
+        samples: Dict[str, List[float]] = {}
+        for key, timeline in engine._timelines.items():
+            pairs = pair_timeline(timeline)
+            if pairs:
+                engine._pairs[key] = pairs
+                for assignee, days in pairs:
+                    samples.setdefault(assignee, []).append(days)
+        engine._samples = {assignee: sorted(values) for assignee, values in samples.items()}
+        return engine
+
+    def add(self, event: Dict):
+        """Insert one event and re-pair only its project."""
+        entry = self._entry(event, self._seq)
+        self._seq += 1
+        if entry is None:
+            return
+        key, item = entry
+        timeline = self._timelines.setdefault(key, [])
+        insort(timeline, item, key=lambda e: e[:2])
+
+        for assignee, days in self._pairs.pop(key, ()):
+            values = self._samples[assignee]
+            del values[bisect_left(values, days)]
+        pairs = pair_timeline(timeline)
+        if pairs:
+            self._pairs[key] = pairs
+            for assignee, days in pairs:
+                insort(self._samples.setdefault(assignee, []), days)
+
+    def add_many(self, events: Iterable[Dict]):
+        for event in events:
+            self.add(event)
+
+    # Queries
+
+    def assignee_stats(self, assignee: str) -> Optional[Dict[str, float]]:
+        """count / mean / p50 / p90 in days, or None without samples."""
+        values = self._samples.get(assignee)
+        if not values:
+            return None
+        return distribution(values, (50, 90))
+
+    def by_assignee(self) -> Dict[str, Dict[str, float]]:
+        return {a: distribution(v, (50, 90)) for a, v in self._samples.items() if v}
+
+    def company_stats(self) -> Optional[Dict[str, float]]:
+        values = sorted(d for v in self._samples.values() for d in v)
+        return distribution(values, (50, 90)) if values else None
@@ -8,9 +8,13 @@ import json
 import uuid
 import logging
 import re
+import time
 from datetime import datetime, timedelta, date
 from typing import Optional, List, Dict
 
+from gc_resolver import get_resolver
+from project_matcher import get_matcher, match_columns
+
 logger = logging.getLogger(__name__)
 
 PROJECT_ID = "master-roofing-intelligence"
@@ -18,6 +22,9 @@ bq_client = bigquery.Client(project=PROJECT_ID)
 
 SALES_USERS = ["fkohn", "bshinde", "csufrin", "tkode", "srosman", "jfogel", "lathuru", "ahirsch"]
 
+SUMMARY_CACHE_TTL = 300  # seconds
+_summary_cache: Dict[int, Dict] = {}
+
 # Keyword patterns for classification
 PATTERNS = {
     "RFP_RECEIVED": [r"invitation to bid", r"request for proposal", r"rfp", r"itb", r"please bid", r"looking for.*quote"],
@@ -59,6 +66,8 @@ async def scan_emails(hours_back: int = 720) -> List[Dict]:
     """Scan emails for sales events."""
     events = []
     since = datetime.utcnow() - timedelta(hours=hours_back)
+    gc_resolver = get_resolver()
+    project_matcher = get_matcher()
 
     for user in SALES_USERS:
         try:
@@ -90,6 +99,8 @@ async def scan_emails(hours_back: int = 720) -> List[Dict]:
                     event["user"] = user
                     event["date"] = str(row.date) if row.date else None
                     event["from_email"] = row.from_email
+                    gc_resolver.enrich(event)
+                    project_matcher.attach(event, f"{row.subject or ''} {(row.body_plain or '')[:1000]}")
                     events.append(event)
 
         except Exception as e:
@@ -116,6 +127,7 @@ async def save_events(events: List[Dict]) -> int:
             "dollar_amount": event.get("dollar_amount"),
             "assignee": event.get("user"),
             "urgency": event.get("urgency", "MEDIUM"),
+            **match_columns(event),
             "raw_data": json.dumps(event)[:2000],
             "scanned_at": datetime.utcnow().isoformat()
         })
@@ -138,6 +150,8 @@ async def run_scan(hours_back: int = 720) -> Dict:
 
     saved = await save_events(events)
     logger.info(f"Saved {saved} events to BigQuery")
+    if saved:
+        _summary_cache.clear()
 
     # Group by type
     by_type = {}
@@ -147,6 +161,87 @@ async def run_scan(hours_back: int = 720) -> Dict:
 
     return {"events_found": saved, "by_type": by_type}
 
+def build_summary(days: int = 365) -> Dict:
+    """
+    Per-assignee / per-GC / per-month / per-type aggregates in one query.
+    GROUPING SETS computes every breakdown in a single scan of daily_events.
+    Events are dated by the UTC day of scanned_at, as the eval's local
+    rollups do; days <= 0 covers the whole history.
+    """
+    query = f'''
+    WITH events AS (
+        SELECT
+            IFNULL(assignee, "Unknown") AS assignee,
+            IFNULL(gc_name, "Unknown") AS gc_name,
+            FORMAT_DATE("%Y-%m", DATE(scanned_at)) AS month,
+            event_type,
+            dollar_amount
+        FROM `{PROJECT_ID}.ko_sales.daily_events`
+        WHERE @days <= 0 OR DATE(scanned_at) >= DATE_SUB(CURRENT_DATE(), INTERVAL @days DAY)
+    )
+    SELECT
+        CASE
+            WHEN GROUPING(assignee) = 0 THEN "assignee"
+            WHEN GROUPING(gc_name) = 0 THEN "gc"
+            WHEN GROUPING(month) = 0 THEN "month"
+            WHEN GROUPING(event_type) = 0 THEN "type"
+            ELSE "total"
+        END AS dimension,
+        COALESCE(assignee, gc_name, month, event_type) AS dim_value,
+        COUNT(*) AS events,
+        COUNTIF(event_type = "RFP_RECEIVED") AS rfps,
+        COUNTIF(event_type = "PROPOSAL_SENT") AS proposals,
+        COUNTIF(event_type = "WON") AS wins,
+        COUNTIF(event_type = "LOST") AS losses,
+        SUM(IF(event_type = "PROPOSAL_SENT", IFNULL(dollar_amount, 0), 0)) AS proposal_value,
+        COUNTIF(event_type = "PROPOSAL_SENT" AND dollar_amount IS NOT NULL) AS priced_proposals,
+        SUM(IF(event_type = "WON", IFNULL(dollar_amount, 0), 0)) AS won_value,
+        COUNTIF(event_type = "WON" AND dollar_amount IS NOT NULL) AS priced_wins
+    FROM events
+    GROUP BY GROUPING SETS ((assignee), (gc_name), (month), (event_type), ())
+    '''
+
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[bigquery.ScalarQueryParameter("days", "INT64", days)]
+    )
+
+    summary = {"days": days, "generated_at": datetime.utcnow().isoformat(),
+               "totals": {}, "by_assignee": {}, "by_gc": {}, "by_month": {}, "by_type": {}}
+    sections = {"assignee": "by_assignee", "gc": "by_gc", "month": "by_month", "type": "by_type"}
+
+    for row in bq_client.query(query, job_config=job_config).result():
+        decided = row.wins + row.losses
+        metrics = {
+            "events": row.events,
+            "rfps": row.rfps,
+            "proposals": row.proposals,
+            "wins": row.wins,
+            "losses": row.losses,
+            "winRate": round(row.wins / decided * 100) if decided else None,
+            "proposalValue": int(row.proposal_value or 0),
+            "avgBid": int(row.proposal_value or 0) // row.priced_proposals if row.priced_proposals else 0,
+            "wonValue": int(row.won_value or 0),
+            "avgWon": int(row.won_value or 0) // row.priced_wins if row.priced_wins else 0,
+        }
+        if row.dimension == "total":
+            summary["totals"] = metrics
+        else:
+            summary[sections[row.dimension]][row.dim_value] = metrics
+
+    summary["by_month"] = dict(sorted(summary["by_month"].items()))
+    return summary
+
+
+def get_summary(days: int = 365, refresh: bool = False) -> Dict:
+    """Cached build_summary; entries expire after SUMMARY_CACHE_TTL or when a scan saves events."""
+    cached = _summary_cache.get(days)
+    if cached and not refresh and time.monotonic() - cached["cached_at"] < SUMMARY_CACHE_TTL:
+        return cached["summary"]
+
+    summary = build_summary(days)
+    _summary_cache[days] = {"cached_at": time.monotonic(), "summary": summary}
+    return summary
+
 # FastAPI router
 from fastapi import APIRouter, BackgroundTasks
 
@@ -171,6 +266,11 @@ async def get_all_events():
     results = [dict(row) for row in bq_client.query(query).result()]
     return {"count": len(results), "events": results}
 
+@router.get("/summary")
+async def get_sales_summary(days: int = 365, refresh: bool = False):
+    """Aggregated sales metrics (per assignee, GC, month, type) instead of raw events; days=0 for all history."""
+    return get_summary(days, refresh)
+
 if __name__ == "__main__":
     import asyncio
     logging.basicConfig(level=logging.INFO)
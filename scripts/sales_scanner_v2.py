@@ -12,6 +12,9 @@ import re
 from datetime import datetime, timedelta, date
 from typing import Optional, List, Dict
 
+from gc_resolver import get_resolver
+from project_matcher import get_matcher, match_columns
+
 logger = logging.getLogger(__name__)
 
 PROJECT_ID = "master-roofing-intelligence"
@@ -19,6 +22,7 @@ bq_client = bigquery.Client(project=PROJECT_ID)
 genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
 gemini = genai.GenerativeModel("gemini-2.0-flash-exp")
 
+
 SALES_USERS = ["fkohn", "bshinde", "csufrin", "tkode", "srosman", "jfogel", "lathuru", "ahirsch"]
 
 CLASSIFY_PROMPT = '''Classify this email for sales relevance. Return ONLY a JSON object, no other text.
@@ -114,6 +118,8 @@ async def scan_emails(hours_back: int = 720) -> List[Dict]:
     """Scan emails for sales events."""
     events = []
     since = datetime.utcnow() - timedelta(hours=hours_back)
+    gc_resolver = get_resolver()
+    project_matcher = get_matcher()
 
     for user in SALES_USERS:
         try:
@@ -148,6 +154,10 @@ async def scan_emails(hours_back: int = 720) -> List[Dict]:
                     event["source_id"] = row.message_id
                     event["user"] = user
                     event["date"] = row.date
+                    event["from_email"] = row.from_email
+                    # An exact sender hit beats the LLM's guess; otherwise keep the guess
+                    gc_resolver.enrich(event)
+                    project_matcher.attach(event, f"{row.subject or ''} {(row.body_plain or '')[:1000]}")
                     events.append(event)
 
         except Exception as e:
@@ -175,6 +185,7 @@ async def save_events(events: List[Dict]) -> int:
             "dollar_amount": event.get("dollar_amount"),
             "assignee": event.get("user"),
             "urgency": event.get("urgency", "MEDIUM"),
+            **match_columns(event),
             "raw_data": json.dumps(event)[:2000],
             "scanned_at": datetime.utcnow().isoformat()
         })
@@ -0,0 +1,486 @@
+"""
+CAO-AUD-001: Session Store
+Where auditor workers claim pending sessions and write audit statuses back.
+
+Claiming is a lease: a worker atomically stamps a slice of pending, unclaimed
+(or lease-expired) sessions with its worker ID and a lease expiry, then
+reads back exactly what it stamped. The expiry doubles as the lease token:
+every later step on the session is fenced on
+    audit_status = 'pending' AND claimed_by = worker AND lease_expires_at = token
+so a worker whose lease ran out (and was re-claimed, or whose session was
+finished by someone else) can neither renew nor complete it.
+
+The auditor renews its leases right before writing scores, events or agent
+status changes, and only writes for the sessions it still holds; complete()
+then applies the statuses, clears the leases and reports any rejected rows.
+Sessions a worker gives up on are released, and sessions it never completes
+become claimable again once the lease expires.
+
+BigQuerySessionStore runs against ko_audit.agent_sessions, which needs two
+extra columns (ensure_schema adds them):
+    claimed_by STRING, lease_expires_at TIMESTAMP
+MemorySessionStore implements the same protocol over a list of dicts for
+tests and local runs.
+"""
+
+import copy
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+LEASE_SECONDS = 300
+
+STATUS_FIELDS = [
+    ("truth_score", "FLOAT64"),
+    ("accuracy_score", "FLOAT64"),
+    ("completeness_score", "FLOAT64"),
+    ("latency_score", "FLOAT64"),
+    ("format_score", "FLOAT64"),
+    ("audit_status", "STRING"),
+    ("escalated", "BOOL"),
+    ("llm_report_id", "STRING"),
+]
+
+# Lease tokens are the lease_expires_at values the store handed out
+LeaseToken = Any
+
+
+class LeaseLost(Exception):
+    """A session's lease is held by another worker (or it is already audited)."""
+
+    def __init__(self, session_id: str):
+        super().__init__(f"Lease lost for session {session_id}")
+        self.session_id = session_id
+
+
+class SessionStore(ABC):
+    """Claim/lease protocol the auditor uses to read and finish sessions."""
+
+    @abstractmethod
+    def claim(self, worker_id: str, limit: int, lease_seconds: float = LEASE_SECONDS,
+              session_ids: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Lease up to `limit` claimable pending sessions (only `session_ids`
+        when given) to a worker, oldest first. Each returned row carries its
+        lease token in lease_expires_at.
+        """
+
+    @abstractmethod
+    def renew(self, worker_id: str, leases: Dict[str, LeaseToken],
+              lease_seconds: float = LEASE_SECONDS) -> Dict[str, LeaseToken]:
+        """
+        Extend the leases a worker still holds (session_id -> token); returns
+        session_id -> new token for those, leaving out every lost lease.
+        """
+
+    @abstractmethod
+    def complete(self, worker_id: str, updates: List[Dict], auditor_id: str) -> List[str]:
+        """
+        Apply audit statuses (session_id, lease_token + STATUS_FIELDS) to
+        sessions still leased under that token and clear their leases;
+        returns the session IDs that were rejected.
+        """
+
+    @abstractmethod
+    def release(self, worker_id: str, session_ids: List[str]):
+        """Give pending sessions claimed by this worker back before their lease expires."""
+
+    @abstractmethod
+    def update_audited(self, updates: List[Dict], auditor_id: str) -> int:
+        """
+        Overwrite the statuses of already audited (non-pending) sessions, for
+        re-scoring; returns how many were applied.
+        """
+
+    @abstractmethod
+    def pending(self, limit: int) -> List[Dict]:
+        """Claimable pending sessions, oldest first, without claiming them."""
+
+    @abstractmethod
+    def get(self, session_id: str) -> Optional[Dict]:
+        """One session row, or None."""
+
+    @abstractmethod
+    def scan(self, start: datetime, end: datetime, limit: int,
+             after: Optional[Tuple[datetime, str]] = None) -> List[Dict]:
+        """
+        Audited (non-pending) sessions with start <= ended_at < end, ordered
+        by (ended_at, session_id) and strictly after the `after` cursor.
+        """
+
+
+class BigQuerySessionStore(SessionStore):
+    """Leases kept in agent_sessions.claimed_by / lease_expires_at."""
+
+    def __init__(self, client, table: str):
+        self.client = client
+        self.table = table
+
+    def _query(self, query: str, params: Optional[List] = None):
+        from google.cloud import bigquery
+
+        job_config = bigquery.QueryJobConfig(query_parameters=params or [])
+        return self.client.query(query, job_config=job_config).result()
+
+    def _dml(self, query: str, params: List) -> int:
+        from google.cloud import bigquery
+
+        job = self.client.query(query, job_config=bigquery.QueryJobConfig(query_parameters=params))
+        job.result()
+        return job.num_dml_affected_rows or 0
+
+    @staticmethod
+    def _status_structs(updates: List[Dict], with_token: bool) -> List:
+        from google.cloud import bigquery
+
+        return [
+            bigquery.StructQueryParameter(
+                None,
+                bigquery.ScalarQueryParameter("session_id", "STRING", update["session_id"]),
+                *([bigquery.ScalarQueryParameter("lease_token", "TIMESTAMP", update["lease_token"])]
+                  if with_token else []),
+                *(bigquery.ScalarQueryParameter(name, kind, update.get(name)) for name, kind in STATUS_FIELDS),
+            )
+            for update in updates
+        ]
+
+    def ensure_schema(self):
+        """Add the lease columns if the table does not have them yet."""
+        self._query(f"""
+        ALTER TABLE `{self.table}`
+            ADD COLUMN IF NOT EXISTS claimed_by STRING,
+            ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP
+        """)
+
+    def claim(self, worker_id: str, limit: int, lease_seconds: float = LEASE_SECONDS,
+              session_ids: Optional[List[str]] = None) -> List[Dict]:
+        from google.cloud import bigquery
+
+        # The expiry is this claim's token: the read-back below only returns
+        # rows stamped by this exact UPDATE
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=lease_seconds)
+        params = [
+            bigquery.ScalarQueryParameter("worker_id", "STRING", worker_id),
+            bigquery.ScalarQueryParameter("expires_at", "TIMESTAMP", expires_at),
+        ]
+        claimable = """
+            audit_status = 'pending'
+            AND ended_at IS NOT NULL
+            AND (lease_expires_at IS NULL OR lease_expires_at < CURRENT_TIMESTAMP())
+        """
+        if session_ids is not None:
+            claimable += " AND session_id IN UNNEST(@session_ids)"
+            params.append(bigquery.ArrayQueryParameter("session_ids", "STRING", session_ids))
+        self._query(f"""
+        UPDATE `{self.table}`
+        SET
+            claimed_by = @worker_id,
+            lease_expires_at = @expires_at
+        WHERE session_id IN (
+            SELECT session_id
+            FROM `{self.table}`
+            WHERE {claimable}
+            ORDER BY ended_at ASC
+            LIMIT {int(limit)}
+        )
+        AND {claimable}
+        """, params)
+
+        results = self._query(f"""
+        SELECT *
+        FROM `{self.table}`
+        WHERE claimed_by = @worker_id
+            AND lease_expires_at = @expires_at
+            AND audit_status = 'pending'
+        ORDER BY ended_at ASC
+        """, params[:2])
+        return [dict(row) for row in results]
+
+    def renew(self, worker_id: str, leases: Dict[str, LeaseToken],
+              lease_seconds: float = LEASE_SECONDS) -> Dict[str, LeaseToken]:
+        from google.cloud import bigquery
+
+        if not leases:
+            return {}
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=lease_seconds)
+        by_token: Dict[LeaseToken, List[str]] = defaultdict(list)
+        for session_id, token in leases.items():
+            by_token[token].append(session_id)
+        worker = bigquery.ScalarQueryParameter("worker_id", "STRING", worker_id)
+        new_token = bigquery.ScalarQueryParameter("expires_at", "TIMESTAMP", expires_at)
+        # Fenced on the old token: a re-claimed lease has a new token and is
+        # left alone, while one that merely expired is still ours to extend
+        for token, session_ids in by_token.items():
+            self._dml(f"""
+            UPDATE `{self.table}`
+            SET lease_expires_at = @expires_at
+            WHERE claimed_by = @worker_id
+                AND lease_expires_at = @token
+                AND audit_status = 'pending'
+                AND session_id IN UNNEST(@session_ids)
+            """, [
+                worker, new_token,
+                bigquery.ScalarQueryParameter("token", "TIMESTAMP", token),
+                bigquery.ArrayQueryParameter("session_ids", "STRING", session_ids),
+            ])
+        held = self._query(f"""
+        SELECT session_id
+        FROM `{self.table}`
+        WHERE claimed_by = @worker_id
+            AND lease_expires_at = @expires_at
+            AND audit_status = 'pending'
+            AND session_id IN UNNEST(@session_ids)
+        """, [worker, new_token, bigquery.ArrayQueryParameter("session_ids", "STRING", list(leases))])
+        return {row["session_id"]: expires_at for row in held}
+
+    def complete(self, worker_id: str, updates: List[Dict], auditor_id: str) -> List[str]:
+        from google.cloud import bigquery
+
+        if not updates:
+            return []
+        # audited_at doubles as this completion's marker for the read-back
+        completed_at = datetime.now(timezone.utc)
+        applied = self._dml(f"""
+        MERGE `{self.table}` AS s
+        USING (SELECT * FROM UNNEST(@updates)) AS u
+        ON s.session_id = u.session_id
+        WHEN MATCHED
+            AND s.audit_status = 'pending'
+            AND s.claimed_by = @worker_id
+            AND s.lease_expires_at = u.lease_token
+        THEN UPDATE SET
+            truth_score = u.truth_score,
+            accuracy_score = u.accuracy_score,
+            completeness_score = u.completeness_score,
+            latency_score = u.latency_score,
+            format_score = u.format_score,
+            audit_status = u.audit_status,
+            audited_at = @completed_at,
+            audited_by = @auditor_id,
+            escalated_to_llm = u.escalated,
+            llm_report_id = u.llm_report_id,
+            claimed_by = NULL,
+            lease_expires_at = NULL,
+            updated_at = CURRENT_TIMESTAMP()
+        """, [
+            bigquery.ArrayQueryParameter("updates", "STRUCT", self._status_structs(updates, with_token=True)),
+            bigquery.ScalarQueryParameter("worker_id", "STRING", worker_id),
+            bigquery.ScalarQueryParameter("auditor_id", "STRING", auditor_id),
+            bigquery.ScalarQueryParameter("completed_at", "TIMESTAMP", completed_at),
+        ])
+        session_ids = [update["session_id"] for update in updates]
+        if applied >= len(updates):
+            return []
+        done = {row["session_id"] for row in self._query(f"""
+        SELECT session_id
+        FROM `{self.table}`
+        WHERE session_id IN UNNEST(@session_ids)
+            AND audited_at = @completed_at
+            AND audited_by = @auditor_id
+        """, [
+            bigquery.ArrayQueryParameter("session_ids", "STRING", session_ids),
+            bigquery.ScalarQueryParameter("completed_at", "TIMESTAMP", completed_at),
+            bigquery.ScalarQueryParameter("auditor_id", "STRING", auditor_id),
+        ])}
+        return [session_id for session_id in session_ids if session_id not in done]
+
+    def release(self, worker_id: str, session_ids: List[str]):
+        from google.cloud import bigquery
+
+        if not session_ids:
+            return
+        self._query(f"""
+        UPDATE `{self.table}`
+        SET claimed_by = NULL, lease_expires_at = NULL
+        WHERE claimed_by = @worker_id
+            AND audit_status = 'pending'
+            AND session_id IN UNNEST(@session_ids)
+        """, [
+            bigquery.ScalarQueryParameter("worker_id", "STRING", worker_id),
+            bigquery.ArrayQueryParameter("session_ids", "STRING", session_ids),
+        ])
+
+    def update_audited(self, updates: List[Dict], auditor_id: str) -> int:
+        from google.cloud import bigquery
+
+        if not updates:
+            return 0
+        return self._dml(f"""
+        MERGE `{self.table}` AS s
+        USING (SELECT * FROM UNNEST(@updates)) AS u
+        ON s.session_id = u.session_id
+        WHEN MATCHED AND s.audit_status != 'pending' THEN UPDATE SET
+            truth_score = u.truth_score,
+            accuracy_score = u.accuracy_score,
+            completeness_score = u.completeness_score,
+            latency_score = u.latency_score,
+            format_score = u.format_score,
+            audit_status = u.audit_status,
+            audited_at = CURRENT_TIMESTAMP(),
+            audited_by = @auditor_id,
+            escalated_to_llm = u.escalated,
+            llm_report_id = u.llm_report_id,
+            updated_at = CURRENT_TIMESTAMP()
+        """, [
+            bigquery.ArrayQueryParameter("updates", "STRUCT", self._status_structs(updates, with_token=False)),
+            bigquery.ScalarQueryParameter("auditor_id", "STRING", auditor_id),
+        ])
+
+    def pending(self, limit: int) -> List[Dict]:
+        results = self._query(f"""
+        SELECT *
+        FROM `{self.table}`
+        WHERE audit_status = 'pending'
+            AND ended_at IS NOT NULL
+            AND (lease_expires_at IS NULL OR lease_expires_at < CURRENT_TIMESTAMP())
+        ORDER BY ended_at ASC
+        LIMIT {int(limit)}
+        """)
+        return [dict(row) for row in results]
+
+    def get(self, session_id: str) -> Optional[Dict]:
+        from google.cloud import bigquery
+
+        rows = list(self._query(f"""
+        SELECT *
+        FROM `{self.table}`
+        WHERE session_id = @session_id
+        """, [bigquery.ScalarQueryParameter("session_id", "STRING", session_id)]))
+        return dict(rows[0]) if rows else None
+
+    def scan(self, start: datetime, end: datetime, limit: int,
+             after: Optional[Tuple[datetime, str]] = None) -> List[Dict]:
+        from google.cloud import bigquery
+
+        after_ts, after_id = after or (None, "")
+        results = self._query(f"""
+        SELECT *
+        FROM `{self.table}`
+        WHERE ended_at >= @start
+            AND ended_at < @end
+            AND audit_status != 'pending'
+            AND (@after_ts IS NULL OR ended_at > @after_ts
+                 OR (ended_at = @after_ts AND session_id > @after_id))
+        ORDER BY ended_at ASC, session_id ASC
+        LIMIT {int(limit)}
+        """, [
+            bigquery.ScalarQueryParameter("start", "TIMESTAMP", start),
+            bigquery.ScalarQueryParameter("end", "TIMESTAMP", end),
+            bigquery.ScalarQueryParameter("after_ts", "TIMESTAMP", after_ts),
+            bigquery.ScalarQueryParameter("after_id", "STRING", after_id),
+        ])
+        return [dict(row) for row in results]
+
+
+class MemorySessionStore(SessionStore):
+    """
+    In-process stand-in with the same lease semantics, shared safely between
+    threads (and so between several auditors in one process).
+    """
+
+    def __init__(self, sessions: List[Dict], clock: Callable[[], float] = time.time):
+        self.clock = clock
+        self.rows: Dict[str, Dict] = {}
+        for session in sessions:
+            row = {"audit_status": "pending", "claimed_by": None, "lease_expires_at": None, **session}
+            self.rows[row["session_id"]] = row
+        self._lock = threading.Lock()
+
+    def _claimable(self, row: Dict, now: float) -> bool:
+        return (
+            row["audit_status"] == "pending"
+            and row.get("ended_at") is not None
+            and (row["lease_expires_at"] is None or row["lease_expires_at"] < now)
+        )
+
+    def _held(self, row: Optional[Dict], worker_id: str, token: LeaseToken) -> bool:
+        return (
+            row is not None
+            and row["audit_status"] == "pending"
+            and row["claimed_by"] == worker_id
+            and row["lease_expires_at"] == token
+        )
+
+    def _oldest_claimable(self, limit: int, now: float, session_ids: Optional[List[str]] = None) -> List[Dict]:
+        rows = self.rows.values() if session_ids is None else filter(None, map(self.rows.get, session_ids))
+        rows = sorted((row for row in rows if self._claimable(row, now)), key=lambda row: row["ended_at"])
+        return rows[:limit]
+
+    def claim(self, worker_id: str, limit: int, lease_seconds: float = LEASE_SECONDS,
+              session_ids: Optional[List[str]] = None) -> List[Dict]:
+        with self._lock:
+            now = self.clock()
+            claimed = self._oldest_claimable(limit, now, session_ids)
+            for row in claimed:
+                row["claimed_by"] = worker_id
+                row["lease_expires_at"] = now + lease_seconds
+            return [copy.deepcopy(row) for row in claimed]
+
+    def renew(self, worker_id: str, leases: Dict[str, LeaseToken],
+              lease_seconds: float = LEASE_SECONDS) -> Dict[str, LeaseToken]:
+        held = {}
+        with self._lock:
+            expires_at = self.clock() + lease_seconds
+            for session_id, token in leases.items():
+                row = self.rows.get(session_id)
+                if self._held(row, worker_id, token):
+                    row["lease_expires_at"] = held[session_id] = expires_at
+        return held
+
+    def complete(self, worker_id: str, updates: List[Dict], auditor_id: str) -> List[str]:
+        rejected = []
+        with self._lock:
+            for update in updates:
+                row = self.rows.get(update["session_id"])
+                if not self._held(row, worker_id, update["lease_token"]):
+                    rejected.append(update["session_id"])
+                    continue
+                self._apply(row, update, auditor_id)
+                row.update(claimed_by=None, lease_expires_at=None)
+        return rejected
+
+    def _apply(self, row: Dict, update: Dict, auditor_id: str):
+        row.update({name: update.get(name) for name, _ in STATUS_FIELDS})
+        row["escalated_to_llm"] = row.pop("escalated")
+        row.update(audited_by=auditor_id, audited_at=self.clock())
+
+    def release(self, worker_id: str, session_ids: List[str]):
+        with self._lock:
+            for session_id in session_ids:
+                row = self.rows.get(session_id)
+                if row is not None and row["audit_status"] == "pending" and row["claimed_by"] == worker_id:
+                    row["claimed_by"] = row["lease_expires_at"] = None
+
+    def update_audited(self, updates: List[Dict], auditor_id: str) -> int:
+        applied = 0
+        with self._lock:
+            for update in updates:
+                row = self.rows.get(update["session_id"])
+                if row is not None and row["audit_status"] != "pending":
+                    self._apply(row, update, auditor_id)
+                    applied += 1
+        return applied
+
+    def pending(self, limit: int) -> List[Dict]:
+        with self._lock:
+            return [copy.deepcopy(row) for row in self._oldest_claimable(limit, self.clock())]
+
+    def get(self, session_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self.rows.get(session_id)
+            return copy.deepcopy(row) if row is not None else None
+
+    def scan(self, start: datetime, end: datetime, limit: int,
+             after: Optional[Tuple[datetime, str]] = None) -> List[Dict]:
+        with self._lock:
+            rows = [
+                row for row in self.rows.values()
+                if row["audit_status"] != "pending"
+                and row.get("ended_at") is not None and start <= row["ended_at"] < end
+                and (after is None or (row["ended_at"], row["session_id"]) > after)
+            ]
+            rows.sort(key=lambda row: (row["ended_at"], row["session_id"]))
+            return [copy.deepcopy(row) for row in rows[:limit]]